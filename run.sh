@@ -1,7 +1,7 @@
 #!/bin/sh
 
 # Check if temp and database directory exists, create if not.
-directories=("temp" "database")
+directories=("temp" "database" "landing")
 for directory in "${directories[@]}"; do
     if [ ! -d "$directory" ]; then
         echo "The directory $directory does not exist. Creating..."
@@ -27,6 +27,10 @@ fi
 SCOPE=""
 SUB_SCOPE=""
 SKIP=""
+REPLAY=""
+STREAMING=""
+RESUME=""
+MAX_PARALLEL=""
 
 
 # Parse CLI arguments
@@ -34,6 +38,10 @@ while [[ "$#" -gt 0 ]]; do
     case $1 in
         --sub-scope) SUB_SCOPE="$2"; shift ;;
         --skip) SKIP="$2"; shift ;;
+        --replay) REPLAY="--replay" ;;
+        --streaming) STREAMING="--streaming" ;;
+        --resume) RESUME="--resume" ;;
+        --max-parallel) MAX_PARALLEL="$2"; shift ;;
         *) SCOPE="$1" ;;  # Any unnamed argument is treated as SCOPE (mandatory)
     esac
     shift
@@ -50,9 +58,10 @@ docker build -f Dockerfile -t $TAG .
 docker run \
  --volume="./database/":/database \
  --volume="./temp/":/temp \
+ --volume="./landing/":/landing \
  --env-file secrets.env \
  $NETWORK_OPTION \
-   $TAG python3 -m src.run "$SCOPE" ${SUB_SCOPE:+--sub-scope "$SUB_SCOPE"} ${SKIP:+--skip "$SKIP"}
+   $TAG python3 -m src.run "$SCOPE" ${SUB_SCOPE:+--sub-scope "$SUB_SCOPE"} ${SKIP:+--skip "$SKIP"} ${MAX_PARALLEL:+--max-parallel "$MAX_PARALLEL"} $REPLAY $STREAMING $RESUME
 
 
  
\ No newline at end of file
@@ -1,10 +1,15 @@
 # Standard library
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator
 
 
 class Client(ABC):
     """Abstract class used to create clients."""
 
+    # Clients supporting copy_from bulk load
+    supports_bulk_copy = False
+
     @abstractmethod
     def connect(self):
         """Connect to db."""
@@ -19,3 +24,16 @@ class Client(ABC):
     def executemany(self, query: str, mapped_values: list[tuple]):
         """Execute parameterized query."""
         pass
+
+    def copy_from(self, table_name: str, columns: tuple, file_path: str):  # pragma: no cover
+        """Bulk load csv file (with header) into table columns."""
+        raise NotImplementedError(f"{type(self).__name__} does not support bulk copy.")
+
+    def close(self):  # pragma: no cover
+        """Close the connection to db. Default: kept open, shared by all pipelines."""
+        pass
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:  # pragma: no cover
+        """Run statements of the block in one transaction. Default: autocommit each one."""
+        yield
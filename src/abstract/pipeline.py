@@ -1,11 +1,16 @@
 # Standard library
+import threading
 from abc import ABC, abstractmethod
+from contextlib import closing
 from typing import List
 
 # Local
+from .step import Step
 from ..factories.step_factory import StepFactory
 from ..settings import Settings
+from ..utils.batch_stream import BatchStream
 from ..utils.get_logger import get_logger
+from ..utils.run_journal import RunJournal
 
 
 class Pipeline(ABC):
@@ -26,19 +31,59 @@ class Pipeline(ABC):
         """Summary: Executes step if it wasn't run before."""
 
         self.logger.info(f"Starting Pipeline: {self.name}")
-        pipeline_steps = self.build_steps()
-        output = None
-
-        for step in pipeline_steps:
-            self.logger.info(f"Starting {step=}")
-            self.settings.step_name = step
-            steps = StepFactory(self.settings)
-            is_success, output = steps.create(step, output, **self.kwargs).run()
-            self.logger.debug(f"{output=}")
-            self.logger.info(f"Finished {step=} {is_success=}")
-            if output.get("skip_pipeline"):
-                self.logger.info(f"Step {step} marked pipeline to skip.")
-                break
+        with closing(RunJournal(self.settings)) as journal:
+            journal.start()
+            pipeline_steps = self.build_steps()
+            output = {}
+
+            for n, step in enumerate(pipeline_steps, start=1):
+                # Checkers look for missing data, replay rebuilds all data from the landing zone
+                if self.settings.replay and step.startswith("check-"):
+                    self.logger.info(f"Replay mode. Skipping {step=}")
+                    continue
+                self.logger.info(f"Starting {step=}")
+                self.settings.step_name = step
+                steps = StepFactory(self.settings)
+                step_instance = steps.create(step, output, **self.kwargs)
+                # Replay rebuilds whole tables, so it always runs in batch mode
+                if (
+                    self.settings.streaming
+                    and not self.settings.replay
+                    and step_instance.supports_streaming
+                ):
+                    self.run_stream(step_instance, pipeline_steps[n:])
+                    break
+                is_success, output = step_instance.run()
+                self.logger.debug(f"{output=}")
+                self.logger.info(f"Finished {step=} {is_success=}")
+                if output.get("skip_pipeline"):
+                    self.logger.info(f"Step {step} marked pipeline to skip.")
+                    break
+            journal.finish()
 
         self.logger.info(f"Finished Pipeline: {self.name}")
         return True
+
+    def run_stream(self, step_instance: Step, following_steps: List[str]):
+        """Run following_steps for each batch yielded by step_instance, concurrently."""
+
+        # One factory (and client) by step thread, SQLite connections can not be shared across
+        # threads
+        thread_factory = threading.local()
+
+        def run_step(step: str, previous_output: dict) -> dict:
+            if not hasattr(thread_factory, "steps"):
+                thread_factory.steps = StepFactory(self.settings)
+            step_instance = thread_factory.steps.create(step, previous_output, **self.kwargs)
+            step_instance.logger = step_instance.logger.bind(step=step)
+            _, output = step_instance.run()
+            return output
+
+        def close_step(step: str):
+            if hasattr(thread_factory, "steps"):
+                thread_factory.steps.client.close()
+
+        batch_stream = BatchStream(
+            self.settings, following_steps, self.settings.STREAMING["MAX_QUEUED_BATCHES"]
+        )
+        batch_stream.run(step_instance.stream(), run_step, close_step)
@@ -1,5 +1,6 @@
 # Standard library
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 # Local
 from ..settings import Settings
@@ -9,6 +10,9 @@ from ..utils.get_logger import get_logger
 class Step(ABC):
     """Abstract class used to run steps of pipeline."""
 
+    # Steps yielding micro-batches with stream
+    supports_streaming = False
+
     def __init__(self, name: str, previous_output: dict, settings: Settings):
         self.settings = settings
         self.previous_output = previous_output
@@ -20,3 +24,7 @@ class Step(ABC):
     def run(self):
         """Run the step."""
         pass
+
+    def stream(self) -> Iterator[dict]:  # pragma: no cover
+        """Yield one output by batch, the previous_output of the following steps."""
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming.")
@@ -0,0 +1,78 @@
+# Standard library
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+# Third party
+import duckdb
+
+# Local
+from ..abstract.client import Client
+from ..settings import Settings
+from ..utils.constants import PIPELINES
+from ..utils.decorators import singleton
+from ..utils.get_logger import get_logger
+
+
+@singleton
+class DuckDBClient(Client):
+    """DuckDB Client.
+    Columnar single file database, tables are bulk loaded with COPY.
+    """
+
+    supports_bulk_copy = True
+
+    def __init__(self, settings: Settings):
+        """Setup settings and connect with DB."""
+
+        self.logger = get_logger(__name__, settings)
+        self.settings = settings
+        self.DB_PATH = settings.CLIENT_CONFIG["DB_PATH"]
+        # The connection is shared by pipelines running in parallel
+        # Reentrant, transactions hold it until commit
+        self._lock = threading.RLock()
+        self.connect()
+        for schema in PIPELINES.schemas:
+            self._create_schema(schema)
+
+    def connect(self):
+        """Connect to db. Creates db file if not exist."""
+        self.conn = duckdb.connect(self.DB_PATH)
+        self.logger.info("conected")
+
+    def execute(self, query: str) -> list[tuple]:
+        """Execute query."""
+
+        with self._lock:
+            return self.conn.execute(query).fetchall()
+
+    def executemany(self, query: str, mapped_values: list[tuple]):
+        """Execute parameterized query."""
+        with self._lock:
+            self.conn.executemany(query, mapped_values)
+
+    def copy_from(self, table_name: str, columns: tuple, file_path: str):
+        """Bulk load csv file (with header) into table columns with COPY."""
+
+        query = f"COPY {table_name} ({', '.join(columns)}) FROM '{file_path}' (HEADER)"
+        with self._lock:
+            self.conn.execute(query)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run statements of the block in one transaction, rolled back on errors."""
+
+        with self._lock:
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                yield
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _create_schema(self, schema_name: str):
+        """Create schema."""
+
+        self.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+        self.logger.info(f"Schema {schema_name} ready")
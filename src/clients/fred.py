@@ -1,16 +1,20 @@
 # Standard library
+import asyncio
 import os
-from time import sleep
-
-# Third party
-import requests
+from typing import Iterable, Iterator, Optional
 
 # Local
-from ..exceptions import MaxRetriesExceededError, MissingAPIKeyError
+from .http_client import HTTPClient
+from ..exceptions import MissingAPIKeyError
 from ..settings import Settings
+from ..utils.decorators import singleton
 from ..utils.get_logger import get_logger
+from ..utils.landing_zone import LandingZone
+from ..utils.rate_limiter import RateLimiter
+from ..utils.response_cache import ResponseCache
 
 
+@singleton
 class Fred:
     """Handle requests to FRED API.
     Hosted by the Economic Research Division of the Federal Reserve Bank of St. Louis
@@ -28,24 +32,62 @@ class Fred:
             raise MissingAPIKeyError(
                 "FRED_KEY", "https://fred.stlouisfed.org/docs/api/api_key.html"
             )
-        self.api_key_url = f"&api_key={api_key}&file_type=json"
+        self.api_key_params = {"api_key": api_key, "file_type": "json"}
         self.base_url = settings.FRED["BASE_URL"]
         self.endpoints = settings.FRED["ENDPOINTS"]
+        self.http_client = HTTPClient(settings)
+        # Shared by every thread, so the API limit holds for concurrent requests
+        self.rate_limiter = RateLimiter(settings.FRED["CALLS_PER_MIN"], settings.FRED["BURST"])
+        self.max_workers: int = settings.FRED["MAX_WORKERS"]
+        self.response_cache = ResponseCache(settings)
+        self.landing_zone = LandingZone(settings)
+        # {endpoint name: seconds}. None never expires, missing endpoints are not cached.
+        self.cache_ttl: dict = settings.FRED["CACHE_TTL"]
+
+    def get_endpoint(self, url: str) -> Optional[str]:
+        """Return the endpoint name (settings.FRED["ENDPOINTS"] key) for url."""
+
+        for name, path in self.endpoints.items():
+            if path.split("?")[0] in url:
+                return name
+        return None
 
     def request(self, url: str) -> dict:
         """Return the FRED request response.
+        Handle API Limit and response cache.
 
         url -- request endpoint without API key
         """
 
-        url_with_key = url + f"{self.api_key_url}"
-        resp = requests.get(url_with_key)
-        # We need to make sure that request is successful
-        tries = 0
-        while resp.status_code != 200:  # pragma: no cover
-            if tries == 3:
-                raise MaxRetriesExceededError(url, 3)
-            tries += 1
-            sleep(5)
-            resp = requests.get(url_with_key)
-        return resp.json()
+        return self.http_client.run(self.arequest(url))
+
+    async def arequest(self, url: str) -> dict:
+        """Async version of request."""
+
+        endpoint = self.get_endpoint(url)
+        is_cached_endpoint = endpoint in self.cache_ttl
+        if is_cached_endpoint:
+            cached_resp = await asyncio.to_thread(
+                self.response_cache.get, url, self.cache_ttl[endpoint]
+            )
+            if cached_resp is not None:
+                return cached_resp
+
+        resp = await self.http_client.aget(
+            url, params=self.api_key_params, rate_limiter=self.rate_limiter, endpoint=endpoint
+        )
+        if endpoint:
+            await asyncio.to_thread(self.landing_zone.write, "fred", endpoint, url, resp)
+        if is_cached_endpoint:
+            await asyncio.to_thread(self.response_cache.set, url, resp)
+        return resp
+
+    def request_many(self, urls: Iterable[str]) -> Iterator[dict]:
+        """Request urls concurrently, up to MAX_WORKERS requests in flight.
+        Yield responses in the same order as urls.
+
+        urls -- request endpoints without API key
+        """
+
+        coroutines = (self.arequest(url) for url in urls)
+        return self.http_client.gather(coroutines, max_in_flight=self.max_workers)
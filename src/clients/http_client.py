@@ -0,0 +1,128 @@
+# Standard library
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+# Third party
+import requests
+from requests.adapters import HTTPAdapter
+
+# Local
+from ..exceptions import MaxRetriesExceededError
+from ..settings import Settings
+from ..utils.decorators import singleton
+from ..utils.get_logger import get_logger
+from ..utils.rate_limiter import RateLimiter
+
+
+@singleton
+class HTTPClient:
+    """Asyncio HTTP layer shared by the API clients.
+
+    Keeps one pooled keep-alive session per host. Requests are coroutines, so network
+    waits overlap. run, get, get_many and gather are the synchronous facade, they run the
+    coroutines in a background event loop.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize settings and event loop."""
+
+        self.logger = get_logger(__name__, settings)
+        self.max_connections: int = settings.HTTP["MAX_CONNECTIONS"]
+        self.max_retries: int = settings.HTTP["MAX_RETRIES"]
+        self.retry_wait: float = settings.HTTP["RETRY_WAIT"]
+        self.sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+        # Blocking socket I/O runs in the loop executor, one thread per connection
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(ThreadPoolExecutor(max_workers=self.max_connections))
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def get_session(self, url: str) -> requests.Session:
+        """Return the keep-alive session for the url host."""
+
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self.sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self.sessions[host] = session
+        return self.sessions[host]
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        endpoint: Optional[str] = None,
+    ) -> dict:
+        """Return the json response of a GET request.
+        Retry failed requests, each try is subject to the rate limit.
+
+        url -- request url, without credentials.
+        params -- query parameters, e.g. API key.
+        rate_limiter -- rate limiter of the API.
+        endpoint -- endpoint name, used for endpoint rate limits.
+        """
+
+        session = self.get_session(url)
+        for tries in range(self.max_retries + 1):
+            if rate_limiter:
+                sleep_time = rate_limiter.reserve(endpoint)
+                if sleep_time:
+                    self.logger.debug(f"{sleep_time=:.2f}")
+                    await asyncio.sleep(sleep_time)
+            resp = await asyncio.to_thread(session.get, url, params=params, headers=headers)
+            if resp.status_code == 200:
+                return resp.json()
+            self.logger.info(
+                f"Request {tries + 1}/{self.max_retries + 1} to {url} failed. "
+                f"{resp.status_code=}. Waiting {self.retry_wait} sec. and trying again."
+            )
+            await asyncio.sleep(self.retry_wait)
+
+        raise MaxRetriesExceededError(url, self.max_retries)
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """Synchronous facade: run coroutine and return its result."""
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def get(self, url: str, **kwargs: Any) -> dict:
+        """Synchronous facade for aget."""
+
+        return self.run(self.aget(url, **kwargs))
+
+    def gather(
+        self, coroutines: Iterable[Coroutine], max_in_flight: Optional[int] = None
+    ) -> Iterator:
+        """Synchronous facade to run many requests concurrently.
+        Yield results in the same order as coroutines.
+
+        max_in_flight -- max concurrent requests. Default: MAX_CONNECTIONS.
+        """
+
+        max_in_flight = max_in_flight or self.max_connections
+        pending: deque = deque()
+        for coroutine in coroutines:
+            pending.append(asyncio.run_coroutine_threadsafe(coroutine, self.loop))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def get_many(
+        self, urls: Iterable[str], max_in_flight: Optional[int] = None, **kwargs: Any
+    ) -> Iterator[dict]:
+        """Synchronous facade to request many urls concurrently.
+        Yield responses in the same order as urls.
+        """
+
+        return self.gather((self.aget(url, **kwargs) for url in urls), max_in_flight)
@@ -1,15 +1,17 @@
 # Standard library
+import asyncio
 import os
-from time import perf_counter, sleep
-
-# Third party
-import requests
+from typing import Iterable, Iterator, Optional
 
 # Local
-from ..exceptions import MaxRetriesExceededError, MissingAPIKeyError
+from .http_client import HTTPClient
+from ..exceptions import MissingAPIKeyError
 from ..settings import Settings
 from ..utils.decorators import singleton
 from ..utils.get_logger import get_logger
+from ..utils.landing_zone import LandingZone
+from ..utils.rate_limiter import RateLimiter
+from ..utils.response_cache import ResponseCache
 
 
 @singleton
@@ -29,45 +31,84 @@ class Polygon:
             raise MissingAPIKeyError(
                 "POLYGON_KEY", "https://polygon.io/dashboard/signup?redirect=%2Fdashboard%3F"
             )
-        self.api_key_url = f"&apiKey={api_key}"
+        self.api_key_params = {"apiKey": api_key}
+        self.http_client = HTTPClient(settings)
 
         self.api_calls_per_min: int = settings.POLYGON["POLYGON_CALLS_PER_MIN"]
-        self.api_sleep_time = 60 / self.api_calls_per_min
-        self.last_request = 0  # Placeholder
+        # Shared by every thread, so the API limit holds for concurrent requests
+        self.rate_limiter = RateLimiter(
+            self.api_calls_per_min,
+            settings.POLYGON["POLYGON_BURST"],
+            settings.POLYGON["ENDPOINT_LIMITS"],
+        )
+        self.max_workers: int = settings.POLYGON["MAX_WORKERS"]
+        self.response_cache = ResponseCache(settings)
+        self.landing_zone = LandingZone(settings)
+        # {endpoint name: seconds}. None never expires, missing endpoints are not cached.
+        self.cache_ttl: dict = settings.POLYGON["CACHE_TTL"]
+        # {endpoint path: endpoint name}
+        self.endpoints = {
+            path.split("?")[0]: name for name, path in settings.POLYGON["ENDPOINTS"].items()
+        }
+
+    def get_endpoint(self, url: str) -> Optional[str]:
+        """Return the endpoint name (settings.POLYGON["ENDPOINTS"] key) for url."""
+
+        for path, name in self.endpoints.items():
+            if path in url:
+                return name
+        return None
 
-    def request(self, url: str) -> dict:
+    def request(self, url: str, ignore_ttl: bool = False) -> dict:
         """Return the Polygon request response.
-        Handle API Limit
+        Handle API Limit and response cache.
 
         url -- request endpoint without API key
+        ignore_ttl -- use cached responses whatever their age, e.g. completed in a resumed run.
         """
 
-        url_with_key = url + f"{self.api_key_url}"
-        self.check_api_limit()
-        resp = requests.get(url_with_key)
-        # We need to make sure that request is successful
-        tries = 0
-        while resp.status_code != 200:  # pragma: no cover
-            tries += 1
-            self.logger.info(f"Request {tries} failed: {resp.status_code=}, {resp.json()} ")
-            if tries > 3:
-                raise MaxRetriesExceededError(url, 3)
-            tries += 1
-            sleep(5)
-            resp = requests.get(url_with_key)
-        return resp.json()
-
-    def check_api_limit(self):
-        """Check API rate limit.
-        If reached, sleep enough before the next request.
+        return self.http_client.run(self.arequest(url, ignore_ttl))
+
+    async def arequest(self, url: str, ignore_ttl: bool = False) -> dict:
+        """Async version of request."""
+
+        endpoint = self.get_endpoint(url)
+        is_cached_endpoint = endpoint in self.cache_ttl
+        if is_cached_endpoint:
+            ttl = None if ignore_ttl else self.cache_ttl[endpoint]
+            cached_resp = await asyncio.to_thread(self.response_cache.get, url, ttl)
+            if cached_resp is not None:
+                return cached_resp
+
+        resp = await self.http_client.aget(url, **self._request_kwargs(url))
+        if endpoint:
+            await asyncio.to_thread(self.landing_zone.write, "polygon", endpoint, url, resp)
+        # Only complete responses are cached, e.g. not DELAYED. Empty responses are not cached
+        # without TTL, e.g. a day requested before its bars are published is requested again
+        if (
+            is_cached_endpoint
+            and resp.get("status") == "OK"
+            and (resp.get("results") or self.cache_ttl[endpoint] is not None)
+        ):
+            await asyncio.to_thread(self.response_cache.set, url, resp)
+        return resp
+
+    def request_many(self, urls: Iterable[str], ignore_ttl: bool = False) -> Iterator[dict]:
+        """Request urls concurrently, up to MAX_WORKERS requests in flight.
+        Yield responses in the same order as urls.
+
+        urls -- request endpoints without API key
+        ignore_ttl -- use cached responses whatever their age, e.g. completed in a resumed run.
         """
 
-        now = perf_counter()
-        if now - self.last_request < self.api_sleep_time:
-            sleep_time = self.api_sleep_time - (now - self.last_request)
-            self.logger.debug(f"{sleep_time=:.2f}")
-            sleep(sleep_time)
-            # Update last request time
-            self.last_request = perf_counter()
-        else:
-            self.last_request = perf_counter()
+        coroutines = (self.arequest(url, ignore_ttl) for url in urls)
+        return self.http_client.gather(coroutines, max_in_flight=self.max_workers)
+
+    def _request_kwargs(self, url: str) -> dict:
+        """Return HTTPClient request arguments: API key and rate limit."""
+
+        return {
+            "params": self.api_key_params,
+            "rate_limiter": self.rate_limiter,
+            "endpoint": self.get_endpoint(url),
+        }
@@ -1,3 +1,8 @@
+# Standard library
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
 # Third party
 import psycopg2
 
@@ -13,6 +18,8 @@ from ..utils.get_logger import get_logger
 class PostgresClient(Client):
     """Postgres Client."""
 
+    supports_bulk_copy = True
+
     def __init__(self, settings: Settings):
         """Connect with DB."""
 
@@ -24,6 +31,10 @@ class PostgresClient(Client):
         host = config["POSTGRES_HOST"]
         db = config["POSTGRES_DB"]
         self.conn_string = f"host={host} dbname={db} user={uid} password={pwd}"
+        # The connection is shared by pipelines running in parallel
+        # Reentrant, transactions hold it until commit
+        self._lock = threading.RLock()
+        self._in_transaction = False
         self.connect()
         for schema in PIPELINES.schemas:
             self._create_schema(schema)
@@ -37,19 +48,52 @@ class PostgresClient(Client):
     def execute(self, query: str) -> list[tuple]:
         """Execute query."""
 
-        self.cur.execute(query)
-        self.conn.commit()
-        if self.cur.rowcount > 0:
-            resp = self.cur.fetchall()
-        else:
-            resp = []
+        with self._lock:
+            self.cur.execute(query)
+            self._commit()
+            # Statements without result rows (e.g. INSERT) have no description
+            if self.cur.description is not None and self.cur.rowcount > 0:
+                resp = self.cur.fetchall()
+            else:
+                resp = []
 
         return resp
 
     def executemany(self, query: str, mapped_values: list[tuple]):
         """Execute parameterized query."""
-        self.cur.executemany(query, mapped_values)
-        self.conn.commit()
+        with self._lock:
+            self.cur.executemany(query, mapped_values)
+            self._commit()
+
+    def copy_from(self, table_name: str, columns: tuple, file_path: str):
+        """Bulk load csv file (with header) into table columns with COPY FROM STDIN."""
+
+        query = (
+            f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, HEADER true)"
+        )
+        with self._lock, open(file_path, "r", newline="") as f:
+            self.cur.copy_expert(query, f)
+            self._commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run statements of the block in one transaction, rolled back on errors."""
+
+        with self._lock:
+            self._in_transaction = True
+            try:
+                yield
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+            finally:
+                self._in_transaction = False
+
+    def _commit(self):
+        """Commit, unless running in a transaction."""
+        if not self._in_transaction:
+            self.conn.commit()
 
     def _schema_exist(self, schema_name: str) -> bool:
         """Check if schemas exists."""
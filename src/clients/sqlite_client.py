@@ -1,7 +1,8 @@
 # Standard library
 import os
-import re
 import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
 
 # Local
 from ..abstract.client import Client
@@ -21,6 +22,8 @@ class SQLiteClient(Client):
         self.logger.debug(f"Initializing SQLiteClient for pipeline {settings.pipeline}")
         self.settings = settings
         self.DB_PATH = settings.CLIENT_CONFIG["DB_PATH"]
+        self.timeout = settings.CLIENT_CONFIG["TIMEOUT"]
+        self._in_transaction = False
         # Create db file if not exist
         self._check_db(self.DB_PATH)
         self.logger.debug(f"{self.DB_PATH=}")
@@ -30,22 +33,45 @@ class SQLiteClient(Client):
 
     def connect(self):
         """Connect to db."""
-        self.conn = sqlite3.connect(self.DB_PATH)
+        self.conn = sqlite3.connect(self.DB_PATH, timeout=self.timeout)
         self.cur = self.conn.cursor()
         self.logger.info("conected")
 
+    def close(self):
+        """Close the connection to db."""
+        self.conn.close()
+
     def execute(self, query: str) -> list[tuple]:
         """Execute query."""
 
         resp = self.cur.execute(query)
-        self.conn.commit()
+        self._commit()
 
         return resp.fetchall()
 
     def executemany(self, query: str, mapped_values: list[tuple]):
         """Execute parameterized query."""
         self.cur.executemany(query, mapped_values)
-        self.conn.commit()
+        self._commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run statements of the block in one transaction, rolled back on errors."""
+
+        self._in_transaction = True
+        try:
+            yield
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+
+    def _commit(self):
+        """Commit, unless running in a transaction."""
+        if not self._in_transaction:
+            self.conn.commit()
 
     def _check_db(self, db_path):
         """Check if SQLite file exist, creates a new one if not."""
@@ -54,11 +80,11 @@ class SQLiteClient(Client):
             self.logger.info
             (f"Database file {db_path} not fount. A new file will be created")
             # Check directory
-            if re.search("/", db_path):
+            directory = os.path.dirname(db_path)
+            if directory:
                 try:
-                    directory = re.findall(r"([^\/]*)/[^\/]*.db", db_path)[0]
                     if not os.path.exists(directory):
-                        os.mkdir(directory)
+                        os.makedirs(directory)
                         self.logger.info(f"DB directory not found. Created {directory}")
                     else:
                         self.logger.info(f"DB directory found. {directory=}")
@@ -2,19 +2,24 @@
 import os
 from typing import Dict, Optional
 
-# Third party
-import duckdb
-
 # Local
 from ..abstract.client import Client
 from ..abstract.step import Step
 from ..settings import Settings
 from ..utils.csv_handler import clean_temp_file
+from ..utils.page_revisions import PageRevisions
+from ..utils.quality_rules import QUALITY_SUMMARY_TABLE
 from ..utils.sql_handler import SQLHandler
+from ..utils.step_buffer import StepBuffer, open_rows
+from ..utils.watermarks import Watermarks
 
 
 class SQLLoader(Step):
-    """Load data into one client db table."""
+    """Load data into one client db table.
+    Tables with "load_mode": "merge" are loaded into a staging table first, then only rows
+    missing in the table, by "natural_key", are inserted. Re-running a load is idempotent.
+    Page revisions handed over in previous_output["page_revisions"] are recorded with the rows.
+    """
 
     def __init__(
         self,
@@ -27,39 +32,110 @@ class SQLLoader(Step):
         super(SQLLoader, self).__init__(__name__, previous_output, settings)
 
         self.sqlite_client = SQLHandler(settings, client, table_config)
+        table_config = table_config or settings.PIPELINE_TABLE
+        self.is_merge = table_config.get("load_mode") == "merge"
+        self.watermarks = (
+            Watermarks(settings, client, table_config) if "watermark" in table_config else None
+        )
         self.valid_file_path = self.previous_output["valid_file_path"]
         self.invalid_file_path = self.previous_output["invalid_file_path"]
+        # Valid rows handed over in memory by the Validator
+        self.valid_buffer: Optional[StepBuffer] = self.previous_output.get("valid_buffer")
         self.chunk_size = settings.CLIENT_CONFIG["CHUNK_SIZE"]
+        # Data quality violations by rule, from the Validator
+        self.quality_summary: list[dict] = self.previous_output.get("quality_summary", [])
+        # Wikipedia page revisions of the rows, from the WikipediaExtractor
+        self.page_revisions: list[dict] = self.previous_output.get("page_revisions", [])
 
     def run(self, clean_file: bool = True) -> tuple[bool, Dict]:
         """run step."""
 
-        if not os.path.isfile(self.valid_file_path):  # pragma: no cover
+        is_file = os.path.isfile(self.valid_file_path)
+        if self.valid_buffer is None and not is_file:  # pragma: no cover
             self.logger.info("No file to load.")
             return True, self.output
 
-        raw_file = duckdb.read_csv(self.valid_file_path, header=True)
-        header = duckdb.read_csv(self.valid_file_path, header=False).fetchone()
-        if not header:
-            raise ValueError(f"Error reading {self.valid_file_path}")
+        # Data and watermarks are committed together
+        with self.sqlite_client.client.transaction():
+            # Replay rebuilds the table from the landing zone
+            if self.settings.replay:
+                self.sqlite_client.drop_table()
+                self.sqlite_client.create_table()
+                if self.watermarks:
+                    self.watermarks.reset()
 
-        next_chunk = True
-        chunk, rows = 1, 0
-        while next_chunk:
-            raw_values = []
-            for _ in range(self.chunk_size):
-                line = raw_file.fetchone()
-                if line:
-                    raw_values.append(line)
-                    rows += 1
-                else:
-                    next_chunk = False
-                    break
-            self.sqlite_client.insert_into(raw_values, header)
-            self.logger.info(f"{rows:,} Values inserted. {chunk=}")
-            chunk += 1
+            if self.is_merge:
+                self.merge()
+            else:
+                self.load(self.sqlite_client)
+
+            if self.watermarks:
+                self.watermarks.update(
+                    self.watermarks.compute(self.valid_file_path, self.valid_buffer)
+                )
+            if self.quality_summary:
+                self.load_quality_summary()
+            if self.page_revisions:
+                page_revisions = PageRevisions(self.settings, self.sqlite_client.client)
+                for revision in self.page_revisions:
+                    page_revisions.record(revision["page"], revision["revision_id"])
 
-        if clean_file:  # pragma: no cover
+        if clean_file and self.valid_buffer is not None:
+            self.valid_buffer.close()
+        elif clean_file:  # pragma: no cover
             clean_temp_file(self.valid_file_path)
 
         return True, self.output
+
+    def load(self, sql_handler: SQLHandler):
+        """Load valid rows into the table of sql_handler."""
+
+        # Clients supporting bulk load copy the whole file at once
+        if sql_handler.client.supports_bulk_copy:
+            sql_handler.copy_from_file(self.valid_file_path, self.valid_buffer)
+            self.logger.info("File copied into table.")
+        else:
+            self.insert_chunks(sql_handler)
+
+    def merge(self):
+        """Load valid rows into a staging table and merge them into the table."""
+
+        staging_handler = SQLHandler(
+            self.settings, self.sqlite_client.client, self.sqlite_client.get_staging_config()
+        )
+        # Staging table only holds this batch, left over rows of a failed run are dropped
+        staging_handler.drop_table()
+        staging_handler.create_table()
+        self.load(staging_handler)
+        self.sqlite_client.merge_from(staging_handler.schema.table_name)
+        staging_handler.drop_table()
+        self.logger.info("Staged rows merged into table.")
+
+    def load_quality_summary(self):
+        """Insert data quality summary of the validated rows into QUALITY_SUMMARY_TABLE."""
+
+        quality_summary_handler = SQLHandler(
+            self.settings, self.sqlite_client.client, QUALITY_SUMMARY_TABLE
+        )
+        header = tuple(self.quality_summary[0].keys())
+        quality_summary_handler.insert_into(
+            [tuple(rule.values()) for rule in self.quality_summary], header
+        )
+
+    def insert_chunks(self, sql_handler: SQLHandler):
+        """Insert valid file into the table of sql_handler in chunks of CHUNK_SIZE rows."""
+
+        # Buffer rows are text, csv values are typed by DuckDB
+        _, raw_file, header = open_rows(
+            self.valid_buffer or self.valid_file_path, all_varchar=False
+        )
+        order_by = sql_handler.get_order_by(header, raw_file.columns)
+        if order_by:
+            raw_file = raw_file.query("raw_file", f"SELECT * FROM raw_file {order_by}")
+
+        chunk, rows = 1, 0
+        while raw_values := raw_file.fetchmany(self.chunk_size):
+            sql_handler.insert_into(raw_values, header)
+            rows += len(raw_values)
+            self.logger.info(f"{rows:,} Values inserted. {chunk=}")
+            chunk += 1
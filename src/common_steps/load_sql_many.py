@@ -22,6 +22,8 @@ class SQLManyLoader(Step):
             context = {
                 "valid_file_path": table_files["valid_file_path"],
                 "invalid_file_path": table_files["invalid_file_path"],
+                "valid_buffer": table_files.get("valid_buffer"),
+                "quality_summary": table_files.get("quality_summary", []),
             }
             sql_loader = SQLLoader(context, self.settings, self.client, table)
             _, output = sql_loader.run()
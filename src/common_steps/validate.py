@@ -1,7 +1,8 @@
 # Standard library
 import csv
 import os
-from datetime import date, datetime
+import shutil
+from typing import Optional
 
 # Third party
 import duckdb
@@ -10,13 +11,19 @@ import duckdb
 from ..abstract.step import Step
 from ..settings import Settings
 from ..utils.csv_handler import clean_temp_file
+from ..utils.quality_rules import QualityRules
+from ..utils.step_buffer import StepBuffer, open_rows
 
 
 class Validator(Step):
     """Validate file.
     Validation based in:
        * Current pipeline settings
-       * previous_output["file_path"]
+       * previous_output["file_path"], or previous_output["buffer"] if found
+    Buffer rows are validated in memory, valid rows are handed over in output["valid_buffer"].
+    Rows violating a data quality rule (see QualityRules) are quarantined in the invalid file,
+    violations by rule are handed over in output["quality_summary"].
+    Page revisions of the rows (see WikipediaExtractor) are handed over to the loader.
     """
 
     def __init__(self, previous_output: dict, settings: Settings, table_config: dict = {}):
@@ -27,81 +34,93 @@ class Validator(Step):
         super(Validator, self).__init__(__name__, previous_output, settings)
 
         self.file_path: str = self.previous_output["file_path"]
+        self.buffer: Optional[StepBuffer] = self.previous_output.get("buffer")
         self.pipeline: str = self.settings.pipeline
         if not table_config:
             table_config = self.settings.PIPELINE_TABLE
 
         self.fields_mapping: dict = table_config["fields_mapping"]
         self.required_fields: list = table_config["required_fields"]
-
-    def _get_python_type(self, sqlite_dtype) -> type:
-        """Return python data type."""
-
-        dtype_mapping = {
-            "VARCHAR(255)": str,
-            "FLOAT": float,
-            "INTEGER": int,
-            "DATETIME": datetime,
-            "DATE": date,
-        }
-
-        return dtype_mapping[sqlite_dtype]
-
-    def _is_valid(self, fields: list, line: list):
-        """Checks is required field exists."""
-
-        for field, value in zip(fields, line):
-            if field in self.required_fields and not self._is_dtype_valid(field, value):
-                return False
-        return True
-
-    def _is_dtype_valid(self, field: str, value):
-        """Validate line based on src/database_config.json fields mappings."""
-
-        expected_dtype = self._get_python_type(self.fields_mapping[field][1])
-        if not isinstance(value, expected_dtype):
-            self.logger.info(f"Invalid data found. {field=} | {value=}")
-            return False
-        else:
-            return True
+        self.quality_rules = QualityRules(table_config, self.settings.DATA_QUALITY["SAMPLE_ROWS"])
 
     def run(self):
-        """Run validation step."""
+        """Run validation step.
+        Rows are split in valid and invalid files in one vectorized pass.
+        """
 
         self.output["valid_file_path"] = self.file_path.replace(".csv", "_valid.csv")
         self.output["invalid_file_path"] = self.file_path.replace(".csv", "_invalid.csv")
-
-        if not os.path.isfile(self.file_path):  # pragma: no cover
+        if "page_revisions" in self.previous_output:
+            self.output["page_revisions"] = self.previous_output["page_revisions"]
+
+        if self.buffer is not None:
+            if not self.buffer.rows:  # pragma: no cover
+                self.logger.info("No rows to validate.")
+                return True, self.output
+        elif not os.path.isfile(self.file_path):  # pragma: no cover
             self.logger.info("No file to validate.")
             return True, self.output
 
-        raw_file = duckdb.read_csv(self.file_path, header=True)
-        header = duckdb.read_csv(self.file_path, header=False).fetchone()
-        invalid_file_exist = os.path.isfile(self.output.get("invalid_file_path"))
-
-        with (
-            open(self.output["valid_file_path"], "a", newline="") as valid_file,
-            open(self.output["invalid_file_path"], "a", newline="") as invalid_file,
-        ):
-            valid_csv_writer = csv.writer(valid_file)
-            invalid_csv_writer = csv.writer(invalid_file)
-            valid_csv_writer.writerow(header)
-            if not invalid_file_exist:
-                invalid_csv_writer.writerow(header)
-            # Iterete results without loading in memory
-            n_lines, err_count = 0, 0
-            while True:
-                line = raw_file.fetchone()
-                if not line:
-                    break
-                if self._is_valid(header, line):
-                    valid_csv_writer.writerow(line)
-                else:
-                    invalid_csv_writer.writerow(line)
-                    err_count += 1
-                n_lines += 1
-
+        # Read as text, so rows are written as they are
+        duckdb_conn, raw_file, header = open_rows(self.buffer or self.file_path)
+        predicates = self.quality_rules.get_predicates(header, raw_file.columns)
+        rule_columns = {rule: f"__rule_{n}" for n, rule in enumerate(predicates)}
+        checks = "".join(f", {p} AS {rule_columns[rule]}" for rule, p in predicates.items())
+        is_valid = " AND ".join(rule_columns.values()) or "TRUE"
+        raw_file.create_view("raw_file")
+        duckdb_conn.execute(
+            f"CREATE TEMP TABLE validated AS SELECT *, {is_valid} AS __is_valid "
+            f"FROM (SELECT *{checks} FROM raw_file)"
+        )
+
+        # Violations by rule, written once by run in the data quality summary
+        quality_summary = self.quality_rules.summarize(
+            duckdb_conn, "validated", rule_columns, raw_file.columns, header
+        )
+        for rule in quality_summary:
+            if rule["violations"]:
+                self.logger.info(
+                    f"Data quality rule violated. rule={rule['rule']} "
+                    f"| violations={rule['violations']}"
+                )
+        self.output["quality_summary"] = quality_summary
+
+        columns = ", ".join(f'"{column}"' for column in raw_file.columns)
+        valid_rows = f"SELECT {columns} FROM validated WHERE __is_valid"
+        if self.buffer is not None:
+            self.output["valid_buffer"] = self.buffer.from_query(
+                duckdb_conn, valid_rows, f"{self.buffer.name}_valid"
+            )
+        else:
+            self._append_rows(duckdb_conn, valid_rows, self.output["valid_file_path"], header)
+        # Invalid rows are kept in a file for inspection
+        self._append_rows(
+            duckdb_conn,
+            f"SELECT {columns} FROM validated WHERE NOT __is_valid",
+            self.output["invalid_file_path"],
+            header,
+        )
+        err_count = duckdb_conn.execute(
+            "SELECT count(*) FROM validated WHERE NOT __is_valid"
+        ).fetchall()[0][0]
+
+        if self.buffer is not None:
+            self.buffer.close()
         clean_temp_file(self.file_path)
 
         self.logger.info(f"Validation complete. {err_count} Invalid lines found.")
         return True, self.output
+
+    def _append_rows(
+        self, duckdb_conn: duckdb.DuckDBPyConnection, query: str, file_path: str, header: list[str]
+    ):
+        """Append query rows to csv file. Write header if file does not exist."""
+
+        rows_file_path = file_path.replace(".csv", "_rows.csv")
+        duckdb_conn.execute(f"COPY ({query}) TO '{rows_file_path}' (HEADER false)")
+        file_exists = os.path.isfile(file_path)
+        with open(file_path, "a", newline="") as f, open(rows_file_path, "r", newline="") as rows:
+            if not file_exists:
+                csv.writer(f, lineterminator="\n").writerow(header)
+            shutil.copyfileobj(rows, f)
+        clean_temp_file(rows_file_path)
@@ -8,7 +8,7 @@ class ManyValidator(Step):
     """Validate multiple files.
     Validation based in:
        * Current pipeline settings
-       * previous_output["files_path"]
+       * previous_output["files_path"], or previous_output["buffers"] if found
     """
 
     def __init__(self, previous_output: dict, settings: Settings):
@@ -23,7 +23,10 @@ class ManyValidator(Step):
         """Run validation step for many tables."""
 
         for table in self.pipeline_tables:
-            context = {"file_path": self.previous_output["files_path"][table["name"]]}
+            context = {
+                "file_path": self.previous_output["files_path"][table["name"]],
+                "buffer": self.previous_output.get("buffers", {}).get(table["name"]),
+            }
             validator = Validator(context, self.settings, table)
             _, output = validator.run()
             self.output.update({table["name"]: output})
@@ -1,20 +1,26 @@
 # Standard library
-from time import sleep
 from typing import Dict
-
-# Third party
-import requests
+from urllib.parse import urlencode
 
 # Local
+from ..abstract.client import Client
 from ..abstract.step import Step
-from ..exceptions import MaxRetriesExceededError
+from ..clients.http_client import HTTPClient
+from ..exceptions import LandingDataNotFoundError
 from ..settings import Settings
+from ..utils.landing_zone import LandingZone
+from ..utils.page_revisions import PageRevisions
 
 
 class WikipediaExtractor(Step):
-    """Extract a single html page from Wikipedia."""
+    """Extract a single html page from Wikipedia.
+
+    The page revision id is handed over in output["page_revisions"], SQLLoader records it in
+    PAGE_REVISIONS_TABLE with the page rows. If the loaded revision is unchanged, the pipeline
+    is skipped without downloading the page.
+    """
 
-    def __init__(self, page: str, previous_output: Dict, settings: Settings) -> None:
+    def __init__(self, page: str, previous_output: Dict, settings: Settings, client: Client):
         """Init class.
 
         Args:
@@ -26,32 +32,80 @@ class WikipediaExtractor(Step):
             "User-Agent": "StockAnalyzer/0.0 (https://github.com/FelipeMezzarana/StockAnalyzer"
         }
         self.params = {"action": "parse", "page": page, "format": "json", "prop": "text"}
+        self.page = page
+        self.http_client = HTTPClient(settings)
+        self.landing_zone = LandingZone(settings)
+        self.page_revisions = PageRevisions(settings, client)
 
     def request(self) -> str:
         """Return html for the url."""
 
-        response = requests.get(self.url, headers=self.headers, params=self.params)
-        req_count = 1
-        while response.status_code != 200:  # pragma: no cover
-            if req_count > 3:
-                raise MaxRetriesExceededError(self.url, 3)
-            self.logger.info(
-                f"Request {req_count}/3 to {self.url} Failed. {response.status_code=}."
-                " Waiting 5 sec. and trying again."
-            )
-            sleep(5)
-            response = requests.get(self.url, headers=self.headers, params=self.params)
-            req_count += 1
-
-        return response.json()["parse"]["text"]["*"]
+        response = self.http_client.get(self.url, params=self.params, headers=self.headers)
+        self.landing_zone.write(
+            "wikipedia", self.page, f"{self.url}?{urlencode(self.params)}", response
+        )
+
+        return response["parse"]["text"]["*"]
+
+    def replay(self) -> list[dict]:
+        """Write the html of every page snapshot in the landing zone, ordered by fetched_at.
+        Return snapshots [{"file_path", "fetched_at"}], tables keep the history of the page.
+        """
+
+        snapshots = []
+        responses = self.landing_zone.read("wikipedia", self.page, latest_only=False)
+        for i, (_, fetched_at, response) in enumerate(responses):
+            file_path = f"temp/html_temp_{i}.txt"
+            self.write_html(file_path, response["parse"]["text"]["*"])
+            snapshots.append({"file_path": file_path, "fetched_at": fetched_at})
+        if not snapshots:
+            raise LandingDataNotFoundError("wikipedia", self.page)
+        self.logger.info(f"Replaying {len(snapshots)} {self.page} snapshots")
+
+        return snapshots
+
+    def write_html(self, file_path: str, html: str):
+        """Save html in .txt file."""
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(html)
+
+    def get_revision_id(self) -> str:
+        """Return the current revision id of the page, a small request without content."""
+
+        params = {
+            "action": "query",
+            "prop": "revisions",
+            "titles": self.page,
+            "rvprop": "ids",
+            "format": "json",
+            "formatversion": "2",
+        }
+        response = self.http_client.get(self.url, params=params, headers=self.headers)
+        return str(response["query"]["pages"][0]["revisions"][0]["revid"])
+
+    def is_loaded(self, revision_id: str) -> bool:
+        """Return if revision_id was loaded into the pipeline table."""
+
+        return self.page_revisions.get(self.page) == revision_id
 
     def run(self) -> tuple[bool, Dict]:
         """Extract html and save in .txt file."""
 
+        if self.settings.replay:
+            self.output["snapshots"] = self.replay()
+            return True, self.output
+
+        revision_id = self.get_revision_id()
+        if self.is_loaded(revision_id):
+            self.logger.info(f"{self.page} {revision_id=} unchanged. Skipping pipeline.")
+            self.output["skip_pipeline"] = True
+            return True, self.output
         html = self.request()
+        self.logger.info(f"Extracted {self.page} {revision_id=}")
         file_path = "temp/html_temp.txt"
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(html)
-        self.output["file_path"] = file_path
+        self.write_html(file_path, html)
+        self.output["snapshots"] = [{"file_path": file_path, "fetched_at": None}]
+        self.output["page_revisions"] = [{"page": self.page, "revision_id": revision_id}]
 
         return True, self.output
@@ -84,3 +84,14 @@ class DirectoryCreationError(CustomException):  # pragma: no cover
         message = f"Failed to create directory at '{directory_path}'. {error=}"
         super(DirectoryCreationError, self).__init__(message)
         self.details = dict(directory_path=directory_path, error=str(error))
+
+
+class LandingDataNotFoundError(CustomException):  # pragma: no cover
+    """Raised when replay mode finds no landing files for an endpoint."""
+
+    key = "LANDING_DATA_NOT_FOUND"
+
+    def __init__(self, source: str, endpoint: str):
+        message = f"No landing files found for {source=} {endpoint=}. Run without --replay first."
+        super(LandingDataNotFoundError, self).__init__(message)
+        self.details = dict(source=source, endpoint=endpoint)
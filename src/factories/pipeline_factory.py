@@ -2,6 +2,7 @@
 from ..abstract.pipeline import Pipeline
 from ..exceptions import InvalidPipelineError
 from ..pipelines.financials.financials_pipeline import FinancialsPipeline
+from ..pipelines.fred_series.fred_series_pipeline import FredSeriesPipeline
 from ..pipelines.index_daily_close.index_daily_close_pipeline import IndexDailyClosePipeline
 from ..pipelines.sp500_company_details.sp500_company_details_pipeline import (
     SP500CompanyDetailsPipeline,
@@ -28,6 +29,7 @@ class PipelineFactory:
             "sp500-company-details-pipeline": lambda: SP500CompanyDetailsPipeline(settings),
             "index-daily-close-pipeline": lambda: IndexDailyClosePipeline(settings),
             "financials-pipeline": lambda: FinancialsPipeline(settings),
+            "fred-series-pipeline": lambda: FredSeriesPipeline(settings),
         }
 
     def create(self) -> Pipeline:
@@ -1,4 +1,5 @@
 # Local
+from ..clients.duckdb_client import DuckDBClient
 from ..clients.postgres_client import PostgresClient
 from ..clients.sqlite_client import SQLiteClient
 from ..common_steps.load_sql import SQLLoader
@@ -9,6 +10,8 @@ from ..common_steps.wikipedia_extractor import WikipediaExtractor
 from ..exceptions import StepNotFoundError
 from ..pipelines.financials.steps.check_financials_tables import FinancialsChecker
 from ..pipelines.financials.steps.extract_financials_data import FinancialsExtractor
+from ..pipelines.fred_series.steps.check_fred_series import FredSeriesChecker
+from ..pipelines.fred_series.steps.extract_fred_series import FredSeriesExtractor
 from ..pipelines.index_daily_close.steps.check_index_daily_close import IndexDailyCloseChecker
 from ..pipelines.index_daily_close.steps.extract_index_daily_close import IndexDailyCloseExtractor
 from ..pipelines.sp500_company_details.steps.check_sp500_company_details import SP500Checker
@@ -31,8 +34,10 @@ class StepFactory:
         self.clients = {
             "SQLITE": lambda settings: SQLiteClient(settings),
             "POSTGRES": lambda settings: PostgresClient(settings),
+            "DUCKDB": lambda settings: DuckDBClient(settings),
         }
         client = self.clients[self.settings.CLIENT](self.settings)
+        self.client = client
 
         self._steps = {
             "extract-stock-daily-prices": (
@@ -56,6 +61,7 @@ class StepFactory:
                     "List_of_S&P_500_companies",
                     previous_output,
                     settings,
+                    client,
                     **kwargs,
                 )
             ),
@@ -75,6 +81,12 @@ class StepFactory:
                     previous_output, settings, **kwargss
                 )
             ),
+            "check-fred-series": lambda previous_output, settings, **kwargss: FredSeriesChecker(
+                previous_output, settings, client, **kwargss
+            ),
+            "extract-fred-series": lambda previous_output, settings, **kwargss: FredSeriesExtractor(
+                previous_output, settings, client, **kwargss
+            ),
             "check-financials-tables": (
                 lambda previous_output, settings, **kwargss: FinancialsChecker(
                     previous_output, settings, client, **kwargss
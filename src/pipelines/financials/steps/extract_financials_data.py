@@ -1,11 +1,30 @@
 # Standard library
-from datetime import datetime
+import re
+from itertools import chain
+from typing import Iterator, Optional
 
 # Local
 from ....abstract.step import Step
 from ....clients.polygon import Polygon
 from ....settings import Settings
-from ....utils.csv_handler import append_to_file
+from ....utils.batch_enrich import enrich_batch
+from ....utils.landing_zone import LandingZone
+from ....utils.run_journal import RunJournal
+from ....utils.step_buffer import append_rows, new_output
+from ....utils.table_schema import get_table_schema
+
+# Fields of the financials response, other fields are read from the financial report
+METADATA_FIELDS = (
+    "start_date",
+    "end_date",
+    "timeframe",
+    "fiscal_period",
+    "fiscal_year",
+    "exchange_symbol_search",
+    "tickers",
+    "company_name",
+    "updated_at",
+)
 
 
 class FinancialsExtractor(Step):
@@ -17,113 +36,203 @@ class FinancialsExtractor(Step):
 
         self.settings = settings
         self.pipeline_tables = self.settings.PIPELINE_TABLE
+        self.table_schemas = {t["name"]: get_table_schema(t) for t in self.pipeline_tables}
         self.base_url = self.settings.POLYGON["BASE_URL"]
         self.endpoint: dict = self.settings.POLYGON["ENDPOINTS"]["financials_endpoint"]
         self.polygon_client = Polygon(settings)
+        self.fetch_mode: str = self.settings.POLYGON["FINANCIALS_FETCH_MODE"]
+        self.include_sources: str = self.settings.POLYGON["FINANCIALS_INCLUDE_SOURCES"]
+        self.max_pagination: int = self.settings.POLYGON["MAX_PAGINATION"]
+        self.journal = RunJournal(settings)
         self.is_integration_test = settings.is_integration_test
 
+    def get_last_date(self, ticker: str) -> Optional[str]:
+        """Return ticker last end date [%Y-%m-%d] in the tables, from FinancialsChecker."""
+
+        return self.previous_output.get("required_tickers", {}).get(ticker, {}).get("last_date")
+
+    def build_request(self, ticker: str) -> str:
+        """Return Financials endpoint url for ticker, newest filings first.
+        In incremental mode, only filings after the ticker last end date are requested.
+        """
+
+        url = (
+            f"{self.base_url}{self.endpoint}ticker={ticker}&limit=100"
+            f"&include_sources={self.include_sources}&sort=period_of_report_date&order=desc"
+        )
+        last_date = self.get_last_date(ticker)
+        if self.fetch_mode == "incremental" and last_date:
+            url += f"&period_of_report_date.gt={last_date}"
+        return url
+
     def request_ticker(self, ticker: str) -> dict:
         """Return Financials endpoint response for ticker."""
 
-        url = f"{self.base_url}{self.endpoint}ticker={ticker}&limit=100&include_sources=true"
+        url = self.build_request(ticker)
         self.logger.debug(f"request to: {url}")
         resp = self.polygon_client.request(url)
 
         return resp
 
+    def request_tickers(
+        self, tickers: list[str], completed_tickers: frozenset = frozenset()
+    ) -> Iterator[dict]:
+        """Return Financials endpoint responses for tickers, requested concurrently.
+        Responses are yielded in the same order as tickers.
+
+        completed_tickers -- completed by the resumed run, served from the response cache
+        whatever its age. Must come first in tickers.
+        """
+
+        completed = [t for t in tickers if t in completed_tickers]
+        pending_urls = [self.build_request(t) for t in tickers if t not in completed_tickers]
+        if not completed:
+            return self.polygon_client.request_many(pending_urls)
+        completed_urls = [self.build_request(t) for t in completed]
+        return chain(
+            self.polygon_client.request_many(completed_urls, ignore_ttl=True),
+            self.polygon_client.request_many(pending_urls),
+        )
+
     def filter_results(self, data: list[dict], ticker: str) -> list[dict]:
         """Filter results that already exists in db."""
 
-        ticker_last_date_str = self.previous_output["required_tickers"][ticker]["last_date"]
-        filtered_results = []
-        for result in data:
-            end_date = datetime.strptime(result["end_date"], "%Y-%m-%d")
-            ticker_last_date = datetime.strptime(ticker_last_date_str, "%Y-%m-%d")
-            if end_date > ticker_last_date:
-                filtered_results.append(result)
-
-        return filtered_results
+        # ISO dates, compared as strings
+        ticker_last_date = self.previous_output["required_tickers"][ticker]["last_date"]
+        return [result for result in data if result["end_date"] > ticker_last_date]
+
+    def get_new_results(self, data: dict, ticker: str) -> list[dict]:
+        """Return results of ticker newer than the tables, from the first page response data.
+        Next pages are requested only while new filings remain, i.e. the whole page was new.
+        """
+
+        new_results: list[dict] = []
+        pages = 0
+        while True:
+            page = data.get("results") or []
+            new_page_results = self.filter_results(page, ticker)
+            new_results.extend(new_page_results)
+            pages += 1
+            # Filings are sorted newest first, pages after a partly new one are already loaded
+            if not page or not data.get("next_url") or len(new_page_results) < len(page):
+                return new_results
+            if pages >= self.max_pagination:  # pragma: no cover
+                self.logger.info(f"{self.max_pagination=} reached for {ticker}.")
+                return new_results
+            data = self.polygon_client.request(data["next_url"])
 
     def enrich_results(self, results: list[dict], ticker: str) -> list[dict]:
-        """Enrich result with metadata."""
+        """Enrich result with metadata, by batch."""
 
-        enriched_results = []
-        for result in results:
-            enriched_result = result.copy()
-            # Add extra fields
-            enriched_result["exchange_symbol_search"] = ticker
-            enriched_result["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            enriched_results.append(enriched_result)
-
-        return enriched_results
+        return enrich_batch(results, {"exchange_symbol_search": ticker})
 
     def map_to_file(self, data: list[dict], table: str):
         """Map data according to settings and append to file."""
 
         # Mapping
-        table_config = [i for i in self.pipeline_tables if i["name"] == table][0]
-        endpoint_path = table_config["endpoint_path"]
-        table_fields_mapping = list(table_config["fields_mapping"].keys())
+        schema = self.table_schemas[table]
+        endpoint_path = schema.table_config["endpoint_path"]
+        report_fields = [f for f in schema.fields if f not in METADATA_FIELDS]
         mapped_data_list = []
         for row in data:
             financial_report = row["financials"].get(endpoint_path)
             if financial_report:
-                metadata = {
-                    "start_date": row.get("start_date"),
-                    "end_date": row.get("end_date"),
-                    "timeframe": row.get("timeframe"),
-                    "fiscal_period": row.get("fiscal_period"),
-                    "fiscal_year": row.get("fiscal_year"),
-                    "exchange_symbol_search": row.get("exchange_symbol_search"),
-                    "tickers": row.get("tickers"),
-                    "company_name": row.get("company_name"),
-                    "updated_at": row.get("updated_at"),
-                }
-                metadata_fields = list(metadata.keys())
-                financial_data = {}
-                for field in [f for f in table_fields_mapping if f not in metadata_fields]:
-                    if financial_report.get(field):
-                        financial_data[field] = financial_report.get(field).get("value")
-                    else:
-                        financial_data[field] = None
-                metadata.update(financial_data)
-                mapped_data_list.append(metadata)
+                mapped_data = {field: row.get(field) for field in METADATA_FIELDS}
+                for field in report_fields:
+                    report_value = financial_report.get(field)
+                    mapped_data[field] = report_value.get("value") if report_value else None
+                mapped_data_list.append(mapped_data)
 
         return mapped_data_list
 
     def run(self) -> tuple[bool, dict]:  # pragma: no cover
         """Run step."""
 
-        self.output["files_path"] = {}
+        self.output["files_path"], self.output["buffers"] = {}, {}
         tables = [i["name"] for i in self.pipeline_tables]
-        for table in tables:
-            file_path = f"temp/financials_{table}_temp.csv"
-            self.output["files_path"].update({table: file_path})
+        for table_config in self.pipeline_tables:
+            table = table_config["name"]
+            output = new_output(
+                self.settings, f"temp/financials_{table}_temp.csv", table_config["fields_mapping"]
+            )
+            self.output["files_path"][table] = output["file_path"]
+            self.output["buffers"][table] = output.get("buffer")
+
+        if self.settings.replay:
+            self.replay_tickers(tables)
+            return True, self.output
 
         required_tickers = list(self.previous_output["required_tickers"].keys())
         # Workaround to limit number of requests in integration tests
         if self.is_integration_test:  # pragma no cover
             required_tickers = required_tickers[:3]
+        completed_tickers = frozenset(self.journal.get("ticker"))
+        if completed_tickers:
+            self.logger.info(f"Resumed run: {len(completed_tickers)} tickers already completed")
+            required_tickers.sort(key=lambda ticker: ticker not in completed_tickers)
         # Request data for each ticker.
         # Each request return all reports (for all financials tables) for the ticker.
         counter = 0
-        for ticker in required_tickers:
+        responses = self.request_tickers(required_tickers, completed_tickers)
+        for ticker, data in zip(required_tickers, responses):
             counter += 1
             self.logger.info(
-                f"Getting financial data for ticker {ticker}. {counter}/{len(required_tickers)}"
+                f"Got financial data for ticker {ticker}. {counter}/{len(required_tickers)}"
             )
-            data = self.request_ticker(ticker)
             if data.get("results"):
-                # Filter results that already exists in db
-                filtered_results = self.filter_results(data["results"], ticker)
-                if filtered_results:
-                    # Enrich results with metadata
-                    enriched_results = self.enrich_results(filtered_results, ticker)
-                    for table in tables:
-                        self.logger.debug(f"Mapping data to {table} table")
-                        mapped_data_list = self.map_to_file(enriched_results, table)
-                        file_path = self.output["files_path"][table]
-                        if mapped_data_list:
-                            append_to_file(file_path, mapped_data_list)
+                # Filter results that already exists in db, requesting next pages if needed
+                new_results = self.get_new_results(data, ticker)
+                self.write_results(new_results, ticker, tables)
+            self.journal.add("ticker", [ticker])
 
         return True, self.output
+
+    def replay_tickers(self, tables: list[str]):
+        """Write financials data of all tickers in the landing zone.
+        Next pages url only has a cursor, their ticker is the one of the first page of their
+        chain. Pages are read by fetch time, a first page fetched again is read after its
+        next pages, so chains are resolved in a first read, before writing results.
+        """
+
+        landing_zone = LandingZone(self.settings)
+        # {next_url: url of the previous page}
+        previous_urls: dict[str, str] = {}
+        for url, _, data in landing_zone.read("polygon", "financials_endpoint"):
+            if data.get("next_url"):
+                previous_urls[data["next_url"]] = url
+
+        for url, _, data in landing_zone.read("polygon", "financials_endpoint"):
+            ticker = self.get_url_ticker(url, previous_urls)
+            if ticker is None:
+                self.logger.warning(f"First page of {url=} not found. Skipping page.")
+                continue
+            self.write_results(data.get("results") or [], ticker, tables)
+
+    def get_url_ticker(self, url: str, previous_urls: dict[str, str]) -> Optional[str]:
+        """Return ticker of a page url, from the first page of its chain. None if not found.
+        previous_urls -- {next_url: url of the previous page}
+        """
+
+        seen_urls = set()
+        while not (tickers := re.findall(r"ticker=([^&]+)", url)):
+            seen_urls.add(url)
+            if url not in previous_urls or previous_urls[url] in seen_urls:
+                return None
+            url = previous_urls[url]
+        return tickers[0]
+
+    def write_results(self, results: list[dict], ticker: str, tables: list[str]):
+        """Enrich results with metadata, map and append them to each table file."""
+
+        if not results:
+            return
+        enriched_results = self.enrich_results(results, ticker)
+        for table in tables:
+            self.logger.debug(f"Mapping data to {table} table")
+            mapped_data_list = self.map_to_file(enriched_results, table)
+            output = {
+                "file_path": self.output["files_path"][table],
+                "buffer": self.output.get("buffers", {}).get(table),
+            }
+            if mapped_data_list:
+                append_rows(output, mapped_data_list)
@@ -0,0 +1,23 @@
+# Local
+from ...abstract.pipeline import Pipeline
+from ...settings import Settings
+
+
+class FredSeriesPipeline(Pipeline):
+    """Update DB table FRED_SERIES_OBSERVATIONS.
+    Contain observations of the series in the FRED series catalog (rates, spreads, CPI...).
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        super(FredSeriesPipeline, self).__init__(__name__, settings)
+
+    def build_steps(self):
+        """Returns a list with valid steps specific to current pipeline."""
+
+        # the order of the processors are important!
+        return [
+            "check-fred-series",
+            "extract-fred-series",
+            "validate",
+            "load-sql",
+        ]
@@ -0,0 +1,51 @@
+# Standard library
+from datetime import datetime
+
+# Local
+from .extract_fred_series import SERIES_CHECKS_TABLE
+from ....abstract.client import Client
+from ....abstract.step import Step
+from ....settings import Settings
+from ....utils.series_catalog import get_stale_series, load_series_catalog
+from ....utils.sql_handler import SQLHandler
+from ....utils.watermarks import Watermarks
+
+
+class FredSeriesChecker(Step):
+    """Check status of FRED_SERIES_OBSERVATIONS, by series of the FRED series catalog."""
+
+    def __init__(self, previous_output: dict, settings: Settings, client: Client):
+        """Init class."""
+        super(FredSeriesChecker, self).__init__(__name__, previous_output, settings)
+        self.watermarks = Watermarks(settings, client)
+        self.checks_handler = SQLHandler(settings, client, SERIES_CHECKS_TABLE)
+        self.catalog = load_series_catalog(settings.FRED["SERIES_CATALOG"])
+        self.is_integration_test = settings.is_integration_test
+
+    def get_stale_series(self) -> dict[str, str]:
+        """Return {series_id: last observation date} of series with a new observation due."""
+
+        catalog = self.catalog
+        # Workaround to limit number of requests in integration tests
+        if self.is_integration_test:  # pragma no cover
+            catalog = dict(list(catalog.items())[:3])
+        today = datetime.today().strftime("%Y-%m-%d")
+        return get_stale_series(catalog, self.watermarks.get(), today, self.get_last_checked())
+
+    def get_last_checked(self) -> dict[str, str]:
+        """Return {series_id: date of the last request without new observations}."""
+
+        _, result = self.checks_handler.query(
+            f"SELECT series_id, checked_at FROM {self.checks_handler.schema.table_name}"
+        )
+        return {series_id: str(checked_at)[:10] for series_id, checked_at in result}
+
+    def run(self):
+        """Run step."""
+
+        series_last_update = self.get_stale_series()
+        self.logger.info(f"{len(series_last_update)} of {len(self.catalog)} series stale.")
+        self.output["skip_pipeline"] = not series_last_update
+        self.output["series_last_update"] = series_last_update
+
+        return True, self.output
@@ -0,0 +1,72 @@
+# Standard library
+from datetime import datetime
+
+# Local
+from ...index_daily_close.steps.extract_index_daily_close import IndexDailyCloseExtractor
+from ....abstract.client import Client
+from ....settings import Settings
+from ....utils.get_logger import get_logger
+from ....utils.series_catalog import load_series_catalog
+from ....utils.sql_handler import SQLHandler
+
+SERIES_CHECKS_TABLE: dict = {
+    "name": "FRED_SERIES_CHECKS",
+    "schema": "bronze_layer",
+    "fields_mapping": {
+        "series_id": ["series_id", "VARCHAR(255)"],
+        "checked_at": ["checked_at", "DATE"],
+    },
+    "primary_index": ["series_id"],
+}
+
+
+class FredSeriesExtractor(IndexDailyCloseExtractor):
+    """Extract new observations of stale series from Fred API.
+    Series are in the FRED series catalog, stale ones are set by FredSeriesChecker.
+    Series requested without new observations are recorded in SERIES_CHECKS_TABLE.
+    """
+
+    series_field = "series_id"
+
+    def __init__(self, previous_output: dict, settings: Settings, client: Client):
+        """Initiate clients and settings."""
+        super(FredSeriesExtractor, self).__init__(previous_output, settings)
+
+        self.logger = get_logger(__name__, settings).bind(step=settings.step_name)
+        self.indexes_last_update = previous_output.get("series_last_update", {})
+        # Replay rebuilds all series of the catalog
+        if settings.replay:
+            self.indexes = list(load_series_catalog(settings.FRED["SERIES_CATALOG"]))
+        else:
+            self.indexes = list(self.indexes_last_update)
+        self.file_path = "temp/fred_series_observations_temp.csv"
+        self.client = client
+        self.placeholder = settings.CLIENT_CONFIG["PARAMETER_PLACEHOLDER"].strip(", ")
+        self.checks_handler = SQLHandler(settings, client, SERIES_CHECKS_TABLE)
+
+    def record_checks(self, series_ids: list[str]):
+        """Replace the date of the last request without new observations of series_ids."""
+
+        if not series_ids:
+            return
+        table_name = self.checks_handler.schema.table_name
+        self.client.executemany(
+            f"DELETE FROM {table_name} WHERE series_id = {self.placeholder}",
+            [(series_id,) for series_id in series_ids],
+        )
+        checked_at = datetime.today().strftime("%Y-%m-%d")
+        self.checks_handler.insert_into(
+            [(series_id, checked_at) for series_id in series_ids], ("series_id", "checked_at")
+        )
+
+    def run(self):
+        """Run step."""
+
+        if self.settings.replay:
+            self.replay_index_daily_close()
+            return True, self.output
+
+        observations = self.get_index_daily_close()
+        self.record_checks([series_id for series_id, values in observations.items() if not values])
+
+        return True, self.output
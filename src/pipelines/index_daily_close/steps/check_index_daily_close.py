@@ -5,7 +5,7 @@ from datetime import datetime
 from ....abstract.client import Client
 from ....abstract.step import Step
 from ....settings import Settings
-from ....utils.sql_handler import SQLHandler
+from ....utils.watermarks import Watermarks
 
 
 class IndexDailyCloseChecker(Step):
@@ -14,26 +14,16 @@ class IndexDailyCloseChecker(Step):
     def __init__(self, previous_output: dict, settings: Settings, client: Client):
         """Init class."""
         super(IndexDailyCloseChecker, self).__init__(__name__, previous_output, settings)
-        self.sqlite_client = SQLHandler(settings, client)
+        self.watermarks = Watermarks(settings, client)
         self.indexes = settings.FRED["INDEXES"]
 
     def get_last_update(self) -> dict:
         """Return last update date each index in table INDEX_DAILY_CLOSE."""
 
-        is_successful, result = self.sqlite_client.query(
-            "SELECT index_code, max(date) as last_DATE FROM "
-            "BRONZE_LAYER.INDEX_DAILY_CLOSE GROUP BY index_code"
-        )
-        if is_successful:
-            last_update = dict(result)
-            indexes_last_update = {k: last_update.get(k, "1600-01-01") for k in self.indexes}
-            for k, v in indexes_last_update.items():
-                if isinstance(v, datetime):  # pragma: no cover
-                    indexes_last_update[k] = v.strftime("%Y-%m-%d")
-            self.logger.debug(f"Indexes last updated: {indexes_last_update}")
-            return indexes_last_update
-        else:  # pragma: no cover
-            raise KeyError("INDEX_DAILY_CLOSE Table no found.")
+        last_update = self.watermarks.get()
+        indexes_last_update = {k: last_update.get(k, "1600-01-01") for k in self.indexes}
+        self.logger.debug(f"Indexes last updated: {indexes_last_update}")
+        return indexes_last_update
 
     def run(self):
         """Run step."""
@@ -1,12 +1,16 @@
 # Standard library
+import json
 import re
 from datetime import datetime, timedelta
 
+# Third party
+import duckdb
+
 # Local
 from ....abstract.step import Step
 from ....clients.fred import Fred
 from ....settings import Settings
-from ....utils.csv_handler import append_to_file
+from ....utils.landing_zone import LandingZone
 
 
 class IndexDailyCloseExtractor(Step):
@@ -14,6 +18,9 @@ class IndexDailyCloseExtractor(Step):
     indexes list in settings.py
     """
 
+    # Column of the series id in the temp file
+    series_field = "index"
+
     def __init__(self, previous_output: dict, settings: Settings):
         """Initiate clients and settings."""
         super(IndexDailyCloseExtractor, self).__init__(__name__, previous_output, settings)
@@ -23,6 +30,7 @@ class IndexDailyCloseExtractor(Step):
         self.base_url = self.settings.FRED["BASE_URL"]
         self.endpoints: dict = self.settings.FRED["ENDPOINTS"]
         self.indexes = settings.FRED["INDEXES"]
+        self.file_path = "temp/index_daily_close_temp.csv"
 
     def build_request(self, index: str) -> str:
         """Return url to request daily open, high, low, and close (OHLC).
@@ -44,41 +52,75 @@ class IndexDailyCloseExtractor(Step):
 
         return url
 
-    def get_index_daily_close(self, index: str) -> None:
-        """Get daily close data for <index>."""
+    def get_index_daily_close(self) -> dict[str, list[dict]]:
+        """Get daily close data for all indexes, requested concurrently.
+        Return {index: observations}.
+        """
 
         fred = Fred(self.settings)
-        url = self.build_request(index)
-        file_path = "temp/index_daily_close_temp.csv"
-        self.output["file_path"] = file_path
-        resp = fred.request(url)
-        data = resp.get("observations")
-        if data:
+        urls = [self.build_request(index) for index in self.indexes]
+        # {index: observations}
+        observations: dict[str, list[dict]] = {}
+        for index, resp in zip(self.indexes, fred.request_many(urls)):
             self.logger.info(f"{index=} | Results: {resp.get('count')}")
-            enriched_data = self._raw_enrich(data, index)
-            append_to_file(file_path, enriched_data)
+            observations[index] = resp.get("observations") or []
+        self.write_observations(observations)
+        return observations
 
-    def _raw_enrich(self, data: list[dict], index: str) -> list[dict]:
-        """initial enrichment."""
+    def replay_index_daily_close(self) -> None:
+        """Get daily close data for all indexes in the landing zone.
+        Incremental requests overlap, so each date keeps the latest observation.
+        """
 
+        landing_zone = LandingZone(self.settings)
+        # {index: {date: observation}}
+        observations: dict[str, dict] = {}
+        for url, _, resp in landing_zone.read("fred", "index_daily_close"):
+            index = re.findall(r"series_id=([^&]+)", url)[0]
+            # Series of other pipelines share the endpoint
+            if index not in self.indexes:
+                continue
+            for observation in resp.get("observations") or []:
+                observations.setdefault(index, {})[observation["date"]] = observation
+
+        for index, index_observations in observations.items():
+            self.logger.info(f"{index=} | Results: {len(index_observations)}")
+        self.write_observations({k: list(v.values()) for k, v in observations.items()})
+
+    def write_observations(self, observations: dict[str, list[dict]]) -> None:
+        """Write observations of all indexes to the temp file, as one batch.
+        Values are cast to numbers at once by DuckDB, missing values (e.g. ".") are nulls.
+
+        observations -- {index: observations}
+        """
+
+        self.output["file_path"] = self.file_path
+        rows = [
+            [observation["date"], index, observation["value"]]
+            for index, index_observations in observations.items()
+            for observation in index_observations
+        ]
+        if not rows:
+            return
         updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        enriched_data = []
-        for index_dict in data:
-            enriched_index_dict = {}
-            enriched_index_dict["date"] = index_dict["date"]
-            enriched_index_dict["index"] = index
-            if re.search(r"\d", index_dict["value"]):
-                enriched_index_dict["value"] = float(index_dict["value"])
-            else:
-                enriched_index_dict["value"] = None
-            enriched_index_dict["updated_at"] = updated_at
-            enriched_data.append(enriched_index_dict)
-
-        return enriched_data
+        # Rows are passed as one JSON parameter, like StepBuffer
+        conn = duckdb.connect()
+        conn.execute(
+            f'COPY (SELECT row[1] AS date, row[2] AS "{self.series_field}", '
+            "TRY_CAST(row[3] AS DOUBLE) AS value, ?::VARCHAR AS updated_at "
+            """FROM (SELECT UNNEST(from_json(?, '[["VARCHAR"]]')) AS row)) """
+            f"TO '{self.file_path}' (FORMAT csv, HEADER)",
+            [updated_at, json.dumps(rows)],
+        )
+        conn.close()
 
     def run(self):
         """Run step."""
-        for index in self.indexes:
-            self.get_index_daily_close(index)
+
+        if self.settings.replay:
+            self.replay_index_daily_close()
+            return True, self.output
+
+        self.get_index_daily_close()
 
         return True, self.output
@@ -1,45 +1,39 @@
-# Standard library
-
 # Standard library
 from datetime import datetime
-from typing import Any, Dict, List
-
-# Third party
-from bs4 import BeautifulSoup
+from typing import Any, Dict, List, Optional
 
 # Local
 from ....abstract.step import Step
 from ....settings import Settings
 from ....utils.csv_handler import append_to_file, clean_temp_file
+from ....utils.html_table import read_html_table
 
 
 class SP500Transformer(Step):
-    """Transform html SP500 table into csv."""
+    """Transform html SP500 table into csv.
+    Replayed page snapshots are all transformed, updated_at is the time of each snapshot.
+    """
 
     def __init__(self, previous_output: dict, settings: Settings):
         """Init class."""
         super(SP500Transformer, self).__init__(__name__, previous_output, settings)
 
-        self.file_path: str = self.previous_output["file_path"]
+        self.snapshots: List[Dict] = self.previous_output["snapshots"]
         self.pipeline: str = self.settings.pipeline
         self.pipeline_table: Dict[str, Any] = self.settings.PIPELINE_TABLE
         self.fields_mapping: Dict = self.pipeline_table["fields_mapping"]
         self.required_fields: list = self.pipeline_table["required_fields"]
 
-    def get_bs4_element(self) -> BeautifulSoup:
-        """Read the txt html and parse with BeautifulSoup."""
+    def read_html(self, file_path: str) -> str:
+        """Read the txt html."""
 
-        with open(self.file_path, "r") as f:
-            html = f.read()
-        return BeautifulSoup(html, "html.parser")
+        with open(file_path, "r") as f:
+            return f.read()
 
-    def check_header(self, bs_table: BeautifulSoup):
+    def check_header(self, header: List[str]) -> List[str]:
         """Return header.
         Check if header matches expectation.
         """
-        header = [
-            i.text.replace("\n", "").strip() for i in bs_table.find_all("tr")[0].find_all("th")
-        ]
         expected_header = [
             "Symbol",
             "Security",
@@ -59,30 +53,25 @@ class SP500Transformer(Step):
             self.logger.info("Header according to expected.")
             return header
 
-    def get_sp500_table(self, bs: BeautifulSoup) -> tuple[List[Dict], List[str]]:
-        """Extract sp500 table from bs element."""
+    def get_sp500_table(
+        self, html: str, fetched_at: Optional[str] = None
+    ) -> tuple[List[Dict], List[str]]:
+        """Extract sp500 table from the page html.
+        fetched_at -- isoformat time of the page snapshot, updated_at of rows. Default now.
+        """
 
-        s_p_500_table = bs.find_all("table", {"class": "wikitable sortable sticky-header"})[0]
-        header = self.check_header(s_p_500_table)
+        table_header, columns, skipped_rows = read_html_table(
+            html, "wikitable sortable sticky-header", link_class="external text"
+        )
+        if skipped_rows:
+            self.logger.warning(f"Skipped {skipped_rows} rows not matching the table header.")
+        header = self.check_header(table_header)
         # Extra fields
-        header.append("url")
-
-        rows = []
-        c = 0
-        for tr in s_p_500_table.find_all("tr"):
-            row = [td.text.replace("\n", "").strip() for td in tr.find_all("td")]
-            try:
-                ticker_url = tr.find_all("a", {"class": "external text"}, href=True)[0].get("href")
-            except Exception as e:
-                ticker_url = f"not_found. {e=}"
-
-            if row and len(row) == 8:
-                row.append(ticker_url)
-                dict_row = {k: v for k, v in zip(header, row)}
-                dict_row["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                rows.append(dict_row)
-            c += 1
-        header.append("updated_at")
+        header += ["url", "updated_at"]
+        snapshot_time = datetime.fromisoformat(fetched_at).astimezone() if fetched_at else None
+        updated_at = (snapshot_time or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        # Columns in table order, the url column is last
+        rows = [dict(zip(header, (*row, updated_at))) for row in zip(*columns.values())]
 
         return rows, header
 
@@ -90,10 +79,12 @@ class SP500Transformer(Step):
         """Run validation step."""
 
         self.output["file_path"] = "temp/sp500_company_details_temp.csv"
-        bs_element = self.get_bs4_element()
-        sp500_table, header = self.get_sp500_table(bs_element)
-        append_to_file(self.output["file_path"], sp500_table, header)
-        if clean_file:  # pragma: no cover
-            clean_temp_file(self.previous_output["file_path"])
+        self.output["page_revisions"] = self.previous_output.get("page_revisions", [])
+        for snapshot in self.snapshots:
+            html = self.read_html(snapshot["file_path"])
+            sp500_table, header = self.get_sp500_table(html, snapshot["fetched_at"])
+            append_to_file(self.output["file_path"], sp500_table, header)
+            if clean_file:  # pragma: no cover
+                clean_temp_file(snapshot["file_path"])
 
         return True, self.output
@@ -1,19 +1,24 @@
 # Standard library
 import random
-from datetime import datetime
+from typing import Collection, Iterator
 
 # Local
 from ....abstract.client import Client
 from ....abstract.step import Step
 from ....clients.polygon import Polygon
 from ....settings import Settings
+from ....utils.batch_enrich import enrich_batch
 from ....utils.csv_handler import append_to_file
+from ....utils.landing_zone import LandingZone
+from ....utils.run_journal import RunJournal
 from ....utils.sql_handler import SQLHandler
 
 
 class TickerBasicDetailsExtractor(Step):
     """Extract daily data from polygon API."""
 
+    supports_streaming = True
+
     def __init__(self, previous_output: dict, settings: Settings, client: Client):
         """Initiate clients and settings.
 
@@ -27,28 +32,29 @@ class TickerBasicDetailsExtractor(Step):
         self.max_days_hist = self.settings.POLYGON["POLYGON_MAX_DAYS_HIST"]
         self.base_url = self.settings.POLYGON["BASE_URL"]
         self.endpoints = self.settings.POLYGON["ENDPOINTS"]
+        self.journal = RunJournal(settings)
 
-    def get_required_tickers(self) -> tuple[list[str], list[str]]:
-        """Return required tickers list.
-        required = registered in STOCK_DAILY_PRICES table minus registered in STOCK_COMPANY_DETAILS.
-        Query SQLite DB defined in src.settings.
+    def get_required_tickers(self) -> tuple[set[str], set[str]]:
+        """Return required and registered tickers sets.
+        required = registered in STOCK_DAILY_PRICES table minus registered in STOCK_COMPANY_DETAILS,
+        queried as an anti-join. Query SQLite DB defined in src.settings.
         """
 
-        _, all_tickers = self.sqlite_client.query(
-            "SELECT DISTINCT(exchange_symbol) FROM BRONZE_LAYER.STOCK_DAILY_PRICES"
+        _, required_tickers = self.sqlite_client.query(
+            "SELECT DISTINCT(p.exchange_symbol) FROM BRONZE_LAYER.STOCK_DAILY_PRICES p "
+            "WHERE NOT EXISTS (SELECT 1 FROM BRONZE_LAYER.STOCK_COMPANY_DETAILS d "
+            "WHERE d.exchange_symbol = p.exchange_symbol)"
         )
-
         _, registered_tickers = self.sqlite_client.query(
             "SELECT DISTINCT(exchange_symbol) FROM BRONZE_LAYER.STOCK_COMPANY_DETAILS"
         )
-        registered_tickers_list = [r[0] for r in registered_tickers]
-        required_tickers = [t[0] for t in all_tickers if t[0] not in registered_tickers_list]
+        required_tickers_set = {r[0] for r in required_tickers}
+        registered_tickers_set = {r[0] for r in registered_tickers}
         self.logger.info(
-            f"all_tickers: {len(all_tickers)} | "
-            f"registered_tickers: {len(registered_tickers_list)} | "
-            f"required_tickers: {len(required_tickers)}"
+            f"registered_tickers: {len(registered_tickers_set)} | "
+            f"required_tickers: {len(required_tickers_set)}"
         )
-        return required_tickers, registered_tickers_list
+        return required_tickers_set, registered_tickers_set
 
     def _get_initial_url(self):
         """Build initial url request with random sorting order."""
@@ -79,7 +85,7 @@ class TickerBasicDetailsExtractor(Step):
         return initial_url
 
     def update_stock_company_details(
-        self, required_tickers: list[str], registered_tickers: list[str]
+        self, required_tickers: Collection[str], registered_tickers: Collection[str]
     ):
         """Update missing tickers in STOCK_COMPANY_DETAILS table.
 
@@ -87,26 +93,57 @@ class TickerBasicDetailsExtractor(Step):
         registered_tickers -- Existing tickers
         """
 
-        polygon_client = Polygon(self.settings)
-
         file_path = "temp/stock_company_details_temp.csv"
         self.output["file_path"] = file_path
         header = list(self.settings.PIPELINE_TABLE["fields_mapping"].keys())
-        api_call_count, row_count = 0, 0
+        for enriched_data in self.get_pages(required_tickers, registered_tickers):
+            append_to_file(file_path, enriched_data, header)
+
+    def stream(self) -> Iterator[dict]:
+        """Yield one file by page of tickers, so it is loaded while next pages are requested."""
+
+        required_tickers, registered_tickers = self.get_required_tickers()
+        if not required_tickers:
+            self.logger.info("No missing tickers. Nothing to stream.")
+            return
+        header = list(self.settings.PIPELINE_TABLE["fields_mapping"].keys())
+        pages = self.get_pages(required_tickers, registered_tickers)
+        for page, enriched_data in enumerate(pages):
+            file_path = f"temp/stock_company_details_temp_{page}.csv"
+            append_to_file(file_path, enriched_data, header)
+            yield {"file_path": file_path}
+
+    def get_pages(
+        self, required_tickers: Collection[str], registered_tickers: Collection[str]
+    ) -> Iterator[list[dict]]:
+        """Yield enriched details of missing tickers, by page of results.
+        The next_url cursor is journaled once a page is flushed, a resumed run continues from it.
+
+        required_tickers -- Missing tickers
+        registered_tickers -- Existing tickers
+        """
 
-        initial_url = self._get_initial_url()
+        polygon_client = Polygon(self.settings)
+        api_call_count, row_count = 0, 0
+        # Sets, membership is checked for each ticker of each page
+        remaining_tickers, registered_tickers = set(required_tickers), set(registered_tickers)
+
+        cursor = self.journal.get_cursor("next_url")
+        if cursor:
+            self.logger.info("Resumed run: continuing from the last flushed page")
+        initial_url = cursor or self._get_initial_url()
+        # Pages are chained by the next_url cursor, so they are requested one at a time
         result = polygon_client.request(initial_url)
-        while required_tickers:
+        while remaining_tickers:
             api_call_count += 1
             data = result.get("results")
             if data:
                 # filter registered
                 required_data = [t for t in data if t["ticker"] not in registered_tickers]
                 # Update requirements
-                tickers = [t.get("ticker") for t in data]
-                required_tickers = [r for r in required_tickers if r not in tickers]
+                remaining_tickers.difference_update(t.get("ticker") for t in data)
                 self.logger.debug(
-                    f"required_tickers: {len(required_tickers)} "
+                    f"required_tickers: {len(remaining_tickers)} "
                     f"data: {len(data)} "
                     f"required_data: {len(required_data)}"
                 )
@@ -115,11 +152,11 @@ class TickerBasicDetailsExtractor(Step):
                 required_data = None
 
             if required_data:
-                enriched_data = self._raw_enrich(required_data)
-                append_to_file(file_path, enriched_data, header)
                 row_count += len(required_data)
+                yield self._raw_enrich(required_data)
             # Next page
             next_url = result.get("next_url")
+            self.journal.set_cursor("next_url", next_url)
             if not next_url:  # pragma: no cover
                 self.logger.info("next_url not found.")
                 break
@@ -130,21 +167,39 @@ class TickerBasicDetailsExtractor(Step):
 
         self.logger.info(f"Update Finished. {api_call_count=} {row_count=}")
 
-    def _raw_enrich(self, data: list[dict]) -> list[dict]:
-        """initial enrichment."""
+    def replay_stock_company_details(self):
+        """Get details of all tickers in the landing zone.
+        Tickers found in many pages keep the latest details.
+        """
 
-        enriched_data = []
-        for stock_dict in data:
-            enriched_stock_dict = stock_dict.copy()
-            # Add extra fields
-            enriched_stock_dict["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            enriched_data.append(enriched_stock_dict)
+        landing_zone = LandingZone(self.settings)
+        file_path = "temp/stock_company_details_temp.csv"
+        header = list(self.settings.PIPELINE_TABLE["fields_mapping"].keys())
+        tickers_details = {}
+        for _, _, result in landing_zone.read("polygon", "stock_company_details_endpoint"):
+            for ticker_details in result.get("results") or []:
+                tickers_details[ticker_details["ticker"]] = ticker_details
 
-        return enriched_data
+        if not tickers_details:  # pragma: no cover
+            self.output["file_path"] = "no_file_flagg"
+            return
+        self.output["file_path"] = file_path
+        enriched_data = self._raw_enrich(list(tickers_details.values()))
+        append_to_file(file_path, enriched_data, header)
+        self.logger.info(f"Replay Finished. row_count={len(enriched_data)}")
+
+    def _raw_enrich(self, data: list[dict]) -> list[dict]:
+        """initial enrichment, by batch."""
+
+        return enrich_batch(data)
 
     def run(self):
         """Run step."""
 
+        if self.settings.replay:
+            self.replay_stock_company_details()
+            return True, self.output
+
         required_tickers, registered_tickers = self.get_required_tickers()
         if not required_tickers:  # pragma: no cover
             self.output["file_path"] = "no_file_flagg"
@@ -1,18 +1,25 @@
 # Standard library
+import re
 from datetime import datetime, timedelta
+from typing import Iterator
 
 # Local
 from ....abstract.client import Client
 from ....abstract.step import Step
 from ....clients.polygon import Polygon
 from ....settings import Settings
-from ....utils.csv_handler import append_to_file
+from ....utils.batch_enrich import enrich_batch
+from ....utils.landing_zone import LandingZone
+from ....utils.market_calendar import get_trading_days
 from ....utils.sql_handler import SQLHandler
+from ....utils.step_buffer import append_rows, new_output
 
 
 class StockDailyPriceExtractor(Step):
     """Extract daily data from polygon API."""
 
+    supports_streaming = True
+
     def __init__(self, previous_output: dict, settings: Settings, client: Client):
         """Initiate clients and settings.
 
@@ -21,34 +28,42 @@ class StockDailyPriceExtractor(Step):
         super(StockDailyPriceExtractor, self).__init__(__name__, previous_output, settings)
 
         self.settings = settings
-        self.sqlite_client = SQLHandler(self.settings, client)
+        self.sql_handler = SQLHandler(self.settings, client)
         self.max_days_hist = self.settings.POLYGON["POLYGON_MAX_DAYS_HIST"]
         self.base_url = self.settings.POLYGON["BASE_URL"]
         self.endpoints: dict = self.settings.POLYGON["ENDPOINTS"]
+        self.file_path = "temp/stock_daily_prices_temp.csv"
+        self.fields_mapping: dict = self.settings.PIPELINE_TABLE["fields_mapping"]
+
+    def get_loaded_dates(self, start_date: str) -> set[str]:
+        """Return distinct dates [%Y-%m-%d] loaded since start_date, read from the date index."""
+
+        _, result = self.sql_handler.query(
+            f"SELECT DISTINCT date FROM {self.sql_handler.schema.table_name} "
+            f"WHERE date >= '{start_date}'"
+        )
+        return {str(row[0])[:10] for row in result}
 
-    def get_last_date(self) -> str:
-        """Return max date [%Y-%m-%d] for stock_daily_prices table.
-        Query SQLite DB defined in src.settings.
+    def plan_request_dates(self) -> list[str]:
+        """Return trading days to request, in BACKFILL_ORDER (newest or oldest first).
+        Trading days of the API history (POLYGON_MAX_DAYS_HIST days until POLYGON_UPDATE_UNTIL)
+        not loaded yet: new days and gaps in history. Weekends and NYSE holidays are skipped.
         """
-        table_name = (
-            self.settings.PIPELINE_TABLE["schema"] + "." + self.settings.PIPELINE_TABLE["name"]
+
+        update_until = self.settings.POLYGON["POLYGON_UPDATE_UNTIL"]
+        start_date = (
+            datetime.strptime(update_until, "%Y-%m-%d") - timedelta(days=self.max_days_hist)
+        ).strftime("%Y-%m-%d")
+        trading_days = get_trading_days(start_date, update_until)
+        request_dates = sorted(
+            set(trading_days) - self.get_loaded_dates(start_date),
+            reverse=self.settings.POLYGON["BACKFILL_ORDER"] == "newest",
+        )
+        self.logger.info(
+            f"Fetch plan: {len(request_dates)} of {len(trading_days)} trading days missing. "
+            f"{start_date=} {update_until=}"
         )
-        is_successful, last_date = self.sqlite_client.query(f"SELECT MAX(DATE) FROM {table_name}")
-
-        last_update_date = last_date[0][0] if last_date else None
-        if is_successful and last_update_date:  # pragma: no cover
-            if isinstance(last_update_date, datetime):
-                last_update_date = last_update_date.strftime("%Y-%m-%d")
-            return last_update_date
-        else:  # pragma: no cover
-            max_hist_available = (
-                datetime.today() - timedelta(days=self.max_days_hist + 1)
-            ).strftime("%Y-%m-%d")
-            if last_date:
-                return max_hist_available
-            else:
-                self.logger.info(f"Table {table_name} empty.")
-                return max_hist_available
+        return request_dates
 
     def build_request(self, request_date) -> str:
         """Return url to request daily open, high, low, and close (OHLC).
@@ -64,67 +79,77 @@ class StockDailyPriceExtractor(Step):
         )
         return url
 
-    def get_stock_daily_prices(self, last_date: str, avoid_weeknds: bool = True):
+    def get_stock_daily_prices(self, request_dates: list[str]):
         """Get grouped daily datafor STOCK_DAILY_PRICES table.
 
-        last_date -- last date updated(format yyyy-mm-dd)
-        end_date -- end of period (format yyyy-mm-dd)
+        request_dates -- dates to request (format yyyy-mm-dd), from plan_request_dates.
         """
 
         polygon_client = Polygon(self.settings)
-        date_obj = datetime.strptime(last_date, "%Y-%m-%d")
-        request_date = (date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
 
-        file_path = "temp/stock_daily_prices_temp.csv"
-        self.output["file_path"] = file_path
+        self.output.update(new_output(self.settings, self.file_path, self.fields_mapping))
         api_call_count, row_count = 0, 0
-        while request_date != self.settings.POLYGON["POLYGON_UPDATE_UNTIL"]:
-            if not avoid_weeknds or not self._is_weekend(request_date):
-                url = self.build_request(request_date)
-                result = polygon_client.request(url)
-                data = result.get("results")
-                if data:
-                    row_count += result.get("resultsCount", 0)
-                    self.logger.info(f"{row_count=}")
-                    enriched_data = self._raw_enrich(data, request_date)
-                    append_to_file(file_path, enriched_data)
-            date_obj = datetime.strptime(request_date, "%Y-%m-%d")
-            request_date = (date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
-            self.logger.info(f"Request Successful. {request_date=}")
+        urls = (self.build_request(request_date) for request_date in request_dates)
+        # Requests are dispatched concurrently, results arrive in plan order
+        for request_date, result in zip(request_dates, polygon_client.request_many(urls)):
+            row_count += self.process_result(result, request_date, self.output)
+            self.logger.info(f"Request Successful. {request_date=} {row_count=}")
             api_call_count += 1
         self.logger.info(f"Update Finished. {api_call_count=} {row_count=}")
 
-    def _raw_enrich(self, data: list[dict], request_date: str) -> list[dict]:
-        """initial enrichment."""
-
-        enriched_data = []
-        for stock_dict in data:
-            enriched_stock_dict = stock_dict.copy()
-            # int timestamp to datetime
-            enriched_stock_dict["t"] = datetime.utcfromtimestamp(stock_dict["t"] / 1000)
-            # Add extra filds
-            enriched_stock_dict["date"] = request_date
-            enriched_stock_dict["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            enriched_data.append(enriched_stock_dict)
-
-        return enriched_data
-
-    def _is_weekend(self, date: str) -> bool:
-        """Check if string date is weekend.
-        date -- format yyyy-mm-dd
+    def stream(self) -> Iterator[dict]:
+        """Yield one file by trading day, so it is loaded while next days are requested."""
+
+        request_dates = self.plan_request_dates()
+        polygon_client = Polygon(self.settings)
+        urls = (self.build_request(request_date) for request_date in request_dates)
+        for request_date, result in zip(request_dates, polygon_client.request_many(urls)):
+            output = new_output(
+                self.settings,
+                self.file_path.replace(".csv", f"_{request_date}.csv"),
+                self.fields_mapping,
+            )
+            row_count = self.process_result(result, request_date, output)
+            self.logger.info(f"Request Successful. {request_date=} {row_count=}")
+            if row_count:
+                yield output
+
+    def replay_stock_daily_prices(self):
+        """Get grouped daily data for STOCK_DAILY_PRICES table from the landing zone."""
+
+        landing_zone = LandingZone(self.settings)
+        self.output.update(new_output(self.settings, self.file_path, self.fields_mapping))
+        row_count = 0
+        responses = landing_zone.read("polygon", "stock_daily_prices_endpoint")
+        for url, _, result in responses:
+            request_date = re.findall(r"(\d{4}-\d{2}-\d{2})\?", url)[0]
+            row_count += self.process_result(result, request_date, self.output)
+        self.logger.info(f"Replay Finished. {row_count=}")
+
+    def process_result(self, result: dict, request_date: str, output: dict) -> int:
+        """Enrich grouped daily result and append to output rows. Return number of rows.
+        output -- from step_buffer.new_output.
         """
 
-        data_obj = datetime.strptime(date, "%Y-%m-%d")
-        if data_obj.weekday() in [5, 6]:
-            return True
-        else:
-            return False
+        data = result.get("results")
+        if not data:
+            return 0
+        enriched_data = self._raw_enrich(data, request_date)
+        append_rows(output, enriched_data)
+        return len(data)
+
+    def _raw_enrich(self, data: list[dict], request_date: str) -> list[dict]:
+        """initial enrichment, by batch: int timestamp to datetime and extra fields."""
+
+        return enrich_batch(data, {"date": request_date}, timestamp_fields=("t",))
 
     def run(self):
         """Run step."""
 
-        last_update_date = self.get_last_date()
-        self.logger.info(f"{last_update_date=}")
-        self.get_stock_daily_prices(last_update_date)
+        if self.settings.replay:
+            self.replay_stock_daily_prices()
+            return True, self.output
+
+        self.get_stock_daily_prices(self.plan_request_dates())
 
         return True, self.output
@@ -8,7 +8,18 @@ from typing_extensions import Annotated
 # Local
 from .factories.pipeline_factory import PipelineFactory
 from .settings import Settings
-from .utils.constants import PIPELINES, SCOPE_HELP_TEXT, SKIP_HELP_TEXT, SUB_SCOPE_HELP_TEXT
+from .utils.constants import (
+    MAX_PARALLEL_HELP_TEXT,
+    PIPELINES,
+    REPLAY_HELP_TEXT,
+    RESUME_HELP_TEXT,
+    SCOPE_HELP_TEXT,
+    SKIP_HELP_TEXT,
+    STREAMING_HELP_TEXT,
+    SUB_SCOPE_HELP_TEXT,
+)
+from .utils.get_logger import get_logger
+from .utils.pipeline_scheduler import PipelineScheduler
 
 app = typer.Typer()
 
@@ -18,6 +29,10 @@ def run(
     scope: Annotated[str, typer.Argument(help=SCOPE_HELP_TEXT)],
     sub_scope: Annotated[Optional[str], typer.Option(help=SUB_SCOPE_HELP_TEXT)] = None,
     skip: Annotated[Optional[str], typer.Option(help=SKIP_HELP_TEXT)] = None,
+    replay: Annotated[bool, typer.Option(help=REPLAY_HELP_TEXT)] = False,
+    streaming: Annotated[bool, typer.Option(help=STREAMING_HELP_TEXT)] = False,
+    max_parallel: Annotated[int, typer.Option(help=MAX_PARALLEL_HELP_TEXT, min=1)] = 4,
+    resume: Annotated[bool, typer.Option(help=RESUME_HELP_TEXT)] = False,
 ):
     """Run app.
     Try 'python -m src.run --help' for help.
@@ -25,11 +40,28 @@ def run(
 
     pipelines_scope = validate_and_get_scope(scope, sub_scope)
     filtered_pipeline_scope = filter_skip(pipelines_scope, skip)
-    for pipeline_name in filtered_pipeline_scope:
-        settings = Settings(pipeline_name)
-        pipeline_factory = PipelineFactory(settings)
-        pipeline = pipeline_factory.create()
-        pipeline.run()
+    if not filtered_pipeline_scope:
+        raise typer.BadParameter("All pipelines in scope are skipped.")
+    # Logging settings are the same for all pipelines, scheduler logs are bound to the scope
+    settings = Settings(filtered_pipeline_scope[0])
+    logger = get_logger(__name__, settings).bind(pipeline=",".join(filtered_pipeline_scope))
+    # Pipelines share the API clients, so Polygon rate limit is a global budget
+    scheduler = PipelineScheduler(filtered_pipeline_scope, max_parallel, logger)
+    scheduler.run(lambda pipeline_name: run_pipeline(pipeline_name, replay, streaming, resume))
+
+
+def run_pipeline(
+    pipeline_name: str, replay: bool = False, streaming: bool = False, resume: bool = False
+):
+    """Create and run pipeline."""
+
+    settings = Settings(pipeline_name)
+    settings.replay = replay
+    settings.streaming = streaming
+    settings.resume = resume
+    pipeline_factory = PipelineFactory(settings)
+    pipeline = pipeline_factory.create()
+    pipeline.run()
 
 
 def validate_and_get_scope(scope: str, sub_scope: Optional[str]) -> tuple:
@@ -1,14 +1,27 @@
 # Standard library
+import copy
 import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Local
 from .exceptions import InvalidClientError, InvalidPipelineError
 from .utils.constants import AVAILABLE_CLIENTS, PIPELINES
 
+# database_config.json, read once by process
+_TABLES_CONFIG: Dict[str, Any] = {}
+
+
+def load_tables_config() -> Dict[str, Any]:
+    """Return a copy of database_config.json, read from disk on first call."""
+
+    if not _TABLES_CONFIG:
+        with open("src/database_config.json", "r") as file:
+            _TABLES_CONFIG.update(json.load(file))
+    return copy.deepcopy(_TABLES_CONFIG)
+
 
 class Settings:
     """Handles settings through the application."""
@@ -18,6 +31,13 @@ class Settings:
 
         self.LOGGING_LEVEL = logging.INFO
         self.is_integration_test = False
+        # Rebuild tables from the landing zone, without API calls
+        self.replay = False
+        # Run steps as a stream of micro-batches, see STREAMING
+        self.streaming = False
+        # Resume the latest unfinished run of the pipeline, see RUN_JOURNAL
+        self.resume = False
+        self.run_id: Optional[str] = None
         # Pipeline and step settings
         if pipeline not in PIPELINES.get_all_pipelines():  # pragma: no cover
             raise InvalidPipelineError(pipeline)
@@ -25,8 +45,7 @@ class Settings:
         self.step_name = None  # Placeholder
 
         # Database settings
-        with open("src/database_config.json", "r") as file:
-            self.TABLES: Dict[str, Any] = json.load(file)
+        self.TABLES: Dict[str, Any] = load_tables_config()
         self.PIPELINE_TABLE = self.TABLES[pipeline]
 
         # Client settings
@@ -34,7 +53,14 @@ class Settings:
             "SQLITE": {
                 "DB_PATH": os.getenv("DB_PATH", "") + "stock_database.db",
                 "CHUNK_SIZE": 50000,
+                # Seconds to wait for a lock, pipelines running in parallel share the db
+                "TIMEOUT": 300,
                 "PARAMETER_PLACEHOLDER": "?, ",
+                # Equality operator matching NULLs, usable by indexes
+                "NULL_SAFE_EQUAL": "IS",
+                "CREATE_INDEX": (
+                    "CREATE INDEX IF NOT EXISTS {schema}.{index_name} ON {table} ({columns})"
+                ),
             },
             "POSTGRES": {
                 "POSTGRES_USER": os.getenv("POSTGRES_USER"),
@@ -43,6 +69,10 @@ class Settings:
                 "POSTGRES_HOST": os.getenv("POSTGRES_HOST"),
                 "CHUNK_SIZE": 50000,
                 "PARAMETER_PLACEHOLDER": r"%s, ",
+                "NULL_SAFE_EQUAL": "IS NOT DISTINCT FROM",
+                "CREATE_INDEX": (
+                    "CREATE INDEX IF NOT EXISTS {index_name} ON {schema}.{table} ({columns})"
+                ),
                 "TYPE_MAPPING": {
                     "VARCHAR(255)": "text",
                     "FLOAT": "float",
@@ -52,6 +82,22 @@ class Settings:
                     "BOOLEAN": "bool",
                 },
             },
+            "DUCKDB": {
+                "DB_PATH": os.getenv("DB_PATH", "") + "stock_database.duckdb",
+                "CHUNK_SIZE": 50000,
+                "PARAMETER_PLACEHOLDER": "?, ",
+                "NULL_SAFE_EQUAL": "IS NOT DISTINCT FROM",
+                # No indexes, zone maps of data loaded in sort_key order speed up scans
+                "CREATE_INDEX": None,
+                "TYPE_MAPPING": {
+                    "VARCHAR(255)": "VARCHAR",
+                    "FLOAT": "DOUBLE",
+                    "DATETIME": "TIMESTAMP",
+                    "DATE": "DATE",
+                    "INTEGER": "BIGINT",
+                    "BOOLEAN": "BOOLEAN",
+                },
+            },
         }
 
         # Get current client config
@@ -60,6 +106,55 @@ class Settings:
             raise InvalidClientError(self.CLIENT)
         self.CLIENT_CONFIG = self.CLIENTS_CONFIG[self.CLIENT]
 
+        # HTTP settings, shared by all API clients
+        self.HTTP: dict = {
+            # Max open connections per host
+            "MAX_CONNECTIONS": 10,
+            "MAX_RETRIES": 3,
+            # Seconds to wait before retrying a failed request
+            "RETRY_WAIT": 5,
+        }
+        # API responses cache. TTLs are defined by endpoint in each API settings.
+        self.RESPONSE_CACHE: dict = {
+            "ENABLED": os.getenv("RESPONSE_CACHE", "true").lower() == "true",
+            "DIRECTORY": "temp/response_cache",
+            "MAX_SIZE_MB": 2048,
+        }
+        # Raw API responses, used to rebuild tables in replay mode
+        self.LANDING_ZONE: dict = {
+            "ENABLED": os.getenv("LANDING_ZONE", "true").lower() == "true",
+            "DIRECTORY": os.getenv("LANDING_ZONE_PATH", "landing"),
+            # Responses fetched at once when reading
+            "READ_CHUNK_SIZE": 100,
+        }
+
+        # Staging of rows handed over between steps
+        self.STEP_BUFFER: dict = {
+            # memory (spilled to Parquet files), parquet (by row group) or csv (temp csv files)
+            "FORMAT": os.getenv("STAGING_FORMAT", "memory").lower(),
+            # Rows kept in memory, above it they are spilled to Parquet files
+            "SPILL_ROWS": 500000,
+            # Rows by Parquet row group (DuckDB default), flushed at once with parquet format
+            "ROW_GROUP_ROWS": 122880,
+            "COMPRESSION": "zstd",
+            "DIRECTORY": "temp",
+        }
+        # Data quality rules, violations summary written by loaders
+        self.DATA_QUALITY: dict = {
+            # Violating rows kept by rule in the summary
+            "SAMPLE_ROWS": 5,
+        }
+        # Checkpoints of pipeline runs, to resume them where they stopped
+        self.RUN_JOURNAL: dict = {
+            "ENABLED": os.getenv("RUN_JOURNAL", "true").lower() == "true",
+            "DB_PATH": "temp/run_journal.db",
+        }
+        # Streaming mode, batches are handed over between steps through bounded queues
+        self.STREAMING: dict = {
+            # Max batches waiting between two steps, lost if the run crashes
+            "MAX_QUEUED_BATCHES": 1,
+        }
+
         # Polygon API settings
         self.POLYGON: dict = {
             "BASE_URL": "https://api.polygon.io/",
@@ -69,15 +164,50 @@ class Settings:
                 "financials_endpoint": "vX/reference/financials?",
             },
             "POLYGON_MAX_DAYS_HIST": 730,
-            "POLYGON_CALLS_PER_MIN": 5,
+            # Rate limit of the API plan. Free plan: 5 calls per minute.
+            "POLYGON_CALLS_PER_MIN": int(os.getenv("POLYGON_CALLS_PER_MIN", 5)),
+            # Max calls allowed at once. Keep 1 to space calls evenly on the free plan.
+            "POLYGON_BURST": int(os.getenv("POLYGON_BURST", 1)),
+            # Optional limits by endpoint, e.g. {"financials_endpoint": {"CALLS_PER_MIN": 5, "BURST": 1}}
+            "ENDPOINT_LIMITS": {},
+            # Max concurrent requests
+            "MAX_WORKERS": int(os.getenv("POLYGON_MAX_WORKERS", 4)),
             "MAX_PAGINATION": 5,
+            # Financials filings requested: incremental (after the table last end date) or full
+            "FINANCIALS_FETCH_MODE": os.getenv("FINANCIALS_FETCH_MODE", "incremental"),
+            # Source filings links, not mapped to any table
+            "FINANCIALS_INCLUDE_SOURCES": os.getenv("FINANCIALS_INCLUDE_SOURCES", "false"),
+            # Response cache TTL in seconds. None never expires, missing endpoints are not cached.
+            "CACHE_TTL": {
+                # Grouped daily bars of past dates never change
+                "stock_daily_prices_endpoint": None,
+                "stock_company_details_endpoint": 24 * 3600,
+                "financials_endpoint": 24 * 3600,
+            },
             # Free API allows calls only until the end of the previous day
             "POLYGON_UPDATE_UNTIL": datetime.today().strftime("%Y-%m-%d"),
+            # Missing trading days requested first: newest, or oldest (backfill)
+            "BACKFILL_ORDER": os.getenv("BACKFILL_ORDER", "newest"),
+        }
+
+        # Wikipedia pages, extracted again only if their revision changed
+        self.WIKIPEDIA: dict = {
+            # Days between revision checks of a loaded page
+            "REFRESH_DAYS": int(os.getenv("WIKIPEDIA_REFRESH_DAYS", 1)),
         }
 
         # Fred API settings
         self.FRED: dict = {
             "BASE_URL": "https://api.stlouisfed.org/fred/",
             "INDEXES": ["SP500", "DJIA", "NASDAQ100", "NASDAQCOM", "DJTA", "DJCA", "DJUA"],
+            # Series of FRED_SERIES_OBSERVATIONS, with their frequency
+            "SERIES_CATALOG": os.getenv("FRED_SERIES_CATALOG", "src/fred_series_catalog.json"),
             "ENDPOINTS": {"index_daily_close": "series/observations?"},
+            # Rate limit of the API key: 120 calls per minute
+            "CALLS_PER_MIN": int(os.getenv("FRED_CALLS_PER_MIN", 120)),
+            "BURST": int(os.getenv("FRED_BURST", 10)),
+            # Max concurrent requests
+            "MAX_WORKERS": int(os.getenv("FRED_MAX_WORKERS", 8)),
+            # Response cache TTL in seconds. None never expires, missing endpoints are not cached.
+            "CACHE_TTL": {"index_daily_close": 12 * 3600},
         }
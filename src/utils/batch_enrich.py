@@ -0,0 +1,28 @@
+# Standard library
+from datetime import datetime, timedelta
+from typing import Optional
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def enrich_batch(
+    data: list[dict], fields: Optional[dict] = None, timestamp_fields: tuple[str, ...] = ()
+) -> list[dict]:
+    """Enrich a batch (e.g. API page) of results in place, column by column. Return data.
+    Rows are not copied, results are parsed from each response and not shared.
+
+    fields -- {field: value} added to every row. updated_at is added, once by batch.
+    timestamp_fields -- epoch millis fields, converted to UTC datetimes.
+    Each distinct timestamp is converted once (e.g. all grouped daily rows share it).
+    """
+
+    for field in timestamp_fields:
+        epochs = {row[field] for row in data if row.get(field) is not None}
+        datetimes = {epoch: EPOCH + timedelta(milliseconds=epoch) for epoch in epochs}
+        for row in data:
+            row[field] = datetimes.get(row.get(field))
+
+    columns = {**(fields or {}), "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    for row in data:
+        row.update(columns)
+    return data
@@ -0,0 +1,112 @@
+# Standard library
+import threading
+from queue import Queue
+from typing import Callable, Iterable, Optional
+
+# Local
+from .get_logger import get_logger
+from ..settings import Settings
+
+# Marks the end of the stream
+_DONE = object()
+
+
+class BatchStream:
+    """Run pipeline steps as a stream of micro-batches.
+
+    The producer yields one output by batch (e.g. one trading day file). Each step runs in
+    its own thread and batches are handed over through bounded queues, so validating and
+    loading a batch overlaps with (rate limited) extraction of the next ones.
+    Batches are loaded in order, each one on its own: a crash loses only the batches in flight.
+
+    steps -- steps run for each batch, in order.
+    max_queued_batches -- max batches waiting between two steps.
+    """
+
+    def __init__(self, settings: Settings, steps: list[str], max_queued_batches: int) -> None:
+        self.logger = get_logger(__name__, settings)
+        self.steps = steps
+        self.max_queued_batches = max_queued_batches
+
+    def run(
+        self,
+        batches: Iterable[dict],
+        run_step: Callable[[str, dict], dict],
+        close_step: Optional[Callable[[str], None]] = None,
+    ) -> int:
+        """Run steps for each batch with run_step(step_name, previous_output) -> output.
+        Return number of batches processed by all steps. Raise the first step error.
+
+        close_step -- called with step_name by the thread of the step once it finished, e.g. to
+        close its connections.
+        """
+
+        queues: list[Queue] = [Queue(maxsize=self.max_queued_batches) for _ in self.steps]
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        processed = [0]
+        threads = [
+            threading.Thread(
+                target=self._consume,
+                args=(step, run_step, queues[n], queues[n + 1] if n + 1 < len(queues) else None),
+                kwargs={
+                    "stop": stop,
+                    "errors": errors,
+                    "processed": processed,
+                    "close_step": close_step,
+                },
+                daemon=True,
+            )
+            for n, step in enumerate(self.steps)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for batch in batches:
+                # Stop extracting once a step failed
+                if stop.is_set():
+                    break
+                queues[0].put(batch)
+        finally:
+            queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        self.logger.info(f"Stream finished. batches={processed[0]}")
+        if errors:
+            raise errors[0]
+        return processed[0]
+
+    def _consume(
+        self,
+        step: str,
+        run_step: Callable[[str, dict], dict],
+        inbox: Queue,
+        outbox: Optional[Queue],
+        stop: threading.Event,
+        errors: list[BaseException],
+        processed: list[int],
+        close_step: Optional[Callable[[str], None]] = None,
+    ):
+        """Run step for each batch of inbox and pass its output to outbox.
+        After an error, batches are drained without running, so upstream never blocks.
+        """
+
+        while (batch := inbox.get()) is not _DONE:
+            if stop.is_set():
+                continue
+            try:
+                output = run_step(step, batch)
+            except BaseException as error:
+                self.logger.error(f"Step {step} failed. {error=}")
+                errors.append(error)
+                stop.set()
+                continue
+            if outbox is not None:
+                outbox.put(output)
+            else:
+                processed[0] += 1
+        if close_step is not None:
+            close_step(step)
+        if outbox is not None:
+            outbox.put(_DONE)
@@ -8,6 +8,7 @@ class Pipelines:
         "sp500-company-details-pipeline",
         "index-daily-close-pipeline",
         "financials-pipeline",
+        "fred-series-pipeline",
     )
     # Placeholder
     silver_layer = ()
@@ -23,11 +24,20 @@ class Pipelines:
             "sp500_financials_cash_flow": "financials-pipeline",
             "sp500_financials_income": "financials-pipeline",
             "sp500_financials_comprehensive_income": "financials-pipeline",
+            "fred_series_observations": "fred-series-pipeline",
         },
         "silver_layer": {},
         "gold_layer": {},
     }
 
+    # {pipeline: (pipelines it depends on)}
+    dependencies: dict[str, tuple] = {
+        # Tickers to get details from
+        "stock-company-details-pipeline": ("stock-daily-prices-pipeline",),
+        # Tickers to get financials data from
+        "financials-pipeline": ("sp500-company-details-pipeline",),
+    }
+
     @classmethod
     def get_all_pipelines(cls) -> tuple:
         """Get all pipelines for all layers."""
@@ -69,7 +79,7 @@ class Pipelines:
 
 PIPELINES = Pipelines()
 
-AVAILABLE_CLIENTS = ["SQLITE", "POSTGRES"]
+AVAILABLE_CLIENTS = ["SQLITE", "POSTGRES", "DUCKDB"]
 SCOPE_HELP_TEXT = (
     "Defines the update scope. Use 'table' to update a specific table "
     "or 'schema' to update all tables under the schema. To update all tables, use 'all'."
@@ -80,3 +90,28 @@ SUB_SCOPE_HELP_TEXT = (
 )
 
 SKIP_HELP_TEXT = "Table name. Use to skip the specified table update."
+REPLAY_HELP_TEXT = (
+    "Rebuild tables from the raw API responses stored in the landing zone, without API calls."
+)
+STREAMING_HELP_TEXT = (
+    "Load data in micro-batches (e.g. one trading day) while the next ones are extracted. "
+    "A failed run loses only the batches not loaded yet."
+)
+RESUME_HELP_TEXT = (
+    "Resume the latest unfinished run of each pipeline: completed dates and tickers are "
+    "served from the response cache, pagination continues from the last flushed page."
+)
+MAX_PARALLEL_HELP_TEXT = (
+    "Max pipelines running at once. Independent pipelines run concurrently, "
+    "dependent pipelines wait for their dependencies."
+)
+
+# database_config.json data types to DuckDB data types
+DUCKDB_TYPES = {
+    "VARCHAR(255)": "VARCHAR",
+    "FLOAT": "DOUBLE",
+    "INTEGER": "BIGINT",
+    "DATETIME": "TIMESTAMP",
+    "DATE": "DATE",
+    "BOOLEAN": "BOOLEAN",
+}
@@ -26,6 +26,13 @@ def append_to_file(file_path: str, data: List[Dict], header: Optional[List[str]]
             csv_writer.writerow(row)
 
 
+def read_header(file_path: str) -> list[str]:
+    """Return csv file header."""
+
+    with open(file_path, "r", newline="") as f:
+        return next(csv.reader(f))
+
+
 def clean_temp_file(file_path: str):
     """Delete temp file."""
 
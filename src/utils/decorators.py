@@ -1,10 +1,17 @@
+# Standard library
+import threading
+
+
 def singleton(class_):
     """Ensures only one instance of the class exists through the application."""
     instances = {}
+    lock = threading.Lock()
 
     def getinstance(*args, **kwargs):
-        if class_ not in instances:
-            instances[class_] = class_(*args, **kwargs)
+        # Pipelines run in parallel threads
+        with lock:
+            if class_ not in instances:
+                instances[class_] = class_(*args, **kwargs)
         return instances[class_]
 
     return getinstance
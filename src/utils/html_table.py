@@ -0,0 +1,165 @@
+# Standard library
+import re
+from html.parser import HTMLParser
+from typing import Optional
+
+
+def find_table(html: str, table_class: str, index: int = 0) -> str:
+    """Return html of the index-th table with class containing table_class.
+    The table is found by its tags, without parsing the rest of the page.
+    """
+
+    starts = [
+        m.start() for m in re.finditer(r'<table[^>]*class="[^"]*' + re.escape(table_class), html)
+    ]
+    if len(starts) <= index:
+        raise ValueError(f"Table {table_class=} {index=} not found. Tables found: {len(starts)}.")
+    # Skip nested tables up to the closing tag of the table
+    start, depth = starts[index], 0
+    for tag in re.finditer(r"<(/?)table\b", html[start:]):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = html.index(">", start + tag.end()) + 1
+            return html[start:end]
+    raise ValueError(f"Table {table_class=} {index=} is not closed.")
+
+
+class HTMLTableParser(HTMLParser):
+    """Streaming parser of a html table, text of its cells by row.
+
+    Cell text is the text of all its descendants (e.g. links, footnotes, nested tables),
+    without line breaks. Cells spanning rows or columns (rowspan, colspan) are repeated in
+    each row and column they cover. The leading rows of header cells (th) are the header,
+    a column name is the distinct names of its header rows (e.g. "Added Ticker").
+    Sub header rows, of header cells or a single cell spanning columns, are skipped.
+    link_class -- keep the href of the first link with this class of each row.
+    """
+
+    def __init__(self, link_class: Optional[str] = None):
+        """Init parser."""
+        super(HTMLTableParser, self).__init__(convert_charrefs=True)
+        self.link_class = link_class
+        self.header_rows: list[list[str]] = []
+        self.rows: list[list[str]] = []
+        self.links: list[Optional[str]] = []
+        self.skipped_rows = 0
+        self._table_depth = 0
+        self._row: list[str] = []
+        self._row_cells = 0
+        self._row_is_header = True
+        self._row_link: Optional[str] = None
+        self._cell: Optional[list[str]] = None
+        self._cell_span = (1, 1)
+        # {column: [rows left, text]} of cells spanning the next rows
+        self._row_spans: dict[int, list] = {}
+
+    @property
+    def header(self) -> list[str]:
+        """Return column names, the distinct names of each column in the header rows."""
+
+        header = []
+        for names in zip(*self.header_rows):
+            parts: list[str] = []
+            for name in names:
+                if name and (not parts or parts[-1] != name):
+                    parts.append(name)
+            header.append(" ".join(parts))
+        return header
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        """Open rows and cells of the outer table."""
+
+        if tag == "table":
+            self._table_depth += 1
+        elif self._table_depth != 1:
+            return
+        elif tag == "tr":
+            self._row, self._row_cells, self._row_is_header, self._row_link = [], 0, True, None
+        elif tag in ("td", "th"):
+            attributes = dict(attrs)
+            self._cell = []
+            self._cell_span = (_span(attributes.get("rowspan")), _span(attributes.get("colspan")))
+            self._row_is_header &= tag == "th"
+        elif tag == "a" and self.link_class and self._row_link is None:
+            attributes = dict(attrs)
+            if self.link_class in (attributes.get("class") or ""):
+                self._row_link = attributes.get("href")
+
+    def handle_endtag(self, tag: str):
+        """Close rows and cells of the outer table."""
+
+        if tag == "table":
+            self._table_depth -= 1
+        elif self._table_depth != 1:
+            return
+        elif tag in ("td", "th") and self._cell is not None:
+            self._add_cell("".join(self._cell).replace("\n", "").strip())
+            self._cell = None
+        elif tag == "tr":
+            self._fill_row_spans()
+            if not self._row:
+                return
+            if self._row_is_header and not self.rows:
+                self.header_rows.append(self._row)
+            elif self._row_is_header or (self._row_cells == 1 and len(self._row) > 1):
+                self.skipped_rows += 1
+            else:
+                self.rows.append(self._row)
+                self.links.append(self._row_link)
+
+    def handle_data(self, data: str):
+        """Add text to the open cell."""
+
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _add_cell(self, text: str):
+        """Add text to the row in every column of the cell, keep it for the rows it spans."""
+
+        self._fill_row_spans()
+        rowspan, colspan = self._cell_span
+        for _ in range(colspan):
+            if rowspan > 1:
+                self._row_spans[len(self._row)] = [rowspan - 1, text]
+            self._row.append(text)
+        self._row_cells += 1
+
+    def _fill_row_spans(self):
+        """Add text of cells of previous rows spanning the next columns of the row."""
+
+        while len(self._row) in self._row_spans:
+            row_span = self._row_spans[len(self._row)]
+            self._row.append(row_span[1])
+            row_span[0] -= 1
+            if row_span[0] == 0:
+                del self._row_spans[len(self._row) - 1]
+
+
+def _span(value: Optional[str]) -> int:
+    """Return number of rows or columns of a rowspan or colspan attribute, default 1."""
+
+    digits = re.match(r"\d+", value or "")
+    return max(int(digits.group()), 1) if digits else 1
+
+
+def read_html_table(
+    html: str, table_class: str, index: int = 0, link_class: Optional[str] = None
+) -> tuple[list[str], dict[str, list], int]:
+    """Return (header, {field: values}, skipped rows) of the index-th table in html.
+    The table is the index-th with class table_class. Sub header rows and rows with a number
+    of cells other than the header are skipped. With link_class, the "url" column holds the
+    first link of the class of each row, None for rows without it.
+    """
+
+    parser = HTMLTableParser(link_class)
+    parser.feed(find_table(html, table_class, index))
+    parser.close()
+    header = parser.header
+    rows = [(*row, link) for row, link in zip(parser.rows, parser.links) if len(row) == len(header)]
+    skipped_rows = parser.skipped_rows + len(parser.rows) - len(rows)
+    # Rows transposed to columns at once, links are the last column
+    values = list(zip(*rows)) or [()] * (len(header) + 1)
+    columns: dict[str, list] = {field: list(v) for field, v in zip(header, values)}
+    if link_class:
+        columns["url"] = list(values[-1])
+    return header, columns, skipped_rows
@@ -0,0 +1,92 @@
+# Standard library
+import gzip
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Iterator
+
+# Third party
+import duckdb
+
+# Local
+from .decorators import singleton
+from .get_logger import get_logger
+from ..settings import Settings
+
+
+@singleton
+class LandingZone:
+    """Immutable raw landing zone of API responses.
+
+    Each response is stored as a gzip compressed NDJSON record {url, fetched_at, response},
+    partitioned by <source>/<endpoint>/<fetch date>. Files are never updated, so bronze
+    tables can be rebuilt from them at any time (replay mode).
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize settings."""
+
+        self.logger = get_logger(__name__, settings)
+        self.enabled: bool = settings.LANDING_ZONE["ENABLED"]
+        self.directory: str = settings.LANDING_ZONE["DIRECTORY"]
+        self.chunk_size: int = settings.LANDING_ZONE["READ_CHUNK_SIZE"]
+
+    def write(self, source: str, endpoint: str, url: str, response: dict):
+        """Store the response of a request to url.
+
+        source -- API name, e.g. polygon.
+        endpoint -- endpoint name, e.g. stock_daily_prices_endpoint.
+        url -- request url, without credentials.
+        """
+
+        if not self.enabled:
+            return
+        fetched_at = datetime.now(timezone.utc)
+        directory = os.path.join(self.directory, source, endpoint, fetched_at.strftime("%Y-%m-%d"))
+        os.makedirs(directory, exist_ok=True)
+        file_name = f"part-{fetched_at.strftime('%H%M%S%f')}-{uuid.uuid4().hex}.ndjson.gz"
+        record = {"url": url, "fetched_at": fetched_at.isoformat(), "response": response}
+        # Write to temp file first, so readers never see a partial file
+        temp_path = os.path.join(directory, f".{file_name}.tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        os.replace(temp_path, os.path.join(directory, file_name))
+
+    def read(
+        self, source: str, endpoint: str, latest_only: bool = True
+    ) -> Iterator[tuple[str, str, dict]]:
+        """Yield (url, fetched_at, response) stored for endpoint, ordered by fetched_at.
+        Only the latest response of each url is returned, unless latest_only is False
+        (e.g. every snapshot of an append-only table).
+        """
+
+        endpoint_directory = os.path.join(self.directory, source, endpoint)
+        if not os.path.isdir(endpoint_directory):
+            self.logger.info(f"No landing files found in {endpoint_directory}.")
+            return
+
+        latest_filter = (
+            "QUALIFY row_number() OVER (PARTITION BY url ORDER BY fetched_at DESC) = 1"
+            if latest_only
+            else ""
+        )
+        # Own connection, the default connection is not thread-safe
+        duckdb_conn = duckdb.connect()
+        records = duckdb_conn.sql(f"""
+            SELECT url, fetched_at, response
+            FROM read_json(
+                '{endpoint_directory}/*/*.ndjson.gz',
+                format = 'newline_delimited',
+                columns = {{'url': 'VARCHAR', 'fetched_at': 'VARCHAR', 'response': 'JSON'}},
+                maximum_object_size = 134217728
+            )
+            {latest_filter}
+            ORDER BY fetched_at
+            """)
+        count = 0
+        while chunk := records.fetchmany(self.chunk_size):
+            for url, fetched_at, response in chunk:
+                count += 1
+                yield url, fetched_at, json.loads(response)
+        self.logger.info(f"Read {count} responses from {endpoint_directory}.")
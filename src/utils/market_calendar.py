@@ -0,0 +1,77 @@
+# Standard library
+from datetime import date, timedelta
+
+# Unscheduled full day closures (national days of mourning, weather)
+SPECIAL_CLOSURES = {
+    date(2012, 10, 29),  # Hurricane Sandy
+    date(2012, 10, 30),
+    date(2018, 12, 5),  # George H. W. Bush
+    date(2025, 1, 9),  # Jimmy Carter
+}
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Return the nth weekday (0 is Monday) of month. n = -1 is the last one."""
+
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Return Easter Sunday, anonymous Gregorian algorithm."""
+
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+
+def _observed(holiday: date) -> date:
+    """Return the weekday a holiday is observed: Friday before if Saturday, Monday if Sunday."""
+
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+def get_holidays(year: int) -> set[date]:
+    """Return NYSE full day holidays of year."""
+
+    holidays = {
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    # New Year's Day falling on Saturday is not observed on the previous Friday
+    if date(year, 1, 1).weekday() != 5:
+        holidays.add(_observed(date(year, 1, 1)))
+    if year >= 1998:
+        holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return holidays | {d for d in SPECIAL_CLOSURES if d.year == year}
+
+
+def get_trading_days(start_date: str, end_date: str) -> list[str]:
+    """Return NYSE trading days [%Y-%m-%d] from start_date until end_date (excluded)."""
+
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    holidays: set[date] = set()
+    for year in range(start.year, end.year + 1):
+        holidays |= get_holidays(year)
+    days = (start + timedelta(days=n) for n in range((end - start).days))
+    return [d.isoformat() for d in days if d.weekday() < 5 and d not in holidays]
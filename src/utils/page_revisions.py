@@ -0,0 +1,56 @@
+# Standard library
+from datetime import datetime
+from typing import Optional
+
+# Local
+from .sql_handler import SQLHandler
+from ..abstract.client import Client
+from ..settings import Settings
+
+PAGE_REVISIONS_TABLE: dict = {
+    "name": "WIKIPEDIA_PAGE_REVISIONS",
+    "schema": "bronze_layer",
+    "fields_mapping": {
+        "page": ["page", "VARCHAR(255)"],
+        "revision_id": ["revision_id", "VARCHAR(255)"],
+        "loaded_at": ["loaded_at", "DATETIME"],
+    },
+    "primary_index": ["page"],
+}
+
+
+class PageRevisions:
+    """Revision of Wikipedia pages loaded, by page, in PAGE_REVISIONS_TABLE.
+
+    Loaders record the revision in the same transaction as the page rows, so a recorded
+    revision is always loaded.
+    """
+
+    def __init__(self, settings: Settings, client: Client):
+        """Settings setup."""
+
+        self.client = client
+        self.placeholder = settings.CLIENT_CONFIG["PARAMETER_PLACEHOLDER"].strip(", ")
+        self.revisions_handler = SQLHandler(settings, client, PAGE_REVISIONS_TABLE)
+        self.table_name = self.revisions_handler.schema.table_name
+
+    def get(self, page: str) -> Optional[str]:
+        """Return revision id of page loaded, None if never loaded."""
+
+        _, result = self.revisions_handler.query(
+            f"SELECT revision_id FROM {self.table_name} WHERE page = '{page}'"
+        )
+        return result[0][0] if result else None
+
+    def record(self, page: str, revision_id: str):
+        """Replace the loaded revision of page.
+        Run it in a client transaction, to record the revision with the rows loaded.
+        """
+
+        self.client.executemany(
+            f"DELETE FROM {self.table_name} WHERE page = {self.placeholder}", [(page,)]
+        )
+        loaded_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.revisions_handler.insert_into(
+            [(page, revision_id, loaded_at)], ("page", "revision_id", "loaded_at")
+        )
@@ -0,0 +1,89 @@
+# Standard library
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+# Third party
+from structlog.typing import FilteringBoundLogger
+
+# Local
+from .constants import PIPELINES
+
+
+class PipelineScheduler:
+    """Run pipelines concurrently, as a DAG of the dependencies between them.
+
+    A pipeline starts as soon as all its dependencies in scope finished successfully.
+    Dependencies out of scope are assumed to be up to date. When a pipeline fails,
+    its dependents are skipped, the others keep running, and the error is raised at the end.
+
+    pipelines -- pipelines to run, started in this order when possible.
+    max_parallel -- max pipelines running at once.
+    logger -- from get_logger, bound to the pipelines in scope.
+    dependencies -- {pipeline: (pipelines it depends on)}. Default: PIPELINES.dependencies
+    """
+
+    def __init__(
+        self,
+        pipelines: tuple,
+        max_parallel: int,
+        logger: FilteringBoundLogger,
+        dependencies: Optional[dict] = None,
+    ) -> None:
+        self.logger = logger.bind(__name__=__name__)
+        self.pipelines = pipelines
+        self.max_parallel = max_parallel
+        dependencies = PIPELINES.dependencies if dependencies is None else dependencies
+        # Only dependencies in scope are waited for
+        self.dependencies: dict[str, set] = {
+            pipeline: set(dependencies.get(pipeline, ())) & set(pipelines) for pipeline in pipelines
+        }
+
+    def run(self, run_pipeline: Callable[[str], object]) -> dict[str, str]:
+        """Run all pipelines with run_pipeline(pipeline_name).
+        Return {pipeline: status}, status is one of: success, failed, skipped.
+        """
+
+        status: dict[str, str] = {}
+        errors: dict[str, BaseException] = {}
+        running: dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            while len(status) < len(self.pipelines):
+                for pipeline in self._get_ready(status, running):
+                    self.logger.info(f"Scheduling pipeline: {pipeline}")
+                    running[executor.submit(run_pipeline, pipeline)] = pipeline
+                if not running:  # pragma: no cover
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pipeline = running.pop(future)
+                    error = future.exception()
+                    if error:
+                        self.logger.error(f"Pipeline {pipeline} failed. {error=}")
+                        status[pipeline] = "failed"
+                        errors[pipeline] = error
+                    else:
+                        status[pipeline] = "success"
+
+        self.logger.info(f"Finished pipelines. {status=}")
+        if errors:
+            raise next(iter(errors.values()))
+        return status
+
+    def _get_ready(self, status: dict[str, str], running: dict[Future, str]) -> list[str]:
+        """Return pipelines ready to start. Mark pipelines with failed dependencies as skipped."""
+
+        is_status_updated = True
+        while is_status_updated:  # Skips propagate to the dependents of skipped pipelines
+            is_status_updated = False
+            ready = []
+            for pipeline in self.pipelines:
+                if pipeline in status or pipeline in running.values():
+                    continue
+                dependencies_status = {status.get(d) for d in self.dependencies[pipeline]}
+                if dependencies_status & {"failed", "skipped"}:
+                    self.logger.info(f"Skipping pipeline {pipeline}: dependency not updated.")
+                    status[pipeline] = "skipped"
+                    is_status_updated = True
+                elif dependencies_status <= {"success"}:
+                    ready.append(pipeline)
+        return ready
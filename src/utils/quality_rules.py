@@ -0,0 +1,132 @@
+# Standard library
+import json
+from datetime import datetime
+
+# Third party
+import duckdb
+
+# Local
+from .table_schema import get_table_schema
+
+QUALITY_SUMMARY_TABLE: dict = {
+    "name": "DATA_QUALITY_SUMMARY",
+    "schema": "bronze_layer",
+    "fields_mapping": {
+        "table_name": ["table_name", "VARCHAR(255)"],
+        "rule": ["rule", "VARCHAR(255)"],
+        "violations": ["violations", "INTEGER"],
+        "checked_rows": ["checked_rows", "INTEGER"],
+        "sample_rows": ["sample_rows", "VARCHAR(255)"],
+        "checked_at": ["checked_at", "DATETIME"],
+    },
+    "primary_index": ["table_name", "checked_at"],
+}
+
+
+class QualityRules:
+    """Data quality rules of a table, checked as DuckDB column predicates.
+
+    Rules are:
+        * required_<field>: required fields are not null and can be cast to their type.
+        * "quality_rules" of the table config, either:
+            - {"name", "check"}: SQL predicate, fields referenced as {field} with their type.
+              Null values pass, they are checked by required rules.
+            - {"name", "unique": [fields]}: one row by fields value, duplicates violate it.
+              The latest updated row (updated_at field) follows it, like merge loads keep.
+    Rules of fields missing in the rows are skipped.
+    """
+
+    def __init__(self, table_config: dict, sample_rows: int):
+        """Settings setup.
+        sample_rows -- max violating rows kept by rule in the summary.
+        """
+
+        self.schema = get_table_schema(table_config)
+        self.rules: list[dict] = table_config.get("quality_rules", [])
+        self.sample_rows = sample_rows
+
+    def get_predicates(self, header: list[str], columns: list[str]) -> dict[str, str]:
+        """Return {rule: SQL predicate}, true for rows following the rule.
+
+        header -- rows fields.
+        columns -- DuckDB columns of the fields (renamed if only case differs, e.g. T, t).
+        """
+
+        quoted_columns = {field: f'"{column}"' for field, column in zip(header, columns)}
+        typed_columns = {
+            field: f"TRY_CAST({quoted_columns[field]} AS {dtype})"
+            for field, dtype in zip(self.schema.fields, self.schema.duckdb_types)
+            if field in quoted_columns
+        }
+
+        predicates = {
+            f"required_{field}": f"{typed_columns[field]} IS NOT NULL"
+            for field in self.schema.required_types
+            if field in typed_columns
+        }
+        order_by = (
+            f" ORDER BY {typed_columns['updated_at']} DESC NULLS LAST"
+            if "updated_at" in typed_columns
+            else ""
+        )
+        for rule in self.rules:
+            if "unique" in rule:
+                if set(rule["unique"]) <= set(quoted_columns):
+                    partition = ", ".join(quoted_columns[field] for field in rule["unique"])
+                    predicates[rule["name"]] = (
+                        f"row_number() OVER (PARTITION BY {partition}{order_by}) = 1"
+                    )
+                continue
+            try:
+                predicates[rule["name"]] = (
+                    f"coalesce({rule['check'].format(**typed_columns)}, TRUE)"
+                )
+            except KeyError:
+                continue
+        return predicates
+
+    def summarize(
+        self,
+        duckdb_conn: duckdb.DuckDBPyConnection,
+        table: str,
+        rule_columns: dict[str, str],
+        columns: list[str],
+        header: list[str],
+    ) -> list[dict]:
+        """Return QUALITY_SUMMARY_TABLE rows: violations and sampled violating rows by rule.
+
+        table -- DuckDB table of checked rows.
+        rule_columns -- {rule: boolean column of table}, true for rows following the rule.
+        columns -- table columns of the fields in header.
+        """
+
+        if not rule_columns:
+            return []
+        counts = duckdb_conn.execute(
+            "SELECT count(*), "
+            + ", ".join(f"count(*) FILTER (WHERE NOT {c})" for c in rule_columns.values())
+            + f" FROM {table}"
+        ).fetchone() or (0,)
+        selected_columns = ", ".join(f'"{column}"' for column in columns)
+        checked_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        summary = []
+        for (rule, rule_column), violations in zip(rule_columns.items(), counts[1:]):
+            sample_rows = []
+            if violations:
+                sample_rows = duckdb_conn.execute(
+                    f"SELECT {selected_columns} FROM {table} WHERE NOT {rule_column} "
+                    f"LIMIT {self.sample_rows}"
+                ).fetchall()
+            summary.append(
+                {
+                    "table_name": self.schema.table_name,
+                    "rule": rule,
+                    "violations": violations,
+                    "checked_rows": counts[0],
+                    "sample_rows": json.dumps(
+                        [dict(zip(header, row)) for row in sample_rows], default=str
+                    ),
+                    "checked_at": checked_at,
+                }
+            )
+        return summary
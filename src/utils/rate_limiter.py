@@ -0,0 +1,77 @@
+# Standard library
+import threading
+from time import monotonic, sleep
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    capacity -- max number of tokens, i.e. the allowed burst of calls.
+    refill_rate -- tokens added per second.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Reserve tokens and return the time (seconds) to wait before using them.
+        Tokens can go negative, so concurrent callers queue up behind each other.
+        """
+
+        with self._lock:
+            now = monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+            )
+            self.last_refill = now
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available. Return time slept."""
+
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            sleep(wait_time)
+        return wait_time
+
+
+class RateLimiter:
+    """Token buckets for an API.
+    One bucket is shared by all requests, and optional buckets limit specific endpoints.
+
+    calls_per_min -- API calls allowed per minute.
+    burst -- max calls allowed at once.
+    endpoint_limits -- {endpoint: {"CALLS_PER_MIN": int, "BURST": int}}
+    """
+
+    def __init__(self, calls_per_min: float, burst: float, endpoint_limits: Optional[dict] = None):
+        self.bucket = TokenBucket(burst, calls_per_min / 60)
+        self.endpoint_buckets: Dict[str, TokenBucket] = {
+            endpoint: TokenBucket(limit["BURST"], limit["CALLS_PER_MIN"] / 60)
+            for endpoint, limit in (endpoint_limits or {}).items()
+        }
+
+    def reserve(self, endpoint: Optional[str] = None) -> float:
+        """Reserve one call and return the time (seconds) to wait before making it."""
+
+        wait_time = self.bucket.reserve()
+        endpoint_bucket = self.endpoint_buckets.get(endpoint) if endpoint else None
+        if endpoint_bucket:
+            wait_time = max(wait_time, endpoint_bucket.reserve())
+        return wait_time
+
+    def acquire(self, endpoint: Optional[str] = None) -> float:
+        """Block until a call is allowed. Return time slept."""
+
+        wait_time = self.reserve(endpoint)
+        if wait_time > 0:
+            sleep(wait_time)
+        return wait_time
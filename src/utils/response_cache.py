@@ -0,0 +1,107 @@
+# Standard library
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from time import time
+from typing import Optional
+
+# Local
+from .decorators import singleton
+from .get_logger import get_logger
+from ..settings import Settings
+
+
+@singleton
+class ResponseCache:
+    """Persistent on-disk cache of API responses.
+
+    Entries are zlib compressed json files, addressed by the hash of the request url
+    without credentials. Entries expire by TTL, and the least recently used entries are
+    evicted when the cache grows over MAX_SIZE_MB.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize settings and cache directory."""
+
+        self.logger = get_logger(__name__, settings)
+        config = settings.RESPONSE_CACHE
+        self.enabled: bool = config["ENABLED"]
+        self.directory: str = config["DIRECTORY"]
+        self.max_size: int = config["MAX_SIZE_MB"] * 1024**2
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self.size = sum(entry.stat().st_size for entry in os.scandir(self.directory))
+
+    def get_key(self, url: str) -> str:
+        """Return cache key for url, ignoring credentials."""
+
+        url = re.sub(r"[?&](apiKey|api_key)=[^&]*", "", url)
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _get_path(self, url: str) -> str:
+        """Return entry path for url."""
+
+        return os.path.join(self.directory, self.get_key(url))
+
+    def get(self, url: str, ttl: Optional[float]) -> Optional[dict]:
+        """Return the cached response for url, None if missing or expired.
+
+        ttl -- max entry age in seconds. None means the entry never expires.
+        """
+
+        if not self.enabled:
+            return None
+        path = self._get_path(url)
+        try:
+            created_at = os.path.getmtime(path)
+            if ttl is not None and time() - created_at > ttl:
+                self.logger.debug(f"Cache entry expired for {url=}")
+                return None
+            with open(path, "rb") as f:
+                response = json.loads(zlib.decompress(f.read()))
+            # Access time tracks usage for LRU eviction, modification time tracks age
+            os.utime(path, (time(), created_at))
+        except (FileNotFoundError, zlib.error, json.JSONDecodeError):
+            return None
+
+        self.logger.debug(f"Cache hit for {url=}")
+        return response
+
+    def set(self, url: str, response: dict):
+        """Store response for url, then evict entries if cache is too big."""
+
+        if not self.enabled:
+            return
+        path = self._get_path(url)
+        data = zlib.compress(json.dumps(response).encode())
+        # Write to temp file first, so readers never see a partial entry
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        old_size = os.path.getsize(path) if os.path.isfile(path) else 0
+        os.replace(temp_path, path)
+        with self._lock:
+            self.size += len(data) - old_size
+            if self.size > self.max_size:
+                self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until cache size is under MAX_SIZE_MB."""
+
+        entries = sorted(
+            (entry for entry in os.scandir(self.directory) if not entry.name.endswith(".tmp")),
+            key=lambda entry: entry.stat().st_atime,
+        )
+        for entry in entries:
+            if self.size <= self.max_size:
+                break
+            entry_size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+                self.size -= entry_size
+            except FileNotFoundError:  # pragma: no cover
+                pass
+        self.logger.info(f"Cache eviction finished. Size: {self.size / 1024**2:.1f}MB")
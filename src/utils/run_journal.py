@@ -0,0 +1,146 @@
+# Standard library
+import os
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional
+
+# Local
+from .get_logger import get_logger
+from ..settings import Settings
+
+
+class RunJournal:
+    """Checkpoints of pipeline runs, so a run can resume where it stopped (--resume).
+
+    Runs are keyed by run id in a SQLite journal, apart from the target database.
+    Extractors record completed units (e.g. financials tickers) and pagination cursors
+    (e.g. next_url) as soon as their rows are flushed. Journal methods are no-ops outside
+    a pipeline run (settings.run_id not set) or if RUN_JOURNAL is disabled.
+    Each instance opens one connection, closed by close() or when the instance is deleted.
+    """
+
+    def __init__(self, settings: Settings):
+        """Settings setup."""
+
+        self.logger = get_logger(__name__, settings)
+        self.settings = settings
+        self.enabled: bool = settings.RUN_JOURNAL["ENABLED"]
+        self.db_path: str = settings.RUN_JOURNAL["DB_PATH"]
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def run_id(self) -> Optional[str]:
+        """Return current run id, None if not journaled."""
+
+        return self.settings.run_id if self.enabled else None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Return the connection to the journal, opened once by instance (e.g. by run)."""
+
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            # Streaming steps may use the journal from another thread, one at a time
+            self._conn = sqlite3.connect(self.db_path, timeout=60, check_same_thread=False)
+        return self._conn
+
+    def close(self):
+        """Close the connection to the journal, if open."""
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def start(self) -> Optional[str]:
+        """Start a run of settings.pipeline and set settings.run_id. Return run id.
+        If settings.resume, resume the latest unfinished run of the pipeline, if any.
+        """
+
+        if not self.enabled:
+            return None
+        # Tables are created once by run, before any checkpoint
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY, pipeline TEXT, started_at TEXT, finished_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                run_id TEXT, kind TEXT, item TEXT, PRIMARY KEY (run_id, kind, item)
+            );
+            CREATE TABLE IF NOT EXISTS cursors (
+                run_id TEXT, name TEXT, value TEXT, PRIMARY KEY (run_id, name)
+            );
+            """)
+        with self.conn as conn:
+            unfinished = None
+            if self.settings.resume:
+                unfinished = conn.execute(
+                    "SELECT run_id FROM runs WHERE pipeline = ? AND finished_at IS NULL "
+                    "ORDER BY started_at DESC LIMIT 1",
+                    [self.settings.pipeline],
+                ).fetchone()
+            if unfinished:
+                self.settings.run_id = unfinished[0]
+                self.logger.info(f"Resuming run. run_id={self.settings.run_id}")
+            else:
+                now = datetime.now()
+                self.settings.run_id = f"{now.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+                conn.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, NULL)",
+                    [self.settings.run_id, self.settings.pipeline, now.isoformat()],
+                )
+        return self.settings.run_id
+
+    def finish(self):
+        """Mark the run finished, it is not resumed anymore."""
+
+        if not self.run_id:
+            return
+        with self.conn as conn:
+            conn.execute(
+                "UPDATE runs SET finished_at = ? WHERE run_id = ?",
+                [datetime.now().isoformat(), self.run_id],
+            )
+
+    def add(self, kind: str, items: Iterable[str]):
+        """Record items (e.g. tickers) of kind as completed in the run."""
+
+        if not self.run_id:
+            return
+        with self.conn as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO checkpoints VALUES (?, ?, ?)",
+                [(self.run_id, kind, item) for item in items],
+            )
+
+    def get(self, kind: str) -> set[str]:
+        """Return items of kind completed in the run."""
+
+        if not self.run_id:
+            return set()
+        with self.conn as conn:
+            rows = conn.execute(
+                "SELECT item FROM checkpoints WHERE run_id = ? AND kind = ?", [self.run_id, kind]
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def set_cursor(self, name: str, value: Optional[str]):
+        """Record cursor (e.g. next_url) to continue from."""
+
+        if not self.run_id:
+            return
+        with self.conn as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)", [self.run_id, name, value]
+            )
+
+    def get_cursor(self, name: str) -> Optional[str]:
+        """Return cursor recorded in the run, None if not found."""
+
+        if not self.run_id:
+            return None
+        with self.conn as conn:
+            row = conn.execute(
+                "SELECT value FROM cursors WHERE run_id = ? AND name = ?", [self.run_id, name]
+            ).fetchone()
+        return row[0] if row else None
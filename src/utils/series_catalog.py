@@ -0,0 +1,92 @@
+# Standard library
+import json
+from datetime import date, timedelta
+from typing import Optional
+
+# Months between observations of series by frequency, days for daily and weekly series
+FREQUENCY_MONTHS = {"monthly": 1, "quarterly": 3, "semiannual": 6, "annual": 12}
+FREQUENCY_DAYS = {"daily": 1, "weekly": 7}
+# Days between requests of a series after a request without new observations
+RECHECK_DAYS = {
+    "daily": 1,
+    "weekly": 2,
+    "monthly": 7,
+    "quarterly": 14,
+    "semiannual": 30,
+    "annual": 30,
+}
+
+
+def load_series_catalog(file_path: str) -> dict[str, dict]:
+    """Return FRED series catalog {series_id: {"frequency", "category", "title"}}."""
+
+    with open(file_path, "r") as file:
+        catalog: dict[str, dict] = json.load(file)
+    for series_id, series in catalog.items():
+        frequency = series.get("frequency")
+        if frequency not in FREQUENCY_MONTHS and frequency not in FREQUENCY_DAYS:
+            raise ValueError(f"Invalid frequency of series {series_id}: {frequency}.")
+    return catalog
+
+
+def get_next_observation(last_date: str, frequency: str) -> str:
+    """Return date [%Y-%m-%d] of the observation following last_date, by series frequency."""
+
+    last = date.fromisoformat(last_date)
+    if frequency in FREQUENCY_DAYS:
+        return (last + timedelta(days=FREQUENCY_DAYS[frequency])).isoformat()
+    # Observations of monthly and lower frequencies are dated on the first day of the period
+    months = last.year * 12 + last.month - 1 + FREQUENCY_MONTHS[frequency]
+    return date(months // 12, months % 12 + 1, 1).isoformat()
+
+
+def get_release_date(last_date: str, frequency: str) -> str:
+    """Return earliest date [%Y-%m-%d] the observation following last_date is published.
+    It is the end of its period (e.g. observation 2024-04-01 of a monthly series, 2024-05-01).
+    Weekly observations are dated at the end of the week. Daily observations are on weekdays
+    and published on weekdays.
+    """
+
+    next_observation = get_next_observation(last_date, frequency)
+    if frequency == "weekly":
+        return next_observation
+    if frequency == "daily":
+        next_observation = _skip_weekend(next_observation)
+        return _skip_weekend(get_next_observation(next_observation, frequency))
+    return get_next_observation(next_observation, frequency)
+
+
+def _skip_weekend(day: str) -> str:
+    """Return day [%Y-%m-%d], or the following Monday if it is on a weekend."""
+
+    weekday = date.fromisoformat(day).weekday()
+    if weekday < 5:
+        return day
+    return (date.fromisoformat(day) + timedelta(days=7 - weekday)).isoformat()
+
+
+def get_stale_series(
+    catalog: dict[str, dict],
+    last_update: dict[str, str],
+    today: str,
+    last_checked: Optional[dict[str, str]] = None,
+) -> dict[str, str]:
+    """Return {series_id: last observation date} of series with an observation due by today.
+    Series never loaded are stale, with last date 1600-01-01. A series requested after the
+    release date without new observations is due again RECHECK_DAYS after the request.
+
+    last_update -- {series_id: last observation date [%Y-%m-%d]} loaded.
+    last_checked -- {series_id: date [%Y-%m-%d] of the last request without new observations}.
+    """
+
+    stale_series = {}
+    for series_id, series in catalog.items():
+        last_date = last_update.get(series_id, "1600-01-01")
+        due_date = get_release_date(last_date, series["frequency"])
+        checked_at = (last_checked or {}).get(series_id)
+        if checked_at and checked_at >= due_date:
+            recheck_days = timedelta(days=RECHECK_DAYS[series["frequency"]])
+            due_date = (date.fromisoformat(checked_at) + recheck_days).isoformat()
+        if due_date <= today:
+            stale_series[series_id] = last_date
+    return stale_series
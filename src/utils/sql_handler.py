@@ -1,15 +1,21 @@
 # Standard library
+import os
 import sqlite3
-from typing import Optional
+from typing import Optional, Sequence
+
+# Third party
+import duckdb
 
 # Local
 from .get_logger import get_logger
+from .step_buffer import StepBuffer, open_rows
+from .table_schema import get_table_schema
 from ..abstract.client import Client
 from ..settings import Settings
 
 
 class SQLHandler:
-    """Handle SQL operations for Postgres ans SQLite clients."""
+    """Handle SQL operations for Postgres, SQLite and DuckDB clients."""
 
     def __init__(self, settings: Settings, client: Client, table_config: Optional[dict] = None):
         """Settings setup.
@@ -21,32 +27,109 @@ class SQLHandler:
             self.pipeline_table = table_config
         else:
             self.pipeline_table = self.settings.PIPELINE_TABLE
+        self.schema = get_table_schema(self.pipeline_table)
 
         self.client_config = self.settings.CLIENT_CONFIG
         self.client = client
         self.create_table()
 
-    def insert_into(self, raw_values: list[tuple], header: tuple):
+    def insert_into(self, raw_values: list[tuple], header: Sequence[str]):
         """Insert data into target table.
         Map field to expected position, see more in database_config.json
         """
 
-        table_name = self.pipeline_table["schema"] + "." + self.pipeline_table["name"]
-        fields_mapping = self.pipeline_table["fields_mapping"]
-        fields = tuple(fields_mapping.keys())
-
         # Map fields to correct position.
-        mapped_values_list = []
-        for line in raw_values:
-            raw_mapped_values = {h: v for h, v in zip(header, line)}
-            mapped_values = tuple(raw_mapped_values.get(key) for key in fields)
-            mapped_values_list.append(mapped_values)
-
-        parameter_placeholder = self.client_config["PARAMETER_PLACEHOLDER"]
-        parameterized_fields = (parameter_placeholder * len(mapped_values_list[0])).strip(", ")
-        query = f"INSERT INTO {table_name} VALUES({parameterized_fields})"
+        mapper = self.schema.get_mapper(header)
+        mapped_values_list = [mapper(line) for line in raw_values]
+
+        query = self.schema.insert_sql(self.client_config["PARAMETER_PLACEHOLDER"])
         self.client.executemany(query, mapped_values_list)
 
+    def copy_from_file(self, file_path: str, buffer: Optional[StepBuffer] = None):
+        """Bulk load csv file (or buffer rows, if given) into target table.
+        Map fields to table columns with DuckDB, see more in database_config.json
+        """
+
+        # Read as text, so values are copied as written by previous steps
+        duckdb_conn, raw_file, header = open_rows(buffer or file_path)
+        # DuckDB renames fields differing only by case (e.g. T and t), select them by position.
+        # Fields missing in file are loaded as NULL
+        projection = ", ".join(
+            f'"{raw_file.columns[header.index(field)]}"' if field in header else "NULL"
+            for field in self.schema.fields
+        )
+        order_by = self.get_order_by(header, raw_file.columns)
+        mapped_file_path = file_path.replace(".csv", "_mapped.csv")
+        raw_file.create_view("raw_file")
+        duckdb_conn.execute(
+            f"COPY (SELECT {projection} FROM raw_file {order_by}) TO '{mapped_file_path}' (HEADER)"
+        )
+
+        try:
+            self.client.copy_from(self.schema.table_name, self.schema.columns, mapped_file_path)
+        finally:
+            os.remove(mapped_file_path)
+
+    def get_staging_config(self) -> dict:
+        """Return config of the staging table of merge loads: same columns, no indexes."""
+
+        return {
+            **self.pipeline_table,
+            "name": self.pipeline_table["name"] + "_STAGING",
+            "primary_index": [],
+            "secondary_indexes": [],
+        }
+
+    def merge_from(self, staging_table: str):
+        """Insert rows of staging_table missing in table, with an anti-join on natural_key.
+        Rows duplicated in staging_table are inserted once, the latest updated. Lookups use the
+        table index on natural_key, so the cost scales with the staged rows, not the table.
+        Key values match if equal or both NULL (e.g. financials without timeframe).
+        """
+
+        self.client.execute(self.get_merge_query(staging_table))
+
+    def get_merge_query(self, staging_table: str) -> str:
+        """Return INSERT query of merge_from.
+        Keys are compared with the client NULL_SAFE_EQUAL operator (e.g. SQLite IS), an OR
+        of equality and IS NULL would only search the index by its first column.
+        """
+
+        columns = ", ".join(self.schema.columns)
+        natural_key = self.pipeline_table["natural_key"]
+        null_safe_equal = self.client_config["NULL_SAFE_EQUAL"]
+        is_same_key = " AND ".join(
+            f"t.{column} {null_safe_equal} s.{column}" for column in natural_key
+        )
+        return (
+            f"INSERT INTO {self.schema.table_name} ({columns}) "
+            f"SELECT {columns} FROM ("
+            f"SELECT {columns}, ROW_NUMBER() OVER "
+            f"(PARTITION BY {', '.join(natural_key)} ORDER BY updated_at DESC) "
+            f"AS merge_row FROM {staging_table}) s "
+            "WHERE s.merge_row = 1 AND NOT EXISTS "
+            f"(SELECT 1 FROM {self.schema.table_name} t WHERE {is_same_key})"
+        )
+
+    def get_order_by(self, header: list[str], columns: list[str]) -> str:
+        """Return ORDER BY clause of the table sort_key, empty if not configured.
+        Rows loaded in sort_key order keep related rows together in storage.
+
+        header -- file fields.
+        columns -- DuckDB columns of the file fields (renamed if only case differs, e.g. T, t).
+        """
+
+        sort_key = self.pipeline_table.get("sort_key")
+        if not sort_key:
+            return ""
+        fields = self.schema.column_fields
+        order_columns = [
+            f'"{columns[header.index(fields[column])]}"'
+            for column in sort_key
+            if fields[column] in header
+        ]
+        return f"ORDER BY {', '.join(order_columns)}" if order_columns else ""
+
     def query(self, query: str) -> tuple[bool, list]:
         """Return if query is successful and result of a SQL query."""
 
@@ -57,28 +140,44 @@ class SQLHandler:
             else:
                 self.logger.debug(f"None results for query: {query}.")
                 return True, []
-        except sqlite3.OperationalError as e:  # pragma: no cover
+        except (sqlite3.OperationalError, duckdb.Error) as e:  # pragma: no cover
             self.logger.debug(f"Query failed. {e}. {query=}")
             return False, []
 
+    def drop_table(self):
+        """Drop table of pipeline settings."""
+
+        self.logger.info(f"Dropping table: {self.schema.table_name}")
+        self.client.execute(f"DROP TABLE IF EXISTS {self.schema.table_name}")
+
     def create_table(self):
         """Create table based on pipeline settings."""
 
-        # Build SQL statement
-        table_name = self.pipeline_table["schema"] + "." + self.pipeline_table["name"]
-        table_fields = self.pipeline_table["fields_mapping"]
-        create_table_sql = f"CREATE TABLE IF NOT EXISTS {table_name} \n ("
-        for v in table_fields.values():
-            field_name = v[0]
-            if self.client_config.get("TYPE_MAPPING"):  # pragma: no cover
-                data_type = self.client_config["TYPE_MAPPING"][v[1]]
-            else:
-                data_type = v[1]
-            create_table_sql += f"{field_name} {data_type}\n, "
-
-        create_table_sql = create_table_sql.strip(", ")
-        create_table_sql += " )"
-        self.logger.debug(f"Creating table if not exist: {table_name}")
+        create_table_sql = self.schema.create_table_sql(self.client_config.get("TYPE_MAPPING"))
+        self.logger.debug(f"Creating table if not exist: {self.schema.table_name}")
 
         # Create Table
         self.client.execute(create_table_sql)
+        self.create_indexes()
+
+    def create_indexes(self):
+        """Create primary_index and secondary_indexes of pipeline settings, if not exist.
+        Index names are <table>_<columns>_idx. Clients without CREATE_INDEX are skipped.
+        """
+
+        create_index_sql = self.client_config.get("CREATE_INDEX")
+        if not create_index_sql:
+            return
+
+        schema, table = self.pipeline_table["schema"], self.pipeline_table["name"]
+        indexes = self.pipeline_table.get("secondary_indexes", [])
+        if self.pipeline_table.get("primary_index"):
+            indexes = [self.pipeline_table["primary_index"]] + indexes
+        for columns in indexes:
+            index_name = f"{table}_{'_'.join(columns)}_idx".lower()
+            self.client.execute(
+                create_index_sql.format(
+                    schema=schema, table=table, index_name=index_name, columns=", ".join(columns)
+                )
+            )
+            self.logger.debug(f"Creating index if not exist: {index_name}")
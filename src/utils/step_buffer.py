@@ -0,0 +1,206 @@
+# Standard library
+import json
+import os
+import uuid
+from typing import Optional, Union
+
+# Third party
+import duckdb
+
+# Local
+from .constants import DUCKDB_TYPES
+from .csv_handler import append_to_file, clean_temp_file, read_header
+from ..settings import Settings
+
+# Staging formats of rows handed over between steps
+STAGING_FORMATS = ("memory", "parquet", "csv")
+
+
+class StepBuffer:
+    """In-memory columnar rows handed over between steps, instead of temp csv files.
+
+    Rows are kept as text in a DuckDB table, like csv values, with columns named by
+    position (c0, c1, ...) since DuckDB names are case insensitive (e.g. T and t).
+    Above SPILL_ROWS rows, they are spilled to Parquet files.
+    With the parquet staging format, rows are typed with fields_mapping and flushed to a
+    compressed Parquet file of one row group every ROW_GROUP_ROWS rows.
+    Spilled files are read in a single scan.
+    Buffers derived from a buffer (e.g. valid rows) share its in-memory database.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        name: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None,
+        fields_mapping: Optional[dict] = None,
+    ):
+        """Settings setup.
+        name -- used to name spilled files.
+        conn -- connection to the database of the buffer. Default: new in-memory database.
+        fields_mapping -- from database_config.json, types columns with the parquet format.
+        Values that can't be cast are kept as nulls (rejected by Validator if required).
+        """
+
+        self.name = name
+        self.settings = settings
+        self.format: str = settings.STEP_BUFFER["FORMAT"]
+        # Parquet staging flushes every row group
+        self.spill_rows: int = settings.STEP_BUFFER[
+            "ROW_GROUP_ROWS" if self.format == "parquet" else "SPILL_ROWS"
+        ]
+        self.compression: str = settings.STEP_BUFFER["COMPRESSION"]
+        self.directory: str = settings.STEP_BUFFER["DIRECTORY"]
+        self.fields_mapping: dict = (fields_mapping or {}) if self.format == "parquet" else {}
+        self.conn = conn or duckdb.connect()
+        self.table = f"buffer_{uuid.uuid4().hex}"
+        self.header: list[str] = []
+        self.spilled_files: list[str] = []
+        self.rows, self.memory_rows = 0, 0
+
+    def append(self, data: list[dict], header: Optional[list[str]] = None):
+        """Append rows, like csv_handler.append_to_file.
+        If header is not specified, use dict keys of the first rows appended.
+        """
+
+        if not data:
+            return
+        if not self.header:
+            self.header = header or list(data[0].keys())
+            columns = ", ".join(f"c{n} {dtype}" for n, dtype in enumerate(self.get_types()))
+            self.conn.execute(f"CREATE TABLE {self.table} ({columns})")
+        # Rows are passed as one JSON parameter, binding python lists value by value is much
+        # slower. Values are text as written by csv (str(), e.g. ['AAPL'] and True), None as
+        # null like the empty csv value when read
+        values = json.dumps(
+            [[None if row.get(h) is None else str(row.get(h)) for h in self.header] for row in data]
+        )
+        columns = ", ".join(
+            f"TRY_CAST(row[{n}] AS {dtype})" if dtype != "VARCHAR" else f"row[{n}]"
+            for n, dtype in enumerate(self.get_types(), start=1)
+        )
+        self.conn.execute(
+            f"INSERT INTO {self.table} SELECT {columns} "
+            """FROM (SELECT UNNEST(from_json(?, '[["VARCHAR"]]')) AS row)""",
+            [values],
+        )
+        self.rows += len(data)
+        self.memory_rows += len(data)
+        if self.memory_rows >= self.spill_rows:
+            self.spill()
+
+    def get_types(self) -> list[str]:
+        """Return DuckDB types of header fields, text if not typed."""
+
+        return [
+            (
+                DUCKDB_TYPES[self.fields_mapping[field][1]]
+                if field in self.fields_mapping
+                else "VARCHAR"
+            )
+            for field in self.header
+        ]
+
+    def spill(self):
+        """Move rows in memory to a Parquet file."""
+
+        os.makedirs(self.directory, exist_ok=True)
+        file_path = os.path.join(
+            self.directory, f"{self.name}_{self.table}_{len(self.spilled_files)}.parquet"
+        )
+        self.conn.execute(
+            f"COPY {self.table} TO '{file_path}' "
+            f"(FORMAT parquet, COMPRESSION {self.compression}, ROW_GROUP_SIZE {self.spill_rows})"
+        )
+        self.conn.execute(f"DELETE FROM {self.table}")
+        self.spilled_files.append(file_path)
+        self.memory_rows = 0
+
+    def query(self) -> str:
+        """Return SQL query selecting all rows, in memory and in spilled files."""
+
+        query = f"SELECT * FROM {self.table}"
+        if not self.spilled_files:
+            return query
+        file_paths = ", ".join(f"'{file_path}'" for file_path in self.spilled_files)
+        return f"SELECT * FROM read_parquet([{file_paths}]) UNION ALL {query}"
+
+    def read(self) -> tuple[duckdb.DuckDBPyConnection, duckdb.DuckDBPyRelation]:
+        """Return a new connection to the buffer database and a relation of all rows."""
+
+        conn = self.conn.cursor()
+        return conn, conn.sql(self.query())
+
+    def from_query(self, conn: duckdb.DuckDBPyConnection, query: str, name: str) -> "StepBuffer":
+        """Return a new buffer, in the same database, with rows of query.
+        Rows stay spilled if this buffer was spilled.
+
+        conn -- connection running query, from read.
+        """
+
+        buffer = StepBuffer(self.settings, name, self.conn, self.fields_mapping)
+        buffer.header = self.header
+        if self.spilled_files:
+            os.makedirs(self.directory, exist_ok=True)
+            file_path = os.path.join(self.directory, f"{name}_{buffer.table}_0.parquet")
+            conn.execute(
+                f"COPY ({query}) TO '{file_path}' (FORMAT parquet, COMPRESSION {self.compression})"
+            )
+            buffer.spilled_files.append(file_path)
+            query = f"SELECT * FROM read_parquet('{file_path}') LIMIT 0"
+        conn.execute(f"CREATE TABLE {buffer.table} AS {query}")
+        buffer.rows = conn.execute(f"SELECT count(*) FROM ({buffer.query()})").fetchall()[0][0]
+        buffer.memory_rows = 0 if self.spilled_files else buffer.rows
+        return buffer
+
+    def close(self):
+        """Drop rows in memory and spilled files."""
+
+        self.conn.execute(f"DROP TABLE IF EXISTS {self.table}")
+        for file_path in self.spilled_files:
+            clean_temp_file(file_path)
+        self.rows, self.memory_rows, self.spilled_files = 0, 0, []
+
+
+def new_output(settings: Settings, file_path: str, fields_mapping: Optional[dict] = None) -> dict:
+    """Return step output {"file_path", "buffer"} rows are appended to with append_rows.
+    Rows are staged as set in STEP_BUFFER FORMAT:
+        * memory: in a StepBuffer, spilled to Parquet files above SPILL_ROWS rows.
+        * parquet: in a StepBuffer typed with fields_mapping, flushed to Parquet by row group.
+        * csv: appended to file_path. With a buffer, file_path names next steps files.
+    """
+
+    staging_format = settings.STEP_BUFFER["FORMAT"]
+    if staging_format not in STAGING_FORMATS:
+        raise ValueError(f"Invalid staging format: {staging_format}. Options: {STAGING_FORMATS}")
+    output: dict = {"file_path": file_path}
+    if staging_format != "csv":
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        output["buffer"] = StepBuffer(settings, name, fields_mapping=fields_mapping)
+    return output
+
+
+def append_rows(output: dict, data: list[dict], header: Optional[list[str]] = None):
+    """Append rows to output buffer, or to output file_path csv if not buffered."""
+
+    if output.get("buffer") is not None:
+        output["buffer"].append(data, header)
+    else:
+        append_to_file(output["file_path"], data, header)
+
+
+def open_rows(
+    source: Union[str, StepBuffer], all_varchar: bool = True
+) -> tuple[duckdb.DuckDBPyConnection, duckdb.DuckDBPyRelation, list[str]]:
+    """Return (connection, relation, header) of rows in a csv file or a StepBuffer.
+    Relation columns are in header order. StepBuffer rows are text, unless typed (parquet).
+
+    all_varchar -- read csv values as text, instead of detecting types.
+    """
+
+    if isinstance(source, StepBuffer):
+        conn, relation = source.read()
+        return conn, relation, source.header
+    # One connection per call, the default connection is not thread-safe
+    conn = duckdb.connect()
+    return conn, conn.read_csv(source, header=True, all_varchar=all_varchar), read_header(source)
@@ -0,0 +1,96 @@
+# Standard library
+import json
+from operator import itemgetter
+from typing import Callable, Optional, Sequence
+
+# Local
+from .constants import DUCKDB_TYPES
+
+# {table config json: TableSchema}, compiled once by process
+_SCHEMAS: dict[str, "TableSchema"] = {}
+
+
+class TableSchema:
+    """Table config of database_config.json compiled once, shared by steps and handlers.
+
+    fields -- file fields, in table column order.
+    columns -- table columns.
+    types -- database_config.json types, duckdb_types the DuckDB ones.
+    required -- required field mask, in fields order.
+    """
+
+    def __init__(self, table_config: dict):
+        """Precompute table config views."""
+
+        self.table_config = table_config
+        self.table_name: str = table_config["schema"] + "." + table_config["name"]
+        fields_mapping: dict = table_config["fields_mapping"]
+        self.fields: tuple[str, ...] = tuple(fields_mapping)
+        self.columns: tuple[str, ...] = tuple(v[0] for v in fields_mapping.values())
+        self.types: tuple[str, ...] = tuple(v[1] for v in fields_mapping.values())
+        self.duckdb_types: tuple[str, ...] = tuple(DUCKDB_TYPES[t] for t in self.types)
+        required_fields = set(table_config.get("required_fields", []))
+        self.required: tuple[bool, ...] = tuple(f in required_fields for f in self.fields)
+        # {required field: DuckDB type}
+        self.required_types: dict[str, str] = {
+            field: dtype
+            for field, dtype, required in zip(self.fields, self.duckdb_types, self.required)
+            if required
+        }
+        # {table column: file field}
+        self.column_fields: dict[str, str] = dict(zip(self.columns, self.fields))
+        self._getters: dict[tuple, Callable[[tuple], tuple]] = {}
+        self._insert_sql: dict[str, str] = {}
+
+    def get_positions(self, header: Sequence[str]) -> tuple[Optional[int], ...]:
+        """Return header position of each field, None if not in header."""
+
+        header_positions = {field: n for n, field in enumerate(header)}
+        return tuple(header_positions.get(field) for field in self.fields)
+
+    def get_mapper(self, header: Sequence[str]) -> Callable[[tuple], tuple]:
+        """Return function mapping a row in header order to table column order.
+        Fields missing in header are mapped to None. Compiled once by header.
+        """
+
+        header = tuple(header)
+        if header not in self._getters:
+            positions = self.get_positions(header)
+            if None in positions:
+                self._getters[header] = lambda row: tuple(
+                    None if n is None else row[n] for n in positions
+                )
+            elif len(positions) == 1:
+                getter = itemgetter(*positions)
+                self._getters[header] = lambda row: (getter(row),)
+            else:
+                self._getters[header] = itemgetter(*positions)  # type: ignore[arg-type]
+        return self._getters[header]
+
+    def insert_sql(self, parameter_placeholder: str) -> str:
+        """Return INSERT statement of all columns, with client parameter placeholders."""
+
+        if parameter_placeholder not in self._insert_sql:
+            parameters = (parameter_placeholder * len(self.columns)).strip(", ")
+            self._insert_sql[parameter_placeholder] = (
+                f"INSERT INTO {self.table_name} VALUES({parameters})"
+            )
+        return self._insert_sql[parameter_placeholder]
+
+    def create_table_sql(self, type_mapping: Optional[dict] = None) -> str:
+        """Return CREATE TABLE statement, types mapped to the client types if given."""
+
+        columns = "\n, ".join(
+            f"{column} {type_mapping[dtype] if type_mapping else dtype}"
+            for column, dtype in zip(self.columns, self.types)
+        )
+        return f"CREATE TABLE IF NOT EXISTS {self.table_name} \n ({columns}\n )"
+
+
+def get_table_schema(table_config: dict) -> TableSchema:
+    """Return the compiled schema of table_config, compiled once by process."""
+
+    key = json.dumps(table_config, sort_keys=True)
+    if key not in _SCHEMAS:
+        _SCHEMAS[key] = TableSchema(table_config)
+    return _SCHEMAS[key]
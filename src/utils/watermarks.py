@@ -0,0 +1,155 @@
+# Standard library
+from datetime import date, datetime
+from typing import Optional
+
+# Local
+from .get_logger import get_logger
+from .sql_handler import SQLHandler
+from .step_buffer import StepBuffer, open_rows
+from ..abstract.client import Client
+from ..settings import Settings
+
+# Entity of tables tracked as a whole, without entity column
+ALL_ENTITIES = "*"
+
+WATERMARKS_TABLE: dict = {
+    "name": "PIPELINE_WATERMARKS",
+    "schema": "bronze_layer",
+    "fields_mapping": {
+        "table_name": ["table_name", "VARCHAR(255)"],
+        "entity": ["entity", "VARCHAR(255)"],
+        "watermark": ["watermark", "VARCHAR(255)"],
+        "updated_at": ["updated_at", "DATETIME"],
+    },
+    "primary_index": ["table_name", "entity"],
+}
+
+
+class Watermarks:
+    """Freshness of a table, by entity (e.g. ticker), in PIPELINE_WATERMARKS.
+
+    Loaders update the watermarks in the same transaction as the data, so checkers read
+    one row by entity instead of aggregating the whole table.
+    The table "watermark" config defines the column tracked and the optional entity column.
+    """
+
+    def __init__(self, settings: Settings, client: Client, table_config: Optional[dict] = None):
+        """Settings setup.
+        table_config -- Using this replaces the default settings config.
+        """
+
+        self.logger = get_logger(__name__, settings)
+        self.client = client
+        self.table_config = table_config or settings.PIPELINE_TABLE
+        self.table_name = self.table_config["schema"] + "." + self.table_config["name"]
+        self.column: str = self.table_config["watermark"]["column"]
+        self.entity: Optional[str] = self.table_config["watermark"].get("entity")
+        self.data_type = next(
+            v[1] for v in self.table_config["fields_mapping"].values() if v[0] == self.column
+        )
+        self.placeholder = settings.CLIENT_CONFIG["PARAMETER_PLACEHOLDER"].strip(", ")
+        self.watermarks_table = WATERMARKS_TABLE["schema"] + "." + WATERMARKS_TABLE["name"]
+        self.watermarks_handler = SQLHandler(settings, client, WATERMARKS_TABLE)
+        self.table_handler = SQLHandler(settings, client, self.table_config)
+
+    def get(self) -> dict[str, str]:
+        """Return {entity: watermark} of table.
+        Tables loaded before watermarks existed are scanned once to seed them.
+        """
+
+        watermarks = self.read()
+        if not watermarks:
+            watermarks = self.scan()
+            self.write(watermarks)
+        self.logger.debug(f"{self.table_name} watermarks: {len(watermarks)} entities.")
+        return watermarks
+
+    def update(self, watermarks: dict[str, str]):
+        """Upsert watermarks, keeping the latest value of each entity.
+        Run it in a client transaction, to update watermarks with the data they describe.
+        """
+
+        stored = self.read()
+        merged = dict(stored) if stored else self.scan()
+        for entity, value in watermarks.items():
+            merged[entity] = max(value, merged.get(entity, value))
+        self.write({k: v for k, v in merged.items() if stored.get(k) != v})
+
+    def reset(self):
+        """Delete watermarks of table."""
+
+        self.client.execute(
+            f"DELETE FROM {self.watermarks_table} WHERE table_name = '{self.table_name}'"
+        )
+
+    def read(self) -> dict[str, str]:
+        """Return {entity: watermark} stored in PIPELINE_WATERMARKS."""
+
+        is_successful, result = self.watermarks_handler.query(
+            f"SELECT entity, watermark FROM {self.watermarks_table} "
+            f"WHERE table_name = '{self.table_name}'"
+        )
+        if not is_successful:  # pragma: no cover
+            raise KeyError(f"{self.watermarks_table} Table no found.")
+        return dict(result)
+
+    def write(self, watermarks: dict[str, str]):
+        """Replace stored watermarks of entities."""
+
+        if not watermarks:
+            return
+        updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows: list[tuple] = [(self.table_name, k, v, updated_at) for k, v in watermarks.items()]
+        p = self.placeholder
+        self.client.executemany(
+            f"DELETE FROM {self.watermarks_table} WHERE table_name = {p} AND entity = {p}",
+            [row[:2] for row in rows],
+        )
+        self.client.executemany(
+            f"INSERT INTO {self.watermarks_table} VALUES({p}, {p}, {p}, {p})", rows
+        )
+
+    def scan(self) -> dict[str, str]:
+        """Return {entity: watermark} aggregating the whole table."""
+
+        entity = self.entity or f"'{ALL_ENTITIES}'"
+        group_by = f"GROUP BY {self.entity}" if self.entity else ""
+        is_successful, result = self.table_handler.query(
+            f"SELECT {entity}, MAX({self.column}) FROM {self.table_name} {group_by}"
+        )
+        if not is_successful:  # pragma: no cover
+            raise KeyError(f"{self.table_name} Table no found.")
+        self.logger.info(f"Scanned {self.table_name} watermarks.")
+        return {k: self.format(v) for k, v in result if v is not None}
+
+    def compute(self, file_path: str, buffer: Optional[StepBuffer] = None) -> dict[str, str]:
+        """Return {entity: watermark} of a csv file (or buffer rows, if given) to be loaded."""
+
+        # {table column: file field}
+        fields = {v[0]: k for k, v in self.table_config["fields_mapping"].items()}
+        duckdb_conn, raw_file, header = open_rows(buffer or file_path)
+        if fields[self.column] not in header:  # pragma: no cover
+            return {}
+        # DuckDB renames fields differing only by case (e.g. T and t), select them by position
+        column = f'"{raw_file.columns[header.index(fields[self.column])]}"'
+        entity = (
+            f'"{raw_file.columns[header.index(fields[self.entity])]}"'
+            if self.entity
+            else f"'{ALL_ENTITIES}'"
+        )
+        raw_file.create_view("raw_file")
+        result = duckdb_conn.execute(
+            f"SELECT {entity}, MAX({column}) FROM raw_file WHERE {entity} IS NOT NULL GROUP BY 1"
+        ).fetchall()
+        return {k: self.format(v) for k, v in result if v is not None}
+
+    def format(self, value) -> str:
+        """Return watermark as text: %Y-%m-%d for DATE, %Y-%m-%d %H:%M:%S otherwise."""
+
+        if isinstance(value, datetime):
+            value = value.strftime("%Y-%m-%d %H:%M:%S")
+        elif isinstance(value, date):
+            value = value.strftime("%Y-%m-%d")
+        else:
+            value = str(value)
+        return value[:10] if self.data_type == "DATE" else value
@@ -0,0 +1,51 @@
+# Standard library
+import time
+from unittest.mock import patch
+
+# First party
+from src.clients.sqlite_client import SQLiteClient
+from src.pipelines.stock_company_details.steps.extract_stock_company_details import (
+    TickerBasicDetailsExtractor,
+)
+from src.settings import Settings
+
+PAGE_SIZE = 1000
+
+
+@patch("src.pipelines.stock_company_details.steps.extract_stock_company_details.Polygon")
+def get_pages_runtime(n_tickers: int, client: SQLiteClient, settings: Settings, mock_polygon):
+    """Return seconds to page through n_tickers, half of them registered."""
+
+    tickers = [f"T{n}" for n in range(n_tickers)]
+    pages = [
+        {"results": [{"ticker": t} for t in tickers[n : n + PAGE_SIZE]], "next_url": "next"}
+        for n in range(0, n_tickers, PAGE_SIZE)
+    ]
+    pages[-1]["next_url"] = None
+    mock_polygon.return_value.request.side_effect = pages
+    extractor = TickerBasicDetailsExtractor({}, settings, client)
+    extractor.max_pagination = len(pages)
+    start = time.perf_counter()
+    for _ in extractor.get_pages(tickers, tickers[::2]):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    """Benchmark TickerBasicDetailsExtractor.get_pages at 10k and 100k tickers.
+    Runtime should grow linearly (~10x), quadratic membership checks grow ~100x.
+
+    Usage: python -m tests.benchmarks.benchmark_get_pages
+    """
+
+    settings = Settings("stock-company-details-pipeline")
+    settings.CLIENT_CONFIG["DB_PATH"] = "database/mock_stock_database.db"
+    client = SQLiteClient(settings)
+    runtime_10k = min(get_pages_runtime(10_000, client, settings) for _ in range(3))
+    runtime_100k = min(get_pages_runtime(100_000, client, settings) for _ in range(3))
+    print(f"10k tickers: {runtime_10k:.3f}s")
+    print(f"100k tickers: {runtime_100k:.3f}s ({runtime_100k / runtime_10k:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
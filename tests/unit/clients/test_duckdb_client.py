@@ -0,0 +1,66 @@
+# Standard library
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+
+# First party
+from src.clients.duckdb_client import DuckDBClient
+from src.common_steps.load_sql import SQLLoader
+from src.settings import Settings
+from src.utils.sql_handler import SQLHandler
+
+SAMPLE_FILE = "tests/unit/data_samples/stock_daily_prices_sample.csv"
+
+
+class TestDuckDBClient(unittest.TestCase):
+    """Test DuckDBClient."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Class Setup."""
+        cls.temp_directory = tempfile.mkdtemp()
+        cls.settings = Settings("stock-daily-prices-pipeline")
+        cls.settings.CLIENT_CONFIG = dict(
+            cls.settings.CLIENTS_CONFIG["DUCKDB"],
+            DB_PATH=os.path.join(cls.temp_directory, "stock_database_test.duckdb"),
+        )
+        cls.client = DuckDBClient(cls.settings)
+        # Copy before other tests remove the sample
+        cls.sample_file_copy = shutil.copy(SAMPLE_FILE, cls.temp_directory)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Class Teardown."""
+        cls.client.conn.close()
+        shutil.rmtree(cls.temp_directory)
+
+    def test_create_tables(self) -> None:
+        """Test tables of all pipelines are created with DuckDB types."""
+
+        for table_config in self.settings.TABLES.values():
+            for table in table_config if isinstance(table_config, list) else [table_config]:
+                SQLHandler(self.settings, self.client, table)
+                table_name = table["schema"] + "." + table["name"]
+                self.assertEqual(self.client.execute(f"SELECT count(*) FROM {table_name}"), [(0,)])
+
+    def test_load(self) -> None:
+        """Test SQLLoader bulk loads the file with COPY."""
+
+        sql_loader = SQLLoader(
+            {"valid_file_path": self.sample_file_copy, "invalid_file_path": None},
+            self.settings,
+            self.client,
+        )
+        is_successful, _ = sql_loader.run(clean_file=False)
+        rows = self.client.execute(
+            "SELECT count(*), max(date), max(end_window), min(exchange_symbol) "
+            "FROM bronze_layer.STOCK_DAILY_PRICES"
+        )
+
+        self.assertTrue(is_successful)
+        self.assertEqual(rows[0][0], 32)
+        self.assertEqual(rows[0][1], date(2022, 3, 25))
+        self.assertIsInstance(rows[0][2], datetime)
+        self.assertIsInstance(rows[0][3], str)
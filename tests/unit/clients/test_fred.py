@@ -23,12 +23,23 @@ class TestFred(unittest.TestCase):
         cls.mock_settings = Settings("index-daily-close-pipeline")
         os.environ["FRED_KEY"] = "FRED_KEY"
 
-    @patch("src.clients.fred.requests")
-    def test_get_stock_daily_prices(self, mock_requests) -> None:
+    def test_get_stock_daily_prices(self) -> None:
         """Test Polygon.get_stock_daily_prices()."""
 
-        mock_requests.get.return_value = MockGetRequests()
         fred = Fred(self.mock_settings)
-
-        result = fred.request("endpoint")
+        with patch.object(fred.http_client, "get_session") as mock_session:
+            mock_session.return_value.get.return_value = MockGetRequests()
+            result = fred.request("endpoint")
         self.assertTrue(result)
+
+    def test_request_many(self) -> None:
+        """Test Fred.request_many()."""
+
+        fred = Fred(self.mock_settings)
+        with (
+            patch.object(fred.http_client, "get_session") as mock_session,
+            patch.object(fred.rate_limiter, "reserve", return_value=0),
+        ):
+            mock_session.return_value.get.return_value = MockGetRequests()
+            results = list(fred.request_many(["endpoint_1", "endpoint_2", "endpoint_3"]))
+        self.assertEqual(results, [True, True, True])
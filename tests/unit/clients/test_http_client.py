@@ -0,0 +1,80 @@
+# Standard library
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Third party
+import pytest
+
+# First party
+from src.clients.http_client import HTTPClient
+from src.exceptions import MaxRetriesExceededError
+from src.settings import Settings
+from src.utils.rate_limiter import RateLimiter
+
+
+class MockGetRequests:
+    def __init__(self, status_code: int = 200, data: dict = {}) -> None:
+        self.status_code = status_code
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+class TestHTTPClient(unittest.TestCase):
+    """Test HTTPClient."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Class Setup."""
+        cls.settings = Settings("stock-daily-prices-pipeline")
+        cls.http_client = HTTPClient(cls.settings)
+
+    def test_get_session(self) -> None:
+        """Test one keep-alive session is reused per host."""
+
+        session_1 = self.http_client.get_session("https://host_1.com/endpoint_1")
+        session_2 = self.http_client.get_session("https://host_1.com/endpoint_2")
+        session_3 = self.http_client.get_session("https://host_2.com/endpoint_1")
+        self.assertIs(session_1, session_2)
+        self.assertIsNot(session_1, session_3)
+
+    def test_get_retry(self) -> None:
+        """Test HTTPClient.get retries failed requests."""
+
+        rate_limiter = MagicMock(spec=RateLimiter)
+        rate_limiter.reserve.return_value = 0
+        with (
+            patch.object(self.http_client, "get_session") as mock_session,
+            patch.object(self.http_client, "retry_wait", 0),
+        ):
+            mock_session.return_value.get.side_effect = [
+                MockGetRequests(429),
+                MockGetRequests(200, {"results": 1}),
+            ]
+            result = self.http_client.get("url", rate_limiter=rate_limiter, endpoint="endpoint")
+        self.assertEqual(result, {"results": 1})
+        # Each try is subject to the rate limit
+        self.assertEqual(rate_limiter.reserve.call_count, 2)
+
+    def test_get_max_retries(self) -> None:
+        """Test HTTPClient.get raises after max retries."""
+
+        with (
+            patch.object(self.http_client, "get_session") as mock_session,
+            patch.object(self.http_client, "retry_wait", 0),
+        ):
+            mock_session.return_value.get.return_value = MockGetRequests(500)
+            with pytest.raises(MaxRetriesExceededError):
+                self.http_client.get("url")
+        self.assertEqual(mock_session.return_value.get.call_count, self.http_client.max_retries + 1)
+
+    def test_get_many(self) -> None:
+        """Test HTTPClient.get_many returns responses in order."""
+
+        with patch.object(self.http_client, "get_session") as mock_session:
+            mock_session.return_value.get.side_effect = lambda url, **kwargs: MockGetRequests(
+                200, {"url": url}
+            )
+            results = list(self.http_client.get_many([f"url_{i}" for i in range(25)], 4))
+        self.assertEqual(results, [{"url": f"url_{i}"} for i in range(25)])
@@ -23,12 +23,77 @@ class TestPolygon(unittest.TestCase):
         cls.mock_settings = Settings("stock-daily-prices-pipeline")
         os.environ["POLYGON_KEY"] = "POLYGON_KEY"
 
-    @patch("src.clients.polygon.requests")
-    def test_get_stock_daily_prices(self, mock_requests) -> None:
+    def test_get_stock_daily_prices(self) -> None:
         """Test Polygon.get_stock_daily_prices()."""
 
-        mock_requests.get.return_value = MockGetRequests()
         polygon = Polygon(self.mock_settings)
-        for i in range(2):  # test api_limit
-            result = polygon.request("endpoint")
+        with patch.object(polygon.http_client, "get_session") as mock_session:
+            mock_session.return_value.get.return_value = MockGetRequests()
+            for i in range(2):  # test api_limit
+                result = polygon.request("endpoint")
         self.assertTrue(result)
+        mock_session.return_value.get.assert_called_with(
+            "endpoint", params={"apiKey": "POLYGON_KEY"}, headers=None
+        )
+
+    def test_request_many(self) -> None:
+        """Test Polygon.request_many()."""
+
+        polygon = Polygon(self.mock_settings)
+        with (
+            patch.object(polygon.http_client, "get_session") as mock_session,
+            patch.object(polygon.rate_limiter, "reserve", return_value=0),
+        ):
+            mock_session.return_value.get.return_value = MockGetRequests()
+            results = list(polygon.request_many(["endpoint_1", "endpoint_2", "endpoint_3"]))
+        self.assertEqual(results, [True, True, True])
+
+    def test_get_endpoint(self) -> None:
+        """Test Polygon.get_endpoint()."""
+
+        polygon = Polygon(self.mock_settings)
+        url = "https://api.polygon.io/v3/reference/tickers?cursor=abc"
+        self.assertEqual(polygon.get_endpoint(url), "stock_company_details_endpoint")
+        self.assertIsNone(polygon.get_endpoint("unknown"))
+
+    def test_request_cache(self) -> None:
+        """Test cached endpoints are requested only once."""
+
+        polygon = Polygon(self.mock_settings)
+        url = "https://api.polygon.io/v2/aggs/grouped/locale/us/market/stocks/2024-01-02"
+        resp = {"status": "OK", "resultsCount": 1, "results": [{"T": "AAPL"}]}
+        with (
+            patch.object(polygon.http_client, "get_session") as mock_session,
+            patch.object(polygon.response_cache, "get", side_effect=[None, resp]),
+            patch.object(polygon.response_cache, "set") as mock_set,
+            patch.object(polygon.landing_zone, "write") as mock_write,
+        ):
+            mock_session.return_value.get.return_value.status_code = 200
+            mock_session.return_value.get.return_value.json.return_value = resp
+            results = [polygon.request(url) for _ in range(2)]
+        self.assertEqual(results, [resp, resp])
+        mock_session.return_value.get.assert_called_once()
+        mock_set.assert_called_once_with(url, resp)
+        mock_write.assert_called_once_with("polygon", "stock_daily_prices_endpoint", url, resp)
+
+    def test_request_cache_empty(self) -> None:
+        """Test empty responses are cached only by endpoints with a TTL."""
+
+        polygon = Polygon(self.mock_settings)
+        resp = {"status": "OK", "resultsCount": 0}
+        urls = [
+            # Never expires, bars of the day may not be published yet
+            "https://api.polygon.io/v2/aggs/grouped/locale/us/market/stocks/2024-01-02",
+            "https://api.polygon.io/v3/reference/tickers?cursor=abc",
+        ]
+        with (
+            patch.object(polygon.http_client, "get_session") as mock_session,
+            patch.object(polygon.response_cache, "get", return_value=None),
+            patch.object(polygon.response_cache, "set") as mock_set,
+            patch.object(polygon.landing_zone, "write"),
+        ):
+            mock_session.return_value.get.return_value.status_code = 200
+            mock_session.return_value.get.return_value.json.return_value = resp
+            for url in urls:
+                polygon.request(url)
+        mock_set.assert_called_once_with(urls[1], resp)
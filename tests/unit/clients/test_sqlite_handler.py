@@ -52,3 +52,21 @@ class TestSQLHandler(unittest.TestCase):
             "SELECT count(*) FROM BRONZE_LAYER.STOCK_DAILY_PRICES"
         )
         self.assertEqual(result[0][0], 32)
+
+    def test_create_indexes(self):
+        """Test SQLHandler.create_indexes()."""
+
+        self.sqlite_handler.create_indexes()
+        is_successful, result = self.sqlite_handler.query(
+            "SELECT name FROM bronze_layer.sqlite_master WHERE type = 'index'"
+        )
+        self.assertTrue(is_successful)
+        self.assertIn(("stock_daily_prices_exchange_symbol_date_idx",), result)
+        self.assertIn(("stock_daily_prices_date_idx",), result)
+
+    def test_get_order_by(self):
+        """Test SQLHandler.get_order_by() selects sort_key fields by position."""
+
+        header = ["T", "v", "t", "date"]
+        order_by = self.sqlite_handler.get_order_by(header, ["T", "v", "t_1", "date"])
+        self.assertEqual(order_by, 'ORDER BY "T", "date"')
@@ -1,10 +1,19 @@
 # Standard library
+import copy
 import unittest
 from unittest.mock import patch
 
 # First party
+from src.clients.sqlite_client import SQLiteClient
+from src.common_steps.load_sql import SQLLoader
+from src.common_steps.validate import Validator
 from src.common_steps.wikipedia_extractor import WikipediaExtractor
+from src.pipelines.sp500_company_details.steps.transform_sp500_company_details import (
+    SP500Transformer,
+)
 from src.settings import Settings
+from src.utils.page_revisions import PAGE_REVISIONS_TABLE, PageRevisions
+from src.utils.sql_handler import SQLHandler
 from tests.unit.mock_objects.mock_clients import MockResponse
 
 SAMPLE_HTML_FILE = "tests/unit/data_samples/sp500_company_details_sample.txt"
@@ -17,21 +26,121 @@ class TestWikipediaExtractor(unittest.TestCase):
     def setUpClass(cls):
         """Class Setup."""
         cls.settings = Settings("sp500-company-details-pipeline")
+        cls.client = SQLiteClient(cls.settings)
+        cls.revision_response = {"query": {"pages": [{"revisions": [{"revid": 123}]}]}}
 
-    @patch(
-        "src.common_steps.wikipedia_extractor.requests",
-    )
-    def test_run(self, mock_requests) -> None:
+    def setUp(self):
+        """Delete recorded revisions of the test page."""
+        revisions_handler = SQLHandler(self.settings, self.client, PAGE_REVISIONS_TABLE)
+        self.client.execute(
+            f"DELETE FROM {revisions_handler.schema.table_name} WHERE page = 'webpage'"
+        )
+
+    @patch("src.common_steps.wikipedia_extractor.LandingZone")
+    @patch("src.common_steps.wikipedia_extractor.HTTPClient")
+    def test_run(self, mock_http_client, mock_landing_zone) -> None:
         """Test run html extractor."""
 
         with open(SAMPLE_HTML_FILE, "r") as f:
             expected_html = f.read()
-        mock_requests.get.return_value = MockResponse(expected_html)
+        mock_http_client.return_value.get.side_effect = [
+            self.revision_response,
+            MockResponse(expected_html).json(),
+        ]
 
-        html_extractor = WikipediaExtractor("webpage", {}, self.settings)
+        html_extractor = WikipediaExtractor("webpage", {}, self.settings, self.client)
         is_successful, output = html_extractor.run()
         self.assertTrue(is_successful)
 
-        with open(output["file_path"], "r") as f:
+        with open(output["snapshots"][0]["file_path"], "r") as f:
             actual_html = f.read()
         self.assertEqual(expected_html, actual_html)
+        mock_landing_zone.return_value.write.assert_called_once()
+        self.assertEqual(output["page_revisions"], [{"page": "webpage", "revision_id": "123"}])
+        # Revision extracted but not loaded yet
+        self.assertFalse(html_extractor.is_loaded("123"))
+
+    @patch("src.common_steps.wikipedia_extractor.LandingZone")
+    @patch("src.common_steps.wikipedia_extractor.HTTPClient")
+    def test_run_unchanged_revision(self, mock_http_client, _) -> None:
+        """Test the page is not requested if its revision was loaded."""
+
+        mock_http_client.return_value.get.return_value = self.revision_response
+        PageRevisions(self.settings, self.client).record("webpage", "123")
+        html_extractor = WikipediaExtractor("webpage", {}, self.settings, self.client)
+
+        is_successful, output = html_extractor.run()
+        self.assertTrue(is_successful)
+        self.assertTrue(output["skip_pipeline"])
+        mock_http_client.return_value.get.assert_called_once()
+
+    @patch("src.common_steps.wikipedia_extractor.LandingZone")
+    @patch("src.common_steps.wikipedia_extractor.HTTPClient")
+    def test_runs_unchanged_revision(self, mock_http_client, _) -> None:
+        """Test a second run of an unchanged revision is skipped after the first load."""
+
+        with open(SAMPLE_HTML_FILE, "r") as f:
+            html = f.read()
+        mock_http_client.return_value.get.side_effect = [
+            self.revision_response,
+            MockResponse(html).json(),
+            self.revision_response,
+        ]
+        settings = copy.deepcopy(self.settings)
+        settings.PIPELINE_TABLE["name"] = "SP500_COMPANY_DETAILS_REVISIONS_TEST"
+        table_handler = SQLHandler(settings, self.client)
+        table_handler.drop_table()
+        table_handler.create_table()
+        table_name = table_handler.schema.table_name
+
+        def run_pipeline() -> dict:
+            """Run extract, transform, validate and load steps, return extractor output."""
+            _, output = WikipediaExtractor("webpage", {}, settings, self.client).run()
+            if output.get("skip_pipeline"):
+                return output
+            for step in (SP500Transformer, Validator):
+                _, output = step(output, settings).run()
+            SQLLoader(output, settings, self.client).run()
+            return output
+
+        run_pipeline()
+        loaded_rows = self.client.execute(f"SELECT COUNT(*) FROM {table_name}")[0][0]
+        output = run_pipeline()
+
+        self.assertTrue(output["skip_pipeline"])
+        self.assertEqual(mock_http_client.return_value.get.call_count, 3)
+        self.assertEqual(loaded_rows, 502)
+        self.assertEqual(
+            self.client.execute(f"SELECT COUNT(*) FROM {table_name}")[0][0], loaded_rows
+        )
+        table_handler.drop_table()
+
+    @patch("src.common_steps.wikipedia_extractor.LandingZone")
+    @patch("src.common_steps.wikipedia_extractor.HTTPClient")
+    def test_replay(self, mock_http_client, mock_landing_zone) -> None:
+        """Test replay writes every page snapshot, ordered by fetched_at."""
+
+        mock_landing_zone.return_value.read.return_value = iter(
+            [
+                ("url", "2024-01-01T00:00:00", MockResponse("old_html").json()),
+                ("url", "2024-02-01T00:00:00", MockResponse("new_html").json()),
+            ]
+        )
+
+        html_extractor = WikipediaExtractor("webpage", {}, self.settings, self.client)
+        with patch.object(self.settings, "replay", True):
+            is_successful, output = html_extractor.run()
+        self.assertTrue(is_successful)
+
+        snapshots = output["snapshots"]
+        self.assertEqual(
+            [snapshot["fetched_at"] for snapshot in snapshots],
+            ["2024-01-01T00:00:00", "2024-02-01T00:00:00"],
+        )
+        for snapshot, expected_html in zip(snapshots, ["old_html", "new_html"]):
+            with open(snapshot["file_path"], "r") as f:
+                self.assertEqual(f.read(), expected_html)
+        mock_landing_zone.return_value.read.assert_called_once_with(
+            "wikipedia", "webpage", latest_only=False
+        )
+        mock_http_client.return_value.get.assert_not_called()
@@ -1,10 +1,13 @@
 # Standard library
+import copy
 import unittest
 
 # First party
 from src.clients.sqlite_client import SQLiteClient
 from src.common_steps.load_sql import SQLLoader
 from src.settings import Settings
+from src.utils.sql_handler import SQLHandler
+from tests.unit.mock_objects.mock_clients import MockBulkCopyClient
 
 
 class TestLoadSQLite(unittest.TestCase):
@@ -32,3 +35,108 @@ class TestLoadSQLite(unittest.TestCase):
 
         is_successful, output = self.sqlite_client.run(clean_file=False)
         self.assertTrue(is_successful)
+
+    def test_run_bulk_copy(self) -> None:
+        """Test clients supporting bulk copy load the mapped file at once."""
+
+        client = MockBulkCopyClient()
+        sql_loader = SQLLoader(
+            {
+                "valid_file_path": "tests/unit/data_samples/stock_daily_prices_sample.csv",
+                "invalid_file_path": None,
+            },
+            self.settings,
+            client,
+        )
+        is_successful, _ = sql_loader.run(clean_file=False)
+
+        self.assertTrue(is_successful)
+        # Merge load mode copies into the staging table
+        self.assertEqual(client.copied_table, "bronze_layer.STOCK_DAILY_PRICES_STAGING")
+        self.assertEqual(client.copied_columns[:2], ("date", "exchange_symbol"))
+        header, first_row = client.copied_rows[0], client.copied_rows[1]
+        self.assertEqual(len(header), len(client.copied_columns))
+        self.assertEqual(len(client.copied_rows), 33)  # header + 32 rows
+        # date, exchange_symbol and end_window (t) values, sorted by sort_key
+        self.assertEqual(first_row[:2], ["2022-03-25", "ACR"])
+        self.assertEqual(first_row[8], "2022-03-25 20:00:00")
+        exchange_symbols = [row[1] for row in client.copied_rows[1:]]
+        self.assertEqual(exchange_symbols, sorted(exchange_symbols))
+
+    def test_run_merge(self) -> None:
+        """Test merge loads are idempotent: rows already loaded are not duplicated."""
+
+        settings = Settings("stock-daily-prices-pipeline")
+        settings.CLIENT_CONFIG["DB_PATH"] = "database/stock_database_test.db"
+        settings.PIPELINE_TABLE = copy.deepcopy(settings.PIPELINE_TABLE)
+        settings.PIPELINE_TABLE["name"] = "STOCK_DAILY_PRICES_MERGE_TEST"
+        client = SQLiteClient(settings)
+        SQLHandler(settings, client).drop_table()
+        previous_output = {
+            "valid_file_path": "tests/unit/data_samples/stock_daily_prices_sample.csv",
+            "invalid_file_path": None,
+        }
+
+        for _ in range(2):
+            SQLLoader(previous_output, settings, client).run(clean_file=False)
+
+        rows = client.execute(
+            "SELECT count(*), count(DISTINCT exchange_symbol || date) "
+            "FROM bronze_layer.STOCK_DAILY_PRICES_MERGE_TEST"
+        )
+        self.assertEqual(rows, [(32, 32)])
+        tables = client.execute(
+            "SELECT name FROM bronze_layer.sqlite_master WHERE name LIKE '%MERGE_TEST_STAGING'"
+        )
+        self.assertEqual(tables, [])
+
+    def test_merge_null_key(self) -> None:
+        """Test merge matches NULL natural key values and keeps the latest staged duplicate."""
+
+        table_config = {
+            "name": "MERGE_NULL_KEY_TEST",
+            "schema": "bronze_layer",
+            "fields_mapping": {
+                "ticker": ["ticker", "VARCHAR(255)"],
+                "timeframe": ["timeframe", "VARCHAR(255)"],
+                "updated_at": ["updated_at", "DATETIME"],
+            },
+            "natural_key": ["ticker", "timeframe"],
+        }
+        sql_handler = SQLHandler(self.settings, self.client, table_config)
+        sql_handler.drop_table()
+        sql_handler.create_table()
+        staging_handler = SQLHandler(self.settings, self.client, sql_handler.get_staging_config())
+        header = ("ticker", "timeframe", "updated_at")
+
+        for updated_at in ["2024-01-01 00:00:00", "2024-02-01 00:00:00"]:
+            staging_handler.drop_table()
+            staging_handler.create_table()
+            staging_handler.insert_into(
+                [("AAPL", None, "2023-12-01 00:00:00"), ("AAPL", None, updated_at)], header
+            )
+            sql_handler.merge_from(staging_handler.schema.table_name)
+
+        rows = self.client.execute(f"SELECT * FROM {sql_handler.schema.table_name}")
+        self.assertEqual(rows, [("AAPL", None, "2024-01-01 00:00:00")])
+
+    def test_merge_query_plan(self) -> None:
+        """Test merge searches the table index by the whole natural key."""
+
+        settings = Settings("stock-daily-prices-pipeline")
+        settings.CLIENT_CONFIG["DB_PATH"] = "database/stock_database_test.db"
+        settings.PIPELINE_TABLE = copy.deepcopy(settings.PIPELINE_TABLE)
+        settings.PIPELINE_TABLE["name"] = "STOCK_DAILY_PRICES_MERGE_PLAN_TEST"
+        client = SQLiteClient(settings)
+        sql_handler = SQLHandler(settings, client)
+        staging_handler = SQLHandler(settings, client, sql_handler.get_staging_config())
+
+        plan = client.execute(
+            "EXPLAIN QUERY PLAN " + sql_handler.get_merge_query(staging_handler.schema.table_name)
+        )
+        sql_handler.drop_table()
+        staging_handler.drop_table()
+
+        details = [row[-1] for row in plan]
+        self.assertIn("(exchange_symbol=? AND date=?)", " ".join(details))
+        self.assertFalse([detail for detail in details if "MULTI-INDEX OR" in detail])
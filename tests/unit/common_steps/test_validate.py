@@ -1,5 +1,7 @@
 # Standard library
 import os
+import shutil
+import tempfile
 import unittest
 
 # Third party
@@ -8,6 +10,7 @@ import duckdb
 # First party
 from src.common_steps.validate import Validator
 from src.settings import Settings
+from src.utils.csv_handler import read_header
 
 SAMPLE_VALID_FILE = "tests/unit/data_samples/stock_daily_prices_sample.csv"
 SAMPLE_INVALID_FILE = "tests/unit/data_samples/invalid_stock_daily_prices_sample.csv"
@@ -20,6 +23,14 @@ class TestValidator(unittest.TestCase):
     def setUpClass(cls):
         """Class Setup."""
         cls.settings = Settings("stock-daily-prices-pipeline")
+        # Copy before other tests remove the samples
+        cls.temp_directory = tempfile.mkdtemp()
+        cls.invalid_file_copy = shutil.copy(SAMPLE_INVALID_FILE, cls.temp_directory)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Class Teardown."""
+        shutil.rmtree(cls.temp_directory)
 
     def test_run_valid(self) -> None:
         """Test run validator with valid data only."""
@@ -54,3 +65,26 @@ class TestValidator(unittest.TestCase):
 
         raw_file = duckdb.read_csv(invalid_file_path, header=True).fetchall()
         self.assertEqual(len(raw_file), 3)
+
+    def test_run_split(self) -> None:
+        """Test valid and invalid files keep the header and rows as they are."""
+
+        file_path = self.invalid_file_copy
+        header = read_header(file_path)
+        with open(file_path, "r") as f:
+            rows = f.read().splitlines()[1:]
+        validator = Validator({"file_path": file_path}, self.settings)
+        validator.run()
+
+        with open(validator.output["valid_file_path"], "r") as f:
+            valid_lines = f.read().splitlines()
+        with open(validator.output["invalid_file_path"], "r") as f:
+            invalid_lines = f.read().splitlines()
+
+        # T and t are distinct fields
+        self.assertIn("T", header)
+        self.assertIn("t", header)
+        self.assertEqual(valid_lines[0], ",".join(header))
+        self.assertEqual(invalid_lines[0], ",".join(header))
+        self.assertEqual(sorted(valid_lines[1:] + invalid_lines[1:]), sorted(rows))
+        self.assertEqual(len(invalid_lines[1:]), 3)
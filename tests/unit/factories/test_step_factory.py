@@ -16,6 +16,7 @@ class TestStepFactory(unittest.TestCase):
         mock_output = {
             "file_path": "path",
             "files_path": ["paths"],
+            "snapshots": [],
             "valid_file_path": "path",
             "invalid_file_path": "path",
         }
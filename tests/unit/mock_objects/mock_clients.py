@@ -1,5 +1,7 @@
 # Standard library
+import csv
 import logging
+from contextlib import contextmanager
 
 
 class MockSQLHandler:
@@ -37,6 +39,10 @@ class MockPolygon:
         """Mock request method."""
         return self.response
 
+    def request_many(self, urls: list[str]) -> list[dict]:
+        """Mock request_many method."""
+        return [self.response for _ in urls]
+
 
 class MockResponse:
     def __init__(self, text: str) -> None:
@@ -46,3 +52,33 @@ class MockResponse:
     def json(self) -> dict:
         """Mock json method."""
         return {"parse": {"text": {"*": self.text}}}
+
+
+class MockBulkCopyClient:
+    """Mock client supporting bulk copy."""
+
+    supports_bulk_copy = True
+
+    def __init__(self, *args, **kwargs):
+        """Mock client."""
+        self.copied_rows: list[list[str]] = []
+
+    def execute(self, query: str) -> list:
+        """Mock execute method."""
+        return []
+
+    def executemany(self, query: str, mapped_values: list[tuple]):
+        """Mock executemany method."""
+        pass
+
+    @contextmanager
+    def transaction(self):
+        """Mock transaction method."""
+        yield
+
+    def copy_from(self, table_name: str, columns: tuple, file_path: str):
+        """Mock copy_from method, store copied rows."""
+        self.copied_table = table_name
+        self.copied_columns = columns
+        with open(file_path, "r", newline="") as f:
+            self.copied_rows = list(csv.reader(f))
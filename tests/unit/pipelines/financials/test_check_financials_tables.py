@@ -1,5 +1,4 @@
 # Standard library
-from datetime import datetime
 from unittest.mock import patch
 
 # Third party
@@ -15,9 +14,11 @@ get_last_update_test_cases = TestCaseLoader("unit/pipelines/financials/get_last_
 
 
 @pytest.mark.parametrize(*get_last_update_test_cases)
+@patch("src.pipelines.financials.steps.check_financials_tables.Watermarks")
 @patch("src.pipelines.financials.steps.check_financials_tables.SQLHandler")
 def test_get_last_update(
     mock_sql_handler,
+    mock_watermarks,
     required_tickers: list[str],
     expected_query_results: list,
     expected_result: dict,
@@ -25,12 +26,8 @@ def test_get_last_update(
     """Test FinancialsChecker.test_get_last_update."""
 
     # Arrange
-    # json: list[list[str, str]] -> query results: list[tuple[str, datetime]]
-    formatted_expected_query_results = [
-        [(row[0], datetime.strptime(row[1], "%Y-%m-%d")) for row in query_result]
-        for query_result in expected_query_results
-    ]
-    mock_sql_handler.return_value = MockSQLHandler(formatted_expected_query_results)
+    # json: list[list[str, str]] -> watermarks: {ticker: last end_date}
+    mock_watermarks.return_value.get.return_value = dict(expected_query_results[0])
     settings = Settings("financials-pipeline")
     financials_checker = FinancialsChecker({}, settings, None)
     # Act
@@ -39,8 +36,9 @@ def test_get_last_update(
     assert next_update == expected_result
 
 
+@patch("src.pipelines.financials.steps.check_financials_tables.Watermarks")
 @patch("src.pipelines.financials.steps.check_financials_tables.SQLHandler")
-def test_get_required_tickers(mock_sql_handler):
+def test_get_required_tickers(mock_sql_handler, mock_watermarks):
     """Test SQLManyLoader."""
 
     # Arrange
@@ -24,6 +24,39 @@ def test_request_ticker(mock_polygon):
     assert response == {"RESULTS": "MOCK_RESULTS"}
 
 
+@patch("src.pipelines.financials.steps.extract_financials_data.Polygon")
+def test_request_tickers(mock_polygon):
+    """Test FinancialsExtractor.request_tickers."""
+
+    # Arrange
+    mock_polygon.return_value = MockPolygon({"RESULTS": "MOCK_RESULTS"})
+    settings = Settings("financials-pipeline")
+    financials_extractor = FinancialsExtractor({}, settings)
+    # Act
+    responses = list(financials_extractor.request_tickers(["TICKER_1", "TICKER_2"]))
+    # Assert
+    assert responses == [{"RESULTS": "MOCK_RESULTS"}, {"RESULTS": "MOCK_RESULTS"}]
+
+
+@patch("src.pipelines.financials.steps.extract_financials_data.Polygon")
+def test_request_tickers_resumed(mock_polygon):
+    """Test tickers completed by a resumed run are requested ignoring the cache TTL."""
+
+    # Arrange
+    mock_polygon.return_value.request_many.side_effect = lambda urls, ignore_ttl=False: (
+        {"url": url, "ignore_ttl": ignore_ttl} for url in urls
+    )
+    settings = Settings("financials-pipeline")
+    financials_extractor = FinancialsExtractor({}, settings)
+    # Act
+    responses = list(
+        financials_extractor.request_tickers(["TICKER_1", "TICKER_2"], frozenset(["TICKER_1"]))
+    )
+    # Assert
+    assert [r["ignore_ttl"] for r in responses] == [True, False]
+    assert "ticker=TICKER_1" in responses[0]["url"]
+
+
 @patch("src.pipelines.financials.steps.extract_financials_data.Polygon", MockPolygon)
 def test_filter_results():
     """Test FinancialsExtractor.filter_results."""
@@ -48,6 +81,45 @@ def test_filter_results():
     ]
 
 
+@patch("src.pipelines.financials.steps.extract_financials_data.Polygon", MockPolygon)
+def test_build_request():
+    """Test incremental requests filter filings after the ticker last date."""
+    # Arrange
+    settings = Settings("financials-pipeline")
+    previous_output = {
+        "required_tickers": {"TICKER_NAME": {"next_date": "2024-09-31", "last_date": "2024-06-01"}}
+    }
+    financials_extractor = FinancialsExtractor(previous_output, settings)
+    # Act
+    incremental_url = financials_extractor.build_request("TICKER_NAME")
+    financials_extractor.fetch_mode = "full"
+    full_url = financials_extractor.build_request("TICKER_NAME")
+    # Assert
+    assert "period_of_report_date.gt=2024-06-01" in incremental_url
+    assert "include_sources=false" in incremental_url
+    assert "period_of_report_date.gt" not in full_url
+
+
+@patch("src.pipelines.financials.steps.extract_financials_data.Polygon")
+def test_get_new_results(mock_polygon):
+    """Test next pages are requested only while new filings remain."""
+    # Arrange
+    mock_polygon.return_value.request.side_effect = [
+        {"results": [{"end_date": "2024-08-01"}, {"end_date": "2024-05-01"}], "next_url": "n2"},
+    ]
+    settings = Settings("financials-pipeline")
+    previous_output = {
+        "required_tickers": {"TICKER_NAME": {"next_date": "2024-09-31", "last_date": "2024-06-01"}}
+    }
+    financials_extractor = FinancialsExtractor(previous_output, settings)
+    data = {"results": [{"end_date": "2024-12-01"}], "next_url": "n1"}
+    # Act
+    results = financials_extractor.get_new_results(data, "TICKER_NAME")
+    # Assert
+    assert results == [{"end_date": "2024-12-01"}, {"end_date": "2024-08-01"}]
+    mock_polygon.return_value.request.assert_called_once_with("n1")
+
+
 @patch("src.pipelines.financials.steps.extract_financials_data.Polygon", MockPolygon)
 def test_enrich_results():
     """Test FinancialsExtractor.enrich_results."""
@@ -126,3 +198,29 @@ def test_map_to_file():
     ]
     # Assert
     assert result == expected_result
+
+
+def test_get_url_ticker():
+    """Test next pages are matched to the ticker of the first page of their chain."""
+
+    # Arrange
+    settings = Settings("financials-pipeline")
+    financials_extractor = FinancialsExtractor({}, settings)
+    first_url = "https://api.polygon.io/vX/reference/financials?ticker=AAPL&limit=100"
+    previous_urls = {
+        "https://api.polygon.io/vX/reference/financials?cursor=page_2": first_url,
+        "https://api.polygon.io/vX/reference/financials?cursor=page_3": (
+            "https://api.polygon.io/vX/reference/financials?cursor=page_2"
+        ),
+    }
+    # Act
+    tickers = [
+        financials_extractor.get_url_ticker(url, previous_urls)
+        for url in [
+            first_url,
+            "https://api.polygon.io/vX/reference/financials?cursor=page_3",
+            "https://api.polygon.io/vX/reference/financials?cursor=orphan",
+        ]
+    ]
+    # Assert
+    assert tickers == ["AAPL", "AAPL", None]
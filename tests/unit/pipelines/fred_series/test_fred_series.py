@@ -0,0 +1,137 @@
+# Standard library
+import copy
+import csv
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+# First party
+from src.clients.sqlite_client import SQLiteClient
+from src.common_steps.load_sql import SQLLoader
+from src.common_steps.validate import Validator
+from src.pipelines.fred_series.steps.check_fred_series import FredSeriesChecker
+from src.pipelines.fred_series.steps.extract_fred_series import (
+    SERIES_CHECKS_TABLE,
+    FredSeriesExtractor,
+)
+from src.settings import Settings
+from src.utils.csv_handler import clean_temp_file
+from src.utils.sql_handler import SQLHandler
+from src.utils.watermarks import Watermarks
+
+SAMPLE_REQUEST_FILE = "tests/unit/data_samples/extract_index_daily_close_sample.json"
+
+
+class TestFredSeries(unittest.TestCase):
+    """Test FredSeriesChecker and FredSeriesExtractor."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Class Setup."""
+        cls.settings = Settings("fred-series-pipeline")
+        cls.client = SQLiteClient(cls.settings)
+
+    @patch("src.pipelines.fred_series.steps.check_fred_series.Watermarks")
+    def test_check(self, mock_watermarks) -> None:
+        """Test only stale series are required."""
+
+        checker = FredSeriesChecker({}, self.settings, self.client)
+        fresh_watermarks = {series_id: "9999-01-01" for series_id in checker.catalog}
+        mock_watermarks.return_value.get.side_effect = [
+            fresh_watermarks,  # Skip, all series fresh
+            {**fresh_watermarks, "DGS10": "2024-06-26"},  # Run, one stale series
+        ]
+
+        _, output = checker.run()
+        self.assertTrue(output["skip_pipeline"])
+        _, output = checker.run()
+        self.assertFalse(output["skip_pipeline"])
+        self.assertEqual(output["series_last_update"], {"DGS10": "2024-06-26"})
+
+    @patch("src.pipelines.index_daily_close.steps.extract_index_daily_close.Fred")
+    def test_run(self, mock_fred) -> None:
+        """Test one request by stale series, written in one file."""
+
+        with open(SAMPLE_REQUEST_FILE, "r") as file:
+            sample_request_result = json.load(file)
+        mock_fred.return_value.request_many.side_effect = lambda urls: (
+            sample_request_result for _ in urls
+        )
+
+        previous_output = {"series_last_update": {"DGS10": "2024-01-01", "UNRATE": "1600-01-01"}}
+        extractor = FredSeriesExtractor(previous_output, self.settings, self.client)
+        is_successful, output = extractor.run()
+
+        self.assertTrue(is_successful)
+        (urls,) = mock_fred.return_value.request_many.call_args.args
+        self.assertEqual(len(urls), 2)
+        self.assertIn("series_id=DGS10&observation_start=2024-01-02", urls[0])
+        with open(output["file_path"], mode="r") as file:
+            rows = list(csv.DictReader(file))
+        clean_temp_file(output["file_path"])
+        self.assertEqual({row["series_id"] for row in rows}, {"DGS10", "UNRATE"})
+        self.assertEqual(len(rows), 2 * len(sample_request_result["observations"]))
+
+    @patch("src.pipelines.index_daily_close.steps.extract_index_daily_close.Fred")
+    def test_run_without_new_observations(self, mock_fred) -> None:
+        """Test series without new observations are not requested again until rechecked."""
+
+        checks_handler = SQLHandler(self.settings, self.client, SERIES_CHECKS_TABLE)
+        self.client.execute(f"DELETE FROM {checks_handler.schema.table_name}")
+        mock_fred.return_value.request_many.side_effect = lambda urls: (
+            {"count": 0, "observations": []} for _ in urls
+        )
+
+        previous_output = {"series_last_update": {"CPIAUCSL": "2024-03-01"}}
+        extractor = FredSeriesExtractor(previous_output, self.settings, self.client)
+        extractor.run()
+
+        checker = FredSeriesChecker({}, self.settings, self.client)
+        self.assertEqual(list(checker.get_last_checked()), ["CPIAUCSL"])
+        with patch.object(checker, "catalog", {"CPIAUCSL": {"frequency": "monthly"}}):
+            with patch.object(checker.watermarks, "get", return_value={"CPIAUCSL": "2024-03-01"}):
+                self.assertEqual(checker.get_stale_series(), {})
+
+    @patch("src.pipelines.index_daily_close.steps.extract_index_daily_close.Fred")
+    def test_run_twice(self, mock_fred) -> None:
+        """Test series loaded or checked by a run are not stale in the next check."""
+
+        settings = copy.deepcopy(self.settings)
+        settings.PIPELINE_TABLE["name"] = "FRED_SERIES_OBSERVATIONS_RUN_TWICE_TEST"
+        table_handler = SQLHandler(settings, self.client)
+        table_handler.drop_table()
+        table_handler.create_table()
+        watermarks = Watermarks(settings, self.client)
+        watermarks.reset()
+        watermarks.write({"CPIAUCSL": "2020-01-01"})
+        checks_handler = SQLHandler(settings, self.client, SERIES_CHECKS_TABLE)
+        self.client.execute(f"DELETE FROM {checks_handler.schema.table_name}")
+        # Observation of last month, the next one is released next month
+        today = date.today()
+        last_month = date(today.year - (today.month == 1), (today.month - 2) % 12 + 1, 1)
+        responses = {
+            "CPIAUCSL": {"count": 1, "observations": [{"date": str(last_month), "value": "1"}]},
+            "DGS10": {"count": 0, "observations": []},
+        }
+        mock_fred.return_value.request_many.side_effect = lambda urls: (
+            next(v for k, v in responses.items() if f"series_id={k}&" in url) for url in urls
+        )
+        catalog = {"CPIAUCSL": {"frequency": "monthly"}, "DGS10": {"frequency": "daily"}}
+
+        def check() -> dict:
+            """Return output of FredSeriesChecker with the test catalog."""
+            checker = FredSeriesChecker({}, settings, self.client)
+            with patch.object(checker, "catalog", catalog):
+                return checker.run()[1]
+
+        output = check()
+        _, output = FredSeriesExtractor(output, settings, self.client).run()
+        _, output = Validator(output, settings).run()
+        SQLLoader(output, settings, self.client).run()
+        second_output = check()
+
+        table_handler.drop_table()
+        self.assertEqual(mock_fred.return_value.request_many.call_count, 1)
+        self.assertEqual(second_output["series_last_update"], {})
+        self.assertTrue(second_output["skip_pipeline"])
@@ -29,12 +29,33 @@ class TestExtractGroupedDaily(unittest.TestCase):
     def test_run(self, mock_polygon) -> None:
         """Test create pipeline."""
 
-        # Mock API result
+        # Mock API result, parsed for each request as results are enriched in place
         with open(SAMPLE_REQUEST_FILE, "r") as file:
-            sample_request_result = json.load(file)
-        mock_polygon.return_value.request.return_value = sample_request_result
+            sample_request_text = file.read()
+        mock_polygon.return_value.request_many.side_effect = lambda urls: (
+            json.loads(sample_request_text) for _ in urls
+        )
 
         # Extract
         extractor = StockDailyPriceExtractor({}, self.settings, self.client)
         is_successful, output = extractor.run()
         self.assertTrue(is_successful)
+
+    def test_plan_request_dates(self) -> None:
+        """Test only missing trading days are planned, newest first."""
+
+        settings = Settings("stock-daily-prices-pipeline")
+        settings.CLIENT_CONFIG["DB_PATH"] = "database/mock_stock_database.db"
+        settings.POLYGON["POLYGON_MAX_DAYS_HIST"] = 10
+        settings.POLYGON["POLYGON_UPDATE_UNTIL"] = "2024-04-03"
+        extractor = StockDailyPriceExtractor({}, settings, self.client)
+
+        # 2024-03-29 is Good Friday, 2024-03-26 is a gap
+        loaded_dates = {"2024-03-25", "2024-03-27", "2024-03-28", "2024-04-01"}
+        with patch.object(extractor, "get_loaded_dates", return_value=loaded_dates):
+            request_dates = extractor.plan_request_dates()
+            settings.POLYGON["BACKFILL_ORDER"] = "oldest"
+            backfill_dates = extractor.plan_request_dates()
+
+        self.assertEqual(request_dates, ["2024-04-02", "2024-03-26"])
+        self.assertEqual(backfill_dates, sorted(request_dates))
@@ -20,17 +20,15 @@ class TestIndexDailyCloseChecker(unittest.TestCase):
         cls.client = SQLiteClient(cls.settings)
         cls.indexes = cls.settings.FRED["INDEXES"]
 
-    @patch("src.pipelines.index_daily_close.steps.check_index_daily_close.SQLHandler")
-    def test_run(self, mock_sqlite) -> None:
+    @patch("src.pipelines.index_daily_close.steps.check_index_daily_close.Watermarks")
+    def test_run(self, mock_watermarks) -> None:
         """Test run."""
 
-        query_result_skip = [
-            (index, datetime.today().strftime("%Y-%m-%d")) for index in self.indexes
-        ]
-        mock_sqlite.return_value.query.side_effect = [
-            (True, query_result_skip),  # Skip, all indexes updated
-            (True, [("SP500", "2024-06-27")]),  # Run, missing indexes
-            (True, []),  # Run
+        watermarks_skip = {index: datetime.today().strftime("%Y-%m-%d") for index in self.indexes}
+        mock_watermarks.return_value.get.side_effect = [
+            watermarks_skip,  # Skip, all indexes updated
+            {"SP500": "2024-06-27"},  # Run, missing indexes
+            {},  # Run
         ]
 
         index_checker = IndexDailyCloseChecker({}, self.settings, self.client)
@@ -1,12 +1,15 @@
 # Standard library
 import csv
 import json
+import tempfile
 import unittest
 from unittest.mock import patch
 
 # First party
 from src.pipelines.index_daily_close.steps.extract_index_daily_close import IndexDailyCloseExtractor
 from src.settings import Settings
+from src.utils.csv_handler import clean_temp_file
+from src.utils.landing_zone import LandingZone
 
 SAMPLE_REQUEST_FILE = "tests/unit/data_samples/extract_index_daily_close_sample.json"
 
@@ -27,7 +30,9 @@ class TestIndexDailyCloseExtractor(unittest.TestCase):
         # Mock API result
         with open(SAMPLE_REQUEST_FILE, "r") as file:
             sample_request_result = json.load(file)
-        mock_fred.return_value.request.return_value = sample_request_result
+        mock_fred.return_value.request_many.side_effect = lambda urls: (
+            sample_request_result for _ in urls
+        )
 
         # Extract
         previous_output = {"indexes_last_update": {"SP500": "1600-01-01"}}
@@ -50,3 +55,30 @@ class TestIndexDailyCloseExtractor(unittest.TestCase):
         total_value = sum([round(float(v), 0) for v in data["value"] if v])
         self.assertEqual(index_code, "SP500")
         self.assertEqual(total_value, 42701)
+
+    def test_replay(self) -> None:
+        """Test replay from the landing zone, without API calls."""
+
+        with open(SAMPLE_REQUEST_FILE, "r") as file:
+            sample_request_result = json.load(file)
+        landing_zone = LandingZone(self.settings)
+        extractor = IndexDailyCloseExtractor({}, self.settings)
+        clean_temp_file(extractor.file_path)
+        with (
+            tempfile.TemporaryDirectory() as landing_directory,
+            patch.object(landing_zone, "directory", landing_directory),
+            patch.object(landing_zone, "enabled", True),
+            patch.object(self.settings, "replay", True),
+        ):
+            # Overlapping incremental requests
+            for observation_start in ["2024-01-01", "2024-02-01"]:
+                url = f"series/observations?series_id=SP500&observation_start={observation_start}"
+                landing_zone.write("fred", "index_daily_close", url, sample_request_result)
+            is_successful, output = extractor.run()
+
+        self.assertTrue(is_successful)
+        with open(output["file_path"], mode="r") as file:
+            rows = list(csv.DictReader(file))
+        clean_temp_file(output["file_path"])
+        self.assertEqual(len(rows), len(sample_request_result["observations"]))
+        self.assertEqual({row["index"] for row in rows}, {"SP500"})
@@ -23,13 +23,13 @@ class TestSP500Checker(unittest.TestCase):
         cls.client = SQLiteClient(cls.settings)
         cls.previous_output = {"file_path": SAMPLE_HTML_FILE}
 
-    @patch("src.pipelines.sp500_company_details.steps.check_sp500_company_details.SQLHandler")
-    def test_run(self, mock_sqlite) -> None:
+    @patch("src.pipelines.sp500_company_details.steps.check_sp500_company_details.Watermarks")
+    def test_run(self, mock_watermarks) -> None:
         """Test run."""
 
-        mock_sqlite.return_value.query.side_effect = [
-            (True, [(datetime.today().strftime("%Y-%m-%d %H:%M:%S"),)]),  # Skip
-            (True, [(datetime(1990, 1, 1).strftime("%Y-%m-%d %H:%M:%S"),)]),  # Run
+        mock_watermarks.return_value.get.side_effect = [
+            {"*": datetime.today().strftime("%Y-%m-%d %H:%M:%S")},  # Skip
+            {"*": datetime(1990, 1, 1).strftime("%Y-%m-%d %H:%M:%S")},  # Run
         ]
         sp500_checker = SP500Checker({}, self.settings, self.client)
 
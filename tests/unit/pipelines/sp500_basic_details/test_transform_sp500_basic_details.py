@@ -22,7 +22,7 @@ class TestSP500Transformer(unittest.TestCase):
     def setUpClass(cls):
         """Class Setup."""
         cls.settings = Settings("sp500-company-details-pipeline")
-        cls.previous_output = {"file_path": SAMPLE_HTML_FILE}
+        cls.previous_output = {"snapshots": [{"file_path": SAMPLE_HTML_FILE, "fetched_at": None}]}
 
     def test_run(self) -> None:
         """Test run."""
@@ -39,3 +39,12 @@ class TestSP500Transformer(unittest.TestCase):
         actual_data = duckdb.read_csv(output["file_path"], header=True).fetchall()
         expected_data = duckdb.read_csv(EXPECTED_RESULT, header=True).fetchall()
         self.assertEqual(len(actual_data), len(expected_data))
+
+    def test_get_sp500_table_snapshot(self) -> None:
+        """Test rows of a replayed snapshot are updated at the snapshot time."""
+
+        sp500_transformer = SP500Transformer(self.previous_output, self.settings)
+        with open(SAMPLE_HTML_FILE, "r") as f:
+            html = f.read()
+        rows, _ = sp500_transformer.get_sp500_table(html, "2024-01-01T10:00:00")
+        self.assertEqual({row["updated_at"] for row in rows}, {"2024-01-01 10:00:00"})
@@ -1,5 +1,6 @@
 # Standard library
 import json
+import os
 import unittest
 from unittest.mock import patch
 
@@ -46,10 +47,69 @@ class TestExtractTickerDetails(unittest.TestCase):
         is_successful, _ = extractor.run()
         self.assertTrue(is_successful)
 
+    @patch(
+        "src.pipelines.stock_company_details.steps.extract_stock_company_details."
+        "TickerBasicDetailsExtractor.get_required_tickers"
+    )
+    @patch("src.pipelines.stock_company_details.steps.extract_stock_company_details.Polygon")
+    def test_stream(self, mock_polygon, mock_tickers) -> None:
+        """Test stream yields one file by page of missing tickers."""
+
+        with open(SAMPLE_REQUEST_FILE, "r") as file:
+            sample_request_result = json.load(file)
+        mock_polygon.return_value.request.return_value = sample_request_result
+        tickers = [r["ticker"] for r in sample_request_result["results"]]
+        mock_tickers.return_value = (tickers, tickers[:5])
+
+        extractor = TickerBasicDetailsExtractor({}, self.settings, self.client)
+        (batch,) = list(extractor.stream())
+
+        with open(batch["file_path"], "r") as f:
+            self.assertEqual(len(f.readlines()), len(tickers) - 5 + 1)  # + header
+        os.remove(batch["file_path"])
+
+    @patch(
+        "src.pipelines.stock_company_details.steps.extract_stock_company_details."
+        "TickerBasicDetailsExtractor.get_required_tickers"
+    )
+    @patch("src.pipelines.stock_company_details.steps.extract_stock_company_details.Polygon")
+    def test_stream_no_missing_tickers(self, mock_polygon, mock_tickers) -> None:
+        """Test stream does not request Polygon without missing tickers."""
+
+        mock_tickers.return_value = (set(), {"AAPL"})
+
+        extractor = TickerBasicDetailsExtractor({}, self.settings, self.client)
+
+        self.assertEqual(list(extractor.stream()), [])
+        mock_polygon.return_value.request.assert_not_called()
+
     @patch("src.pipelines.stock_company_details.steps.extract_stock_company_details.SQLHandler")
     def test_get_required_tickers(self, mock_sql):
-        """ """
-        mock_sql.return_value.query.return_value = True, ["ticker1", "ticker2"]
+        """Test required tickers are queried with an anti-join."""
+        mock_sql.return_value.query.side_effect = [
+            (True, [("ticker1",), ("ticker2",)]),
+            (True, [("ticker3",)]),
+        ]
         extractor = TickerBasicDetailsExtractor({}, self.settings, self.client)
-        required_tickers, _ = extractor.get_required_tickers()
-        self.assertEqual(required_tickers, [])
+        required_tickers, registered_tickers = extractor.get_required_tickers()
+        self.assertEqual(required_tickers, {"ticker1", "ticker2"})
+        self.assertEqual(registered_tickers, {"ticker3"})
+        self.assertIn("NOT EXISTS", mock_sql.return_value.query.call_args_list[0].args[0])
+
+    @patch("src.pipelines.stock_company_details.steps.extract_stock_company_details.Polygon")
+    def test_get_pages(self, mock_polygon):
+        """Test only missing and unregistered tickers are yielded, by page.
+        Scaling is benchmarked in tests/benchmarks/benchmark_get_pages.py.
+        """
+
+        tickers = [f"T{n}" for n in range(9)]
+        mock_polygon.return_value.request.side_effect = [
+            {"results": [{"ticker": t} for t in tickers[:3]], "next_url": "next_1"},
+            {"results": [{"ticker": t} for t in tickers[3:6]], "next_url": "next_2"},
+            {"results": [{"ticker": t} for t in tickers[6:]], "next_url": None},
+        ]
+        extractor = TickerBasicDetailsExtractor({}, self.settings, self.client)
+
+        pages = list(extractor.get_pages(tickers[:5], tickers[::2]))
+
+        self.assertEqual([[r["ticker"] for r in page] for page in pages], [["T1"], ["T3", "T5"]])
@@ -0,0 +1,19 @@
+# Standard library
+from datetime import datetime
+
+# First party
+from src.utils.batch_enrich import enrich_batch
+
+
+def test_enrich_batch():
+    """Test timestamps are converted and fields added in place, one updated_at by batch."""
+
+    # Arrange
+    data = [{"T": "AAPL", "t": 1704229200000}, {"T": "MSFT", "t": 1704229200000}, {"T": "X"}]
+    # Act
+    enriched_data = enrich_batch(data, {"date": "2024-01-02"}, timestamp_fields=("t",))
+    # Assert
+    assert enriched_data is data
+    assert [row["t"] for row in data] == [datetime(2024, 1, 2, 21), datetime(2024, 1, 2, 21), None]
+    assert {row["date"] for row in data} == {"2024-01-02"}
+    assert len({row["updated_at"] for row in data}) == 1
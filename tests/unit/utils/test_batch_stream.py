@@ -0,0 +1,93 @@
+# Standard library
+import threading
+
+# Third party
+import pytest
+
+# First party
+from src.settings import Settings
+from src.utils.batch_stream import BatchStream
+
+SETTINGS = Settings("stock-daily-prices-pipeline")
+
+
+def test_run():
+    """Test each batch runs through all steps, in order."""
+
+    # Arrange
+    loaded = []
+
+    def run_step(step: str, previous_output: dict) -> dict:
+        if step == "validate":
+            return {"valid": previous_output["batch"]}
+        loaded.append(previous_output["valid"])
+        return {}
+
+    batch_stream = BatchStream(SETTINGS, ["validate", "load"], max_queued_batches=1)
+    # Act
+    processed = batch_stream.run(({"batch": n} for n in range(5)), run_step)
+    # Assert
+    assert processed == 5
+    assert loaded == [0, 1, 2, 3, 4]
+
+
+def test_run_close_step():
+    """Test close_step runs once by step, in the thread running the step."""
+
+    # Arrange
+    step_threads: dict[str, set] = {"validate": set(), "load": set()}
+    closed = []
+
+    def run_step(step: str, previous_output: dict) -> dict:
+        step_threads[step].add(threading.get_ident())
+        return previous_output
+
+    def close_step(step: str):
+        closed.append((step, threading.get_ident()))
+
+    batch_stream = BatchStream(SETTINGS, ["validate", "load"], max_queued_batches=1)
+    # Act
+    batch_stream.run(({"batch": n} for n in range(3)), run_step, close_step)
+    # Assert
+    assert sorted(closed) == sorted((step, *threads) for step, threads in step_threads.items())
+
+
+def test_run_overlap():
+    """Test batches are loaded while the next ones are extracted."""
+
+    # Arrange: second batch is extracted only after the first one is loaded
+    first_loaded = threading.Event()
+
+    def batches():
+        yield {"batch": 0}
+        assert first_loaded.wait(timeout=5)
+        yield {"batch": 1}
+
+    batch_stream = BatchStream(SETTINGS, ["load"], max_queued_batches=1)
+    # Act
+    processed = batch_stream.run(batches(), lambda step, output: first_loaded.set())
+    # Assert
+    assert processed == 2
+
+
+def test_run_failed():
+    """Test a failed step stops the stream and its error is raised."""
+
+    # Arrange
+    extracted = []
+
+    def batches():
+        for n in range(100):
+            extracted.append(n)
+            yield {"batch": n}
+
+    def run_step(step: str, previous_output: dict) -> dict:
+        if previous_output["batch"] == 1:
+            raise ValueError("Load failed")
+        return {}
+
+    batch_stream = BatchStream(SETTINGS, ["load"], max_queued_batches=1)
+    # Act / Assert
+    with pytest.raises(ValueError, match="Load failed"):
+        batch_stream.run(batches(), run_step)
+    assert len(extracted) < 100
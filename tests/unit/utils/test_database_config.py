@@ -11,6 +11,10 @@ def test_database_config():
     def assert_table_config(table: dict):
         assert all(key in table.keys() for key in ["schema", "name", "fields_mapping"])
         assert table["schema"] in PIPELINES.schemas
+        # Indexes and sort keys reference table columns
+        columns = [v[0] for v in table["fields_mapping"].values()]
+        indexed_columns = sum(table.get("secondary_indexes", []), table.get("primary_index", []))
+        assert set(indexed_columns + table.get("sort_key", [])) <= set(columns)
 
     with open("src/database_config.json", "r") as file:
         tables_config = json.load(file)
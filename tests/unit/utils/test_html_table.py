@@ -0,0 +1,83 @@
+# Third party
+import pytest
+
+# First party
+from src.utils.html_table import find_table, read_html_table
+
+HTML = """
+<p>Page</p>
+<table class="wikitable">
+<tr><th>Other</th></tr><tr><td>skipped</td></tr>
+</table>
+<table class="wikitable sortable">
+<tr><th>Symbol</th><th>Security\n</th></tr>
+<tr><td><a class="external text" href="https://quote/MMM">MMM</a></td><td>3M<sup>[1]</sup></td></tr>
+<tr><td colspan="2">Sub header</td></tr>
+<tr><td>AOS</td><td>A. O. Smith <table><tr><td>nested</td></tr></table></td></tr>
+</table>
+"""
+
+
+def test_read_html_table():
+    """Test read_html_table returns the columns of the selected table."""
+
+    # Act
+    header, columns, skipped_rows = read_html_table(
+        HTML, "wikitable sortable", link_class="external text"
+    )
+    # Assert
+    assert header == ["Symbol", "Security"]
+    assert skipped_rows == 1
+    assert columns == {
+        "Symbol": ["MMM", "AOS"],
+        "Security": ["3M[1]", "A. O. Smith nested"],
+        "url": ["https://quote/MMM", None],
+    }
+
+
+def test_read_html_table_spans():
+    """Test read_html_table expands rowspan, colspan and two-row headers."""
+
+    # Arrange
+    html = """
+    <table class="wikitable">
+    <tr><th rowspan="2">Date</th><th colspan="2">Added</th><th colspan="2">Removed</th></tr>
+    <tr><th>Ticker</th><th>Security</th><th>Ticker</th><th>Security</th></tr>
+    <tr><td rowspan="2">2024-03-18</td><td>SMCI</td><td>Super Micro</td>
+    <td>WHR</td><td>Whirlpool</td></tr>
+    <tr><td>DECK</td><td>Deckers</td><td colspan="2">(none)</td></tr>
+    <tr><td>2024-01-01</td><td>Too</td><td>few</td></tr>
+    </table>
+    """
+    # Act
+    header, columns, skipped_rows = read_html_table(html, "wikitable")
+    # Assert
+    assert header == [
+        "Date",
+        "Added Ticker",
+        "Added Security",
+        "Removed Ticker",
+        "Removed Security",
+    ]
+    assert columns == {
+        "Date": ["2024-03-18", "2024-03-18"],
+        "Added Ticker": ["SMCI", "DECK"],
+        "Added Security": ["Super Micro", "Deckers"],
+        "Removed Ticker": ["WHR", "(none)"],
+        "Removed Security": ["Whirlpool", "(none)"],
+    }
+    assert skipped_rows == 1
+
+
+def test_find_table():
+    """Test find_table isolates tables by class and index."""
+
+    # Act
+    first_table = find_table(HTML, "wikitable")
+    second_table = find_table(HTML, "wikitable", index=1)
+    # Assert
+    assert "Other" in first_table and "Symbol" not in first_table
+    assert second_table.startswith('<table class="wikitable sortable">')
+    assert second_table.endswith("</td></tr>\n</table>")
+    with pytest.raises(ValueError):
+        find_table(HTML, "wikitable", index=2)
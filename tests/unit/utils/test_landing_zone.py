@@ -0,0 +1,84 @@
+# Standard library
+import os
+from unittest.mock import patch
+
+# Third party
+import pytest
+
+# First party
+from src.settings import Settings
+from src.utils.landing_zone import LandingZone
+
+
+@pytest.fixture
+def landing_zone(tmp_path):
+    """Landing zone in a temp directory."""
+
+    zone = LandingZone(Settings("stock-daily-prices-pipeline"))
+    with (
+        patch.object(zone, "directory", str(tmp_path)),
+        patch.object(zone, "enabled", True),
+    ):
+        yield zone
+
+
+def test_write(landing_zone):
+    """Test LandingZone.write partitions files by source, endpoint and date."""
+
+    # Act
+    landing_zone.write("polygon", "endpoint", "https://api.com/endpoint", {"status": "OK"})
+    # Assert
+    endpoint_directory = os.path.join(landing_zone.directory, "polygon", "endpoint")
+    (date_directory,) = os.listdir(endpoint_directory)
+    (file_name,) = os.listdir(os.path.join(endpoint_directory, date_directory))
+    assert file_name.startswith("part-")
+    assert file_name.endswith(".ndjson.gz")
+
+
+def test_read(landing_zone):
+    """Test LandingZone.read returns the latest response of each url."""
+
+    # Arrange
+    landing_zone.write("polygon", "endpoint", "https://api.com/endpoint_1", {"data": 1})
+    landing_zone.write("polygon", "endpoint", "https://api.com/endpoint_2", {"data": 2})
+    landing_zone.write("polygon", "endpoint", "https://api.com/endpoint_1", {"data": 3})
+    landing_zone.write("polygon", "other_endpoint", "https://api.com/other", {"data": 4})
+    # Act
+    responses = [(url, response) for url, _, response in landing_zone.read("polygon", "endpoint")]
+    # Assert
+    assert responses == [
+        ("https://api.com/endpoint_2", {"data": 2}),
+        ("https://api.com/endpoint_1", {"data": 3}),
+    ]
+
+
+def test_read_all(landing_zone):
+    """Test LandingZone.read returns every response with latest_only False."""
+
+    # Arrange
+    landing_zone.write("wikipedia", "page", "https://api.com/page", {"data": 1})
+    landing_zone.write("wikipedia", "page", "https://api.com/page", {"data": 2})
+    # Act
+    responses = [r for _, _, r in landing_zone.read("wikipedia", "page", latest_only=False)]
+    # Assert
+    assert responses == [{"data": 1}, {"data": 2}]
+
+
+def test_read_missing(landing_zone):
+    """Test LandingZone.read without landing files."""
+
+    # Act
+    responses = list(landing_zone.read("polygon", "endpoint"))
+    # Assert
+    assert responses == []
+
+
+def test_disabled(landing_zone):
+    """Test disabled landing zone does not store responses."""
+
+    # Arrange
+    landing_zone.enabled = False
+    # Act
+    landing_zone.write("polygon", "endpoint", "https://api.com/endpoint", {"status": "OK"})
+    # Assert
+    assert os.listdir(landing_zone.directory) == []
@@ -0,0 +1,55 @@
+# Third party
+import pytest
+
+# First party
+from src.utils.market_calendar import get_holidays, get_trading_days
+
+
+@pytest.mark.parametrize(
+    "year, holidays",
+    [
+        (
+            2022,  # New Year's Day on Saturday, not observed
+            [
+                "2022-01-17",
+                "2022-02-21",
+                "2022-04-15",
+                "2022-05-30",
+                "2022-06-20",
+                "2022-07-04",
+                "2022-09-05",
+                "2022-11-24",
+                "2022-12-26",
+            ],
+        ),
+        (
+            2024,
+            [
+                "2024-01-01",
+                "2024-01-15",
+                "2024-02-19",
+                "2024-03-29",
+                "2024-05-27",
+                "2024-06-19",
+                "2024-07-04",
+                "2024-09-02",
+                "2024-11-28",
+                "2024-12-25",
+            ],
+        ),
+    ],
+)
+def test_get_holidays(year, holidays):
+    """Test NYSE holidays, observed on weekdays."""
+
+    assert sorted(d.isoformat() for d in get_holidays(year)) == holidays
+
+
+def test_get_trading_days():
+    """Test weekends and holidays are skipped, end date excluded."""
+
+    # Act
+    trading_days = get_trading_days("2024-03-27", "2024-04-02")
+    # Assert
+    assert trading_days == ["2024-03-27", "2024-03-28", "2024-04-01"]
+    assert len(get_trading_days("2024-01-01", "2025-01-01")) == 252
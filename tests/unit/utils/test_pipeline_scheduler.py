@@ -0,0 +1,80 @@
+# Standard library
+import threading
+
+# Third party
+import pytest
+
+# First party
+from src.settings import Settings
+from src.utils.constants import PIPELINES
+from src.utils.get_logger import get_logger
+from src.utils.pipeline_scheduler import PipelineScheduler
+
+DEPENDENCIES = {"b": ("a",), "c": ("b",)}
+LOGGER = get_logger(__name__, Settings("financials-pipeline"))
+
+
+def test_run_dependencies():
+    """Test pipelines start only after their dependencies."""
+
+    # Arrange
+    finished = []
+    scheduler = PipelineScheduler(
+        ("c", "b", "a", "d"), max_parallel=4, logger=LOGGER, dependencies=DEPENDENCIES
+    )
+    # Act
+    status = scheduler.run(finished.append)
+    # Assert
+    assert finished.index("a") < finished.index("b") < finished.index("c")
+    assert status == {"a": "success", "b": "success", "c": "success", "d": "success"}
+
+
+def test_run_parallel():
+    """Test independent pipelines run concurrently."""
+
+    # Arrange: each pipeline waits for the other to start
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler = PipelineScheduler(
+        ("a", "d"), max_parallel=2, logger=LOGGER, dependencies=DEPENDENCIES
+    )
+    # Act
+    status = scheduler.run(lambda pipeline: barrier.wait())
+    # Assert
+    assert status == {"a": "success", "d": "success"}
+
+
+def test_run_failed():
+    """Test dependents of a failed pipeline are skipped and the error is raised."""
+
+    # Arrange
+    finished = []
+
+    def run_pipeline(pipeline: str):
+        if pipeline == "a":
+            raise ValueError("Pipeline failed")
+        finished.append(pipeline)
+
+    scheduler = PipelineScheduler(
+        ("a", "b", "c", "d"), max_parallel=1, logger=LOGGER, dependencies=DEPENDENCIES
+    )
+    # Act
+    with pytest.raises(ValueError):
+        scheduler.run(run_pipeline)
+    # Assert
+    assert finished == ["d"]
+
+
+def test_dependencies_out_of_scope():
+    """Test dependencies out of scope are not waited for."""
+
+    # Act
+    scheduler = PipelineScheduler(("financials-pipeline",), max_parallel=1, logger=LOGGER)
+    # Assert
+    assert scheduler.dependencies == {"financials-pipeline": set()}
+
+
+def test_pipelines_dependencies():
+    """Test PIPELINES.dependencies only reference existing pipelines."""
+
+    for pipeline, dependencies in PIPELINES.dependencies.items():
+        assert set((pipeline,) + dependencies) <= set(PIPELINES.get_all_pipelines())
@@ -0,0 +1,99 @@
+# Standard library
+import copy
+import csv
+
+# Third party
+import pytest
+
+# First party
+from src.clients.sqlite_client import SQLiteClient
+from src.common_steps.load_sql import SQLLoader
+from src.common_steps.validate import Validator
+from src.settings import Settings
+from src.utils.csv_handler import append_to_file, read_header
+from src.utils.quality_rules import QUALITY_SUMMARY_TABLE
+from src.utils.sql_handler import SQLHandler
+
+SUMMARY_TABLE = f"{QUALITY_SUMMARY_TABLE['schema']}.{QUALITY_SUMMARY_TABLE['name']}"
+TABLE_NAME = "bronze_layer.STOCK_DAILY_PRICES_QUALITY_TEST"
+
+
+@pytest.fixture
+def settings():
+    """Stock daily prices settings, loading into a test table."""
+
+    settings = Settings("stock-daily-prices-pipeline")
+    settings.CLIENT_CONFIG["DB_PATH"] = "database/quality_rules_test.db"
+    settings.PIPELINE_TABLE = copy.deepcopy(settings.PIPELINE_TABLE)
+    settings.PIPELINE_TABLE["name"] = "STOCK_DAILY_PRICES_QUALITY_TEST"
+    return settings
+
+
+@pytest.fixture
+def file_path(tmp_path) -> str:
+    """Daily prices file: 1 row, then a negative price, high < low and a newer duplicate."""
+
+    row = {
+        "T": "AAPL",
+        "v": 100,
+        "vw": 1.5,
+        "o": 1.0,
+        "c": 2.0,
+        "h": 3.0,
+        "l": 0.5,
+        "t": "2024-01-02 21:00:00",
+        "n": 10,
+        "date": "2024-01-02",
+        "updated_at": "2024-01-03 10:00:00",
+    }
+    rows = [
+        row,
+        {**row, "T": "MSFT", "o": -1.0},
+        {**row, "T": "NVDA", "h": 0.1},
+        {**row, "updated_at": "2024-01-04 10:00:00"},
+    ]
+    file_path = str(tmp_path / "prices.csv")
+    append_to_file(file_path, rows)
+    return file_path
+
+
+def test_validate(settings, file_path):
+    """Test rows violating rules are quarantined, with violations by rule."""
+
+    # Act
+    _, output = Validator({"file_path": file_path}, settings).run()
+    # Assert
+    summary = {rule["rule"]: rule for rule in output["quality_summary"]}
+    assert summary["positive_prices"]["violations"] == 1
+    assert summary["high_gte_low"]["violations"] == 1
+    assert summary["unique_symbol_date"]["violations"] == 1
+    assert summary["required_T"]["violations"] == 0
+    assert summary["positive_prices"]["checked_rows"] == 4
+    assert '"T": "MSFT"' in summary["positive_prices"]["sample_rows"]
+    with open(output["invalid_file_path"], "r") as f:
+        assert len(f.read().splitlines()) == 3 + 1  # + header
+    assert read_header(output["valid_file_path"]) == read_header(output["invalid_file_path"])
+    # The newest duplicate is kept
+    with open(output["valid_file_path"], "r") as f:
+        valid_rows = list(csv.DictReader(f))
+    assert [(row["T"], row["updated_at"]) for row in valid_rows] == [
+        ("AAPL", "2024-01-04 10:00:00")
+    ]
+
+
+def test_load_quality_summary(settings, file_path):
+    """Test SQLLoader writes the summary once by run."""
+
+    # Arrange
+    client = SQLiteClient(settings)
+    SQLHandler(settings, client, QUALITY_SUMMARY_TABLE)
+    client.execute(f"DELETE FROM {SUMMARY_TABLE} WHERE table_name = '{TABLE_NAME}'")
+    _, output = Validator({"file_path": file_path}, settings).run()
+    # Act
+    SQLLoader(output, settings, client).run()
+    # Assert
+    result = client.execute(
+        f"SELECT rule, violations FROM {SUMMARY_TABLE} WHERE table_name = '{TABLE_NAME}'"
+    )
+    assert len(result) == len(output["quality_summary"])
+    assert ("high_gte_low", 1) in result
@@ -0,0 +1,51 @@
+# Standard library
+from unittest.mock import patch
+
+# First party
+from src.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+@patch("src.utils.rate_limiter.monotonic")
+def test_token_bucket_reserve(mock_monotonic):
+    """Test TokenBucket.reserve."""
+
+    # Arrange
+    mock_monotonic.return_value = 0
+    bucket = TokenBucket(capacity=2, refill_rate=1)
+    # Act
+    wait_times = [bucket.reserve() for _ in range(4)]
+    # Assert: burst of 2, then callers queue one second apart
+    assert wait_times == [0, 0, 1, 2]
+
+
+@patch("src.utils.rate_limiter.monotonic")
+def test_token_bucket_refill(mock_monotonic):
+    """Test TokenBucket refill is capped by capacity."""
+
+    # Arrange
+    mock_monotonic.return_value = 0
+    bucket = TokenBucket(capacity=2, refill_rate=1)
+    bucket.reserve(2)
+    # Act
+    mock_monotonic.return_value = 100
+    wait_times = [bucket.reserve() for _ in range(3)]
+    # Assert
+    assert wait_times == [0, 0, 1]
+
+
+@patch("src.utils.rate_limiter.sleep")
+@patch("src.utils.rate_limiter.monotonic")
+def test_rate_limiter_endpoint_limits(mock_monotonic, mock_sleep):
+    """Test RateLimiter.acquire with endpoint buckets."""
+
+    # Arrange
+    mock_monotonic.return_value = 0
+    endpoint_limits = {"slow_endpoint": {"CALLS_PER_MIN": 6, "BURST": 1}}
+    rate_limiter = RateLimiter(calls_per_min=60, burst=10, endpoint_limits=endpoint_limits)
+    # Act
+    fast_wait_times = [rate_limiter.acquire("fast_endpoint") for _ in range(2)]
+    slow_wait_times = [rate_limiter.acquire("slow_endpoint") for _ in range(2)]
+    # Assert
+    assert fast_wait_times == [0, 0]
+    assert slow_wait_times == [0, 10]
+    mock_sleep.assert_called_once_with(10)
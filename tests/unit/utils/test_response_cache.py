@@ -0,0 +1,91 @@
+# Standard library
+import os
+from unittest.mock import patch
+
+# Third party
+import pytest
+
+# First party
+from src.settings import Settings
+from src.utils.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Response cache in a temp directory."""
+
+    response_cache = ResponseCache(Settings("stock-daily-prices-pipeline"))
+    with (
+        patch.object(response_cache, "directory", str(tmp_path)),
+        patch.object(response_cache, "enabled", True),
+        patch.object(response_cache, "size", 0),
+    ):
+        yield response_cache
+
+
+def test_get_set(cache):
+    """Test ResponseCache.get and ResponseCache.set."""
+
+    # Act
+    missing = cache.get("https://api.com/endpoint", ttl=None)
+    cache.set("https://api.com/endpoint", {"status": "OK"})
+    result = cache.get("https://api.com/endpoint", ttl=None)
+    # Assert
+    assert missing is None
+    assert result == {"status": "OK"}
+    assert cache.size == os.path.getsize(cache._get_path("https://api.com/endpoint"))
+
+
+def test_get_expired(cache):
+    """Test expired entries are not returned."""
+
+    # Arrange
+    cache.set("https://api.com/endpoint", {"status": "OK"})
+    created_at = os.path.getmtime(cache._get_path("https://api.com/endpoint"))
+    # Act
+    with patch("src.utils.response_cache.time", return_value=created_at + 100):
+        valid = cache.get("https://api.com/endpoint", ttl=200)
+        expired = cache.get("https://api.com/endpoint", ttl=50)
+    # Assert
+    assert valid == {"status": "OK"}
+    assert expired is None
+
+
+def test_get_key(cache):
+    """Test credentials are not part of the cache key."""
+
+    # Act
+    key_1 = cache.get_key("https://api.com/endpoint?date=1&apiKey=key_1")
+    key_2 = cache.get_key("https://api.com/endpoint?date=1&apiKey=key_2")
+    key_3 = cache.get_key("https://api.com/endpoint?date=2&apiKey=key_1")
+    # Assert
+    assert key_1 == key_2
+    assert key_1 != key_3
+
+
+def test_evict(cache):
+    """Test least recently used entries are evicted."""
+
+    # Arrange
+    for i in range(3):
+        cache.set(f"https://api.com/endpoint_{i}", {"data": i})
+        os.utime(cache._get_path(f"https://api.com/endpoint_{i}"), (i, i))
+    # Act: limit fits 2 entries
+    with patch.object(cache, "max_size", cache.size - 1):
+        cache.evict()
+    # Assert
+    assert cache.get("https://api.com/endpoint_0", ttl=None) is None
+    assert cache.get("https://api.com/endpoint_1", ttl=None) == {"data": 1}
+    assert cache.get("https://api.com/endpoint_2", ttl=None) == {"data": 2}
+
+
+def test_disabled(cache):
+    """Test disabled cache does not store responses."""
+
+    # Arrange
+    cache.enabled = False
+    # Act
+    cache.set("https://api.com/endpoint", {"status": "OK"})
+    # Assert
+    assert os.listdir(cache.directory) == []
+    assert cache.get("https://api.com/endpoint", ttl=None) is None
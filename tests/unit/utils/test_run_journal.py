@@ -0,0 +1,95 @@
+# Standard library
+import os
+
+# Third party
+import pytest
+
+# First party
+from src.settings import Settings
+from src.utils.run_journal import RunJournal
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Settings with the run journal in a temp directory."""
+
+    settings = Settings("financials-pipeline")
+    settings.RUN_JOURNAL = {"ENABLED": True, "DB_PATH": os.path.join(tmp_path, "journal.db")}
+    return settings
+
+
+def test_checkpoints(settings):
+    """Test RunJournal.add, RunJournal.get and cursors."""
+
+    # Arrange
+    journal = RunJournal(settings)
+    run_id = journal.start()
+    # Act
+    journal.add("ticker", ["AAPL", "MSFT"])
+    journal.add("ticker", ["AAPL"])
+    journal.set_cursor("next_url", "https://api.com/next_1")
+    journal.set_cursor("next_url", "https://api.com/next_2")
+    # Assert
+    assert run_id is not None and settings.run_id == run_id
+    assert journal.get("ticker") == {"AAPL", "MSFT"}
+    assert journal.get("date") == set()
+    assert journal.get_cursor("next_url") == "https://api.com/next_2"
+    assert journal.get_cursor("missing") is None
+    journal.close()
+
+
+def test_connection(settings):
+    """Test a journal instance reuses one connection until closed."""
+
+    # Arrange
+    journal = RunJournal(settings)
+    journal.start()
+    conn = journal.conn
+    # Act
+    journal.add("ticker", ["AAPL"])
+    journal.set_cursor("next_url", "https://api.com/next_1")
+    is_same_conn = journal.conn is conn
+    step_journal = RunJournal(settings)
+    completed = step_journal.get("ticker")
+    journal.close()
+    step_journal.close()
+    # Assert
+    assert is_same_conn
+    assert journal._conn is None
+    assert completed == {"AAPL"}
+
+
+def test_resume(settings):
+    """Test resumed runs continue the latest unfinished run only."""
+
+    # Arrange
+    journal = RunJournal(settings)
+    failed_run_id = journal.start()
+    journal.add("ticker", ["AAPL"])
+    # Act
+    settings.resume = True
+    resumed_run_id = journal.start()
+    completed = journal.get("ticker")
+    journal.finish()
+    new_run_id = journal.start()
+    # Assert
+    assert resumed_run_id == failed_run_id
+    assert completed == {"AAPL"}
+    assert new_run_id != failed_run_id
+    assert journal.get("ticker") == set()
+    journal.close()
+
+
+def test_disabled(settings):
+    """Test journal methods are no-ops when disabled."""
+
+    # Arrange
+    settings.RUN_JOURNAL["ENABLED"] = False
+    journal = RunJournal(settings)
+    # Act
+    run_id = journal.start()
+    journal.add("ticker", ["AAPL"])
+    # Assert
+    assert run_id is None
+    assert journal.get("ticker") == set()
+    assert not os.path.exists(settings.RUN_JOURNAL["DB_PATH"])
@@ -0,0 +1,93 @@
+# Third party
+import pytest
+
+# First party
+from src.utils.series_catalog import (
+    get_next_observation,
+    get_release_date,
+    get_stale_series,
+    load_series_catalog,
+)
+
+
+@pytest.mark.parametrize(
+    "last_date, frequency, next_observation",
+    [
+        ("2024-06-28", "daily", "2024-06-29"),
+        ("2024-06-22", "weekly", "2024-06-29"),
+        ("2024-12-01", "monthly", "2025-01-01"),
+        ("2024-10-01", "quarterly", "2025-01-01"),
+        ("2024-01-01", "annual", "2025-01-01"),
+    ],
+)
+def test_get_next_observation(last_date, frequency, next_observation):
+    """Test get_next_observation."""
+
+    assert get_next_observation(last_date, frequency) == next_observation
+
+
+@pytest.mark.parametrize(
+    "last_date, frequency, release_date",
+    [
+        ("2024-06-26", "daily", "2024-06-28"),
+        ("2024-06-27", "daily", "2024-07-01"),  # Friday observation, published Monday
+        ("2024-06-28", "daily", "2024-07-02"),  # Monday observation after the weekend
+        ("2024-06-22", "weekly", "2024-06-29"),
+        ("2024-03-01", "monthly", "2024-05-01"),
+        ("2024-01-01", "quarterly", "2024-07-01"),
+    ],
+)
+def test_get_release_date(last_date, frequency, release_date):
+    """Test get_release_date, the end of the period of the next observation."""
+
+    assert get_release_date(last_date, frequency) == release_date
+
+
+def test_get_stale_series():
+    """Test only series with an observation released are stale."""
+
+    # Arrange
+    catalog = {
+        "DGS10": {"frequency": "daily"},
+        "CPIAUCSL": {"frequency": "monthly"},
+        "CPILFESL": {"frequency": "monthly"},
+        "GDPC1": {"frequency": "quarterly"},
+        "UNRATE": {"frequency": "monthly"},
+    }
+    last_update = {
+        "DGS10": "2024-07-01",
+        "CPIAUCSL": "2024-05-01",
+        "CPILFESL": "2024-06-01",
+        "GDPC1": "2024-04-01",
+    }
+    # Act
+    stale_series = get_stale_series(catalog, last_update, "2024-07-03")
+    # Assert
+    assert stale_series == {"DGS10": "2024-07-01", "CPIAUCSL": "2024-05-01", "UNRATE": "1600-01-01"}
+
+
+def test_get_stale_series_checked():
+    """Test series requested without new observations are stale again after RECHECK_DAYS."""
+
+    # Arrange
+    catalog = {"CPIAUCSL": {"frequency": "monthly"}, "DGS10": {"frequency": "daily"}}
+    last_update = {"CPIAUCSL": "2024-03-01", "DGS10": "2024-05-01"}
+    # DGS10 was checked before the release of its next observation, the check is ignored
+    last_checked = {"CPIAUCSL": "2024-05-02", "DGS10": "2024-05-02"}
+    # Act
+    stale_series = [
+        get_stale_series(catalog, last_update, today, last_checked)
+        for today in ["2024-05-08", "2024-05-09"]
+    ]
+    # Assert
+    assert stale_series == [
+        {"DGS10": "2024-05-01"},
+        {"CPIAUCSL": "2024-03-01", "DGS10": "2024-05-01"},
+    ]
+
+
+def test_load_series_catalog():
+    """Test the series catalog frequencies are valid."""
+
+    catalog = load_series_catalog("src/fred_series_catalog.json")
+    assert "DGS10" in catalog
@@ -0,0 +1,175 @@
+# Standard library
+import os
+from datetime import datetime
+
+# Third party
+import pytest
+
+# First party
+from src.common_steps.load_sql import SQLLoader
+from src.common_steps.validate import Validator
+from src.settings import Settings
+from src.utils.step_buffer import StepBuffer, append_rows, new_output, open_rows
+from tests.unit.mock_objects.mock_clients import MockBulkCopyClient
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Stock daily prices settings, spilling to a temp directory."""
+
+    settings = Settings("stock-daily-prices-pipeline")
+    settings.STEP_BUFFER = {
+        "FORMAT": "memory",
+        "SPILL_ROWS": 10,
+        "ROW_GROUP_ROWS": 2,
+        "COMPRESSION": "zstd",
+        "DIRECTORY": str(tmp_path),
+    }
+    return settings
+
+
+@pytest.fixture
+def sample_rows() -> list[dict]:
+    """Daily prices rows, the last 3 are invalid."""
+
+    rows = [
+        {
+            "T": f"TICKER_{n % 7}_{n}",
+            "v": 100,
+            "vw": 1.5,
+            "o": 1.0,
+            "c": 2.0,
+            "h": 3.0,
+            "l": 0.5,
+            "t": "2024-01-02 21:00:00",
+            "n": 10,
+            "date": "2024-01-02",
+            "updated_at": "2024-01-03 10:00:00",
+        }
+        for n in range(20)
+    ]
+    for row in rows[-3:]:
+        row["o"] = "invalid"
+    return rows
+
+
+def test_append(settings):
+    """Test rows are kept as text, in header order, case sensitive fields."""
+
+    # Arrange
+    buffer = StepBuffer(settings, "test")
+    # Act
+    buffer.append([{"T": "AAPL", "t": "2024-01-01 20:00:00", "n": 1, "v": None}])
+    _, relation = buffer.read()
+    # Assert
+    assert buffer.header == ["T", "t", "n", "v"]
+    assert relation.fetchall() == [("AAPL", "2024-01-01 20:00:00", "1", None)]
+
+
+def test_append_as_csv(settings, tmp_path):
+    """Test buffer values are the values of the same rows read from a csv file."""
+
+    # Arrange
+    rows = [
+        {
+            "tickers": ["AAPL", "B"],
+            "is_active": True,
+            "updated_at": datetime(2024, 1, 3, 10, 0),
+            "value": 1.5,
+            "name": None,
+        }
+    ]
+    file_path = str(tmp_path / "rows.csv")
+    buffer = StepBuffer(settings, "test")
+    # Act
+    buffer.append(rows)
+    append_rows({"file_path": file_path}, rows)
+    # Connections are kept open while relations are read
+    buffer_conn, buffer_relation, _ = open_rows(buffer)
+    file_conn, file_relation, _ = open_rows(file_path)
+    buffer_values, file_values = buffer_relation.fetchall(), file_relation.fetchall()
+    # Assert
+    assert buffer_values == file_values
+    assert buffer_values == [("['AAPL', 'B']", "True", "2024-01-03 10:00:00", "1.5", None)]
+
+
+def test_spill(settings, sample_rows):
+    """Test rows above SPILL_ROWS are moved to Parquet files and removed on close."""
+
+    # Arrange
+    buffer = StepBuffer(settings, "test")
+    # Act
+    buffer.append(sample_rows)
+    buffer.append(sample_rows[:5])
+    _, relation = buffer.read()
+    # Assert
+    assert len(buffer.spilled_files) == 1
+    assert buffer.rows == len(sample_rows) + 5
+    assert len(relation.fetchall()) == buffer.rows
+    buffer.close()
+    assert os.listdir(settings.STEP_BUFFER["DIRECTORY"]) == []
+
+
+def test_spill_many_files(settings):
+    """Test many spilled files are read in a single scan."""
+
+    # Arrange
+    settings.STEP_BUFFER["SPILL_ROWS"] = 1
+    buffer = StepBuffer(settings, "test")
+    buffer.append([{"T": "AAPL"}])
+    # Act
+    buffer.spilled_files *= 1100
+    _, relation = buffer.read()
+    # Assert
+    assert relation.fetchall() == [("AAPL",)] * 1100
+
+
+def test_parquet_format(settings, sample_rows):
+    """Test rows are flushed to Parquet by row group, typed with fields_mapping."""
+
+    # Arrange
+    settings.STEP_BUFFER["FORMAT"] = "parquet"
+    buffer = StepBuffer(settings, "test", fields_mapping=settings.PIPELINE_TABLE["fields_mapping"])
+    # Act
+    buffer.append(sample_rows[:2])
+    buffer.append(sample_rows[-1:])
+    conn, relation = buffer.read()
+    # Assert
+    assert len(buffer.spilled_files) == 1
+    assert buffer.memory_rows == 1
+    assert relation.types[:2] == ["VARCHAR", "DOUBLE"]
+    rows = relation.fetchall()
+    assert rows[0][7] == datetime(2024, 1, 2, 21)
+    assert rows[-1][3] is None  # invalid value
+    compression = conn.execute(
+        f"SELECT DISTINCT compression FROM parquet_metadata('{buffer.spilled_files[0]}')"
+    ).fetchall()
+    assert compression == [("ZSTD",)]
+
+
+@pytest.mark.parametrize(
+    "staging_format, spill_rows", [("memory", 10), ("memory", 1000), ("parquet", 1000)]
+)
+def test_validate_and_load(settings, sample_rows, staging_format, spill_rows):
+    """Test buffered rows are validated and loaded without temp csv files."""
+
+    # Arrange
+    settings.STEP_BUFFER["FORMAT"] = staging_format
+    settings.STEP_BUFFER["SPILL_ROWS"] = spill_rows
+    output = new_output(
+        settings,
+        os.path.join(settings.STEP_BUFFER["DIRECTORY"], "prices.csv"),
+        settings.PIPELINE_TABLE["fields_mapping"],
+    )
+    append_rows(output, sample_rows)
+    client = MockBulkCopyClient()
+    # Act
+    _, validator_output = Validator(output, settings).run()
+    valid_rows = validator_output["valid_buffer"].rows
+    SQLLoader(validator_output, settings, client).run()
+    # Assert
+    assert valid_rows == len(sample_rows) - 3
+    assert not os.path.isfile(validator_output["valid_file_path"])
+    assert len(client.copied_rows) == len(sample_rows) - 3 + 1  # + header
+    exchange_symbols = [row[1] for row in client.copied_rows[1:]]
+    assert exchange_symbols == sorted(exchange_symbols)
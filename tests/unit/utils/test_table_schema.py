@@ -0,0 +1,19 @@
+# First party
+from src.settings import Settings
+from src.utils.table_schema import get_table_schema
+
+
+def test_get_table_schema():
+    """Test schemas are compiled once and map rows to table column order."""
+
+    # Arrange
+    table_config = Settings("index-daily-close-pipeline").PIPELINE_TABLE
+    # Act
+    schema = get_table_schema(table_config)
+    mapper = schema.get_mapper(("updated_at", "value", "date"))
+    # Assert
+    assert get_table_schema(Settings("index-daily-close-pipeline").PIPELINE_TABLE) is schema
+    assert schema.fields == ("date", "index", "value", "updated_at")
+    assert mapper(("2024-01-03", 1.0, "2024-01-02")) == ("2024-01-02", None, 1.0, "2024-01-03")
+    assert schema.get_mapper(("updated_at", "value", "date")) is mapper
+    assert schema.insert_sql("?, ") == f"INSERT INTO {schema.table_name} VALUES(?, ?, ?, ?)"
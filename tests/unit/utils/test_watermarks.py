@@ -0,0 +1,98 @@
+# Standard library
+import copy
+
+# Third party
+import pytest
+
+# First party
+from src.clients.sqlite_client import SQLiteClient
+from src.common_steps.load_sql import SQLLoader
+from src.settings import Settings
+from src.utils.csv_handler import append_to_file
+from src.utils.watermarks import Watermarks
+
+ROWS = [
+    {"date": "2024-01-02", "index": "SP500", "value": 1.0, "updated_at": "2024-01-03 10:00:00"},
+    {"date": "2024-01-03", "index": "SP500", "value": 2.0, "updated_at": "2024-01-03 10:00:00"},
+    {"date": "2024-01-02", "index": "DJIA", "value": 3.0, "updated_at": "2024-01-03 10:00:00"},
+]
+
+
+@pytest.fixture
+def settings():
+    """Index daily close settings, loading into a test table."""
+
+    settings = Settings("index-daily-close-pipeline")
+    settings.CLIENT_CONFIG["DB_PATH"] = "database/watermarks_test.db"
+    settings.PIPELINE_TABLE = copy.deepcopy(settings.PIPELINE_TABLE)
+    settings.PIPELINE_TABLE["name"] = "INDEX_DAILY_CLOSE_WATERMARKS_TEST"
+    return settings
+
+
+@pytest.fixture
+def watermarks(settings):
+    """Watermarks of an empty test table."""
+
+    watermarks = Watermarks(settings, SQLiteClient(settings))
+    watermarks.table_handler.drop_table()
+    watermarks.table_handler.create_table()
+    watermarks.reset()
+    return watermarks
+
+
+def load(settings, watermarks, file_path, rows):
+    """Load rows with SQLLoader."""
+
+    append_to_file(file_path, rows)
+    SQLLoader(
+        {"valid_file_path": file_path, "invalid_file_path": None},
+        settings,
+        watermarks.client,
+    ).run(clean_file=False)
+
+
+def test_load_updates_watermarks(settings, watermarks, tmp_path):
+    """Test SQLLoader updates watermarks with the loaded data, keeping the latest."""
+
+    # Act
+    load(settings, watermarks, str(tmp_path / "first.csv"), ROWS)
+    load(settings, watermarks, str(tmp_path / "second.csv"), [{**ROWS[2], "date": "2023-12-29"}])
+    # Assert
+    assert watermarks.get() == {"SP500": "2024-01-03", "DJIA": "2024-01-02"}
+
+
+def test_load_moves_watermarks_forward(settings, watermarks, tmp_path):
+    """Test loads of newer data move stored watermarks forward."""
+
+    # Arrange
+    load(settings, watermarks, str(tmp_path / "first.csv"), ROWS)
+    # Act
+    load(settings, watermarks, str(tmp_path / "second.csv"), [{**ROWS[1], "date": "2024-01-10"}])
+    # Assert
+    assert watermarks.read() == {"SP500": "2024-01-10", "DJIA": "2024-01-02"}
+    assert watermarks.read() == watermarks.scan()
+
+
+def test_get_seeds_watermarks(settings, watermarks, tmp_path):
+    """Test tables loaded before watermarks existed are scanned once."""
+
+    # Arrange
+    load(settings, watermarks, str(tmp_path / "first.csv"), ROWS)
+    watermarks.reset()
+    # Act
+    last_update = watermarks.get()
+    # Assert
+    assert last_update == {"SP500": "2024-01-03", "DJIA": "2024-01-02"}
+    assert watermarks.read() == last_update
+
+
+def test_transaction_rollback(watermarks):
+    """Test watermarks are rolled back with the data on errors."""
+
+    # Act
+    with pytest.raises(ValueError):
+        with watermarks.client.transaction():
+            watermarks.update({"SP500": "2024-01-03"})
+            raise ValueError()
+    # Assert
+    assert watermarks.read() == {}